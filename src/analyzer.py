@@ -6,26 +6,300 @@ Data Analyzer Module
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    from .flight_buffer import BufferSnapshot, to_epoch_ns
+    from .anomaly_rules import DEFAULT_ANOMALY_RULES, AnomalyRuleSet
+    from .anomaly_store import AnomalyStore
+except ImportError:  # src/ 에서 직접 실행하는 경우 (api_server.py)
+    from flight_buffer import BufferSnapshot, to_epoch_ns
+    from anomaly_rules import DEFAULT_ANOMALY_RULES, AnomalyRuleSet
+    from anomaly_store import AnomalyStore
 
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+NS_PER_HOUR = 3600 * 10**9
+
+# 지구 반경 (km)
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    두 지점 배열 간 대권 거리 (Haversine formula, 브로드캐스팅)
+
+    Args:
+        lat1: 시작 위도 (도)
+        lon1: 시작 경도 (도)
+        lat2: 종료 위도 (도)
+        lon2: 종료 경도 (도)
+
+    Returns:
+        거리 배열 (km)
+    """
+    lat1 = np.radians(lat1)
+    lat2 = np.radians(lat2)
+    dlat = lat2 - lat1
+    dlon = np.radians(lon2) - np.radians(lon1)
+
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def leg_distances(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """
+    항적의 연속 구간 거리
+
+    Args:
+        latitudes: 샘플 위도 배열 (도)
+        longitudes: 샘플 경도 배열 (도)
+
+    Returns:
+        길이 n - 1 의 구간 거리 배열 (km)
+    """
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    return haversine_km(latitudes[:-1], longitudes[:-1], latitudes[1:], longitudes[1:])
+
+
+def distance_matrix(latitudes_a: np.ndarray, longitudes_a: np.ndarray,
+                    latitudes_b: np.ndarray, longitudes_b: np.ndarray) -> np.ndarray:
+    """
+    두 지점 집합 간 거리 행렬
+
+    Args:
+        latitudes_a: 첫 집합 위도 (N)
+        longitudes_a: 첫 집합 경도 (N)
+        latitudes_b: 둘째 집합 위도 (M)
+        longitudes_b: 둘째 집합 경도 (M)
+
+    Returns:
+        (N, M) 거리 행렬 (km)
+    """
+    latitudes_a = np.asarray(latitudes_a, dtype=np.float64)[:, None]
+    longitudes_a = np.asarray(longitudes_a, dtype=np.float64)[:, None]
+    return haversine_km(latitudes_a, longitudes_a,
+                        np.asarray(latitudes_b, dtype=np.float64)[None, :],
+                        np.asarray(longitudes_b, dtype=np.float64)[None, :])
+
+
+class TrackDistance:
+    """
+    항적 누적 거리
+
+    구간 거리의 누적 합을 한 번(O(n)) 계산해 두므로, 임의의 두 샘플 사이 비행 거리는 O(1) 입니다.
+    """
+
+    def __init__(self, latitudes: np.ndarray, longitudes: np.ndarray):
+        """
+        Args:
+            latitudes: 샘플 위도 배열 (도, 시각 순)
+            longitudes: 샘플 경도 배열 (도, 시각 순)
+        """
+        self.size = len(latitudes)
+        self.legs = leg_distances(latitudes, longitudes)
+        self.cumulative = np.concatenate(([0.0], np.cumsum(self.legs)))
+
+    @classmethod
+    def from_records(cls, data_list: List[Dict]) -> 'TrackDistance':
+        """
+        레코드 리스트로 생성
+
+        Args:
+            data_list: latitude/longitude 를 가진 레코드 리스트 (시각 순)
+
+        Returns:
+            항적 누적 거리
+        """
+        n = len(data_list)
+        latitudes = np.fromiter((d['latitude'] for d in data_list), dtype=np.float64, count=n)
+        longitudes = np.fromiter((d['longitude'] for d in data_list), dtype=np.float64, count=n)
+        return cls(latitudes, longitudes)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def total(self) -> float:
+        """전체 비행 거리 (km)"""
+        return float(self.cumulative[-1])
+
+    def between(self, start: int, end: int) -> float:
+        """
+        두 샘플 사이 비행 거리 (O(1))
+
+        Args:
+            start: 시작 샘플 인덱스
+            end: 종료 샘플 인덱스
+
+        Returns:
+            구간 거리 합 (km, 순서와 무관)
+        """
+        return abs(float(self.cumulative[end] - self.cumulative[start]))
+
+
+class AnomalyBatch:
+    """
+    배치 이상 탐지 결과
+
+    탐지된 이상마다 행 인덱스와 이상 코드, 메시지에 쓸 값만 배열로 보관하고,
+    사람이 읽는 메시지는 to_records 로 직렬화할 때 만듭니다.
+    """
+
+    __slots__ = ('rules', 'rows', 'codes', 'values', 'timestamps', 'aircraft_ids')
+
+    def __init__(self, rules: AnomalyRuleSet, rows: np.ndarray, codes: np.ndarray, values: np.ndarray,
+                 timestamps: Dict[int, object], aircraft_ids: Dict[int, object]):
+        """
+        Args:
+            rules: 탐지에 사용한 규칙 집합
+            rows: 이상이 탐지된 행 인덱스 (행, 규칙 순으로 정렬)
+            codes: 탐지된 규칙 인덱스 (rules.codes 인덱스)
+            values: 메시지에 표시할 값
+            timestamps: 이상이 있는 행별 타임스탬프
+            aircraft_ids: 이상이 있는 행별 항공기 식별자
+        """
+        self.rules = rules
+        self.rows = rows
+        self.codes = codes
+        self.values = values
+        self.timestamps = timestamps
+        self.aircraft_ids = aircraft_ids
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def record_count(self) -> int:
+        """이상이 하나 이상 탐지된 레코드 수"""
+        return len(self.timestamps)
+
+    def counts(self) -> Dict[str, int]:
+        """이상 코드 이름별 탐지 수"""
+        totals = np.bincount(self.codes, minlength=len(self.rules))
+        return {name: int(total) for name, total in zip(self.rules.codes, totals) if total}
+
+    def to_records(self) -> List[Dict]:
+        """
+        레코드별 이상 딕셔너리로 변환 (detect_anomalies 가 누적하는 것과 같은 형태)
+
+        Returns:
+            timestamp/aircraft_id/anomalies(메시지 리스트) 딕셔너리 리스트 (행 순서)
+        """
+        rules = self.rules.rules
+        records = []
+        current = None
+        for row, code, value in zip(self.rows.tolist(), self.codes.tolist(), self.values.tolist()):
+            if current is None or current[0] != row:
+                current = (row, [])
+                records.append({
+                    'timestamp': self.timestamps[row],
+                    'aircraft_id': self.aircraft_ids[row],
+                    'anomalies': current[1]
+                })
+            current[1].append(rules[code].render(value))
+        return records
+
+
+class _PatternAccumulator:
+    """비행 패턴 분석용 누적 합계 (샘플당 O(1), 합계는 빼기로 되돌릴 수 있음)"""
+
+    __slots__ = ('count', 'altitude_sum', 'speed_sum', 'fuel_sum', 'temp_sum', 'first', 'last')
+
+    def __init__(self):
+        self.count = 0
+        self.altitude_sum = 0
+        self.speed_sum = 0
+        self.fuel_sum = 0
+        self.temp_sum = 0
+        self.first: Optional[Tuple] = None
+        self.last: Optional[Tuple] = None
+
+    def add(self, data: Dict):
+        """샘플 하나 누적 (타임스탬프는 연료 소비율을 계산할 때만 변환)"""
+        self.count += 1
+        self.altitude_sum += data['altitude']
+        self.speed_sum += data['speed']
+        self.fuel_sum += data['fuel_level']
+        self.temp_sum += data.get('engine_temp', 0.0)
+        self.last = (data['timestamp'], data['fuel_level'])
+        if self.first is None:
+            self.first = self.last
+
+    def add_columns(self, columns: Dict[str, np.ndarray]):
+        """컬럼 배치 누적"""
+        count = len(columns['timestamp'])
+        if not count:
+            return
+        self._add_sums(columns, count, 1)
+        self.last = (int(columns['timestamp'][-1]), float(columns['fuel_level'][-1]))
+        if self.first is None:
+            self.first = (int(columns['timestamp'][0]), float(columns['fuel_level'][0]))
+
+    def remove_columns(self, columns: Dict[str, np.ndarray]):
+        """누적했던 컬럼 배치 제외 (처음/마지막 샘플은 호출자가 갱신)"""
+        count = len(columns['timestamp'])
+        if count:
+            self._add_sums(columns, count, -1)
+
+    def _add_sums(self, columns: Dict[str, np.ndarray], count: int, sign: int):
+        """컬럼 합계를 부호에 맞춰 반영"""
+        self.count += sign * count
+        self.altitude_sum += sign * float(np.sum(columns['altitude']))
+        self.speed_sum += sign * float(np.sum(columns['speed']))
+        self.fuel_sum += sign * float(np.sum(columns['fuel_level']))
+        if 'engine_temp' in columns:
+            self.temp_sum += sign * float(np.sum(columns['engine_temp']))
+
+
 class FlightAnalyzer:
     """비행 데이터 분석 클래스"""
     
-    # 임계값 설정
-    CRITICAL_FUEL_LEVEL = 20.0  # %
-    HIGH_ENGINE_TEMP = 700.0    # °C
-    MAX_SAFE_ALTITUDE = 12000.0 # m
+    # 임계값 설정 (DEFAULT_ANOMALY_RULES 에서 읽은 값, 탐지는 self.rules 를 따름)
+    CRITICAL_FUEL_LEVEL = DEFAULT_ANOMALY_RULES.threshold('LOW_FUEL', 'fuel_level')        # %
+    HIGH_ENGINE_TEMP = DEFAULT_ANOMALY_RULES.threshold('HIGH_ENGINE_TEMP', 'engine_temp')  # °C
+    MAX_SAFE_ALTITUDE = DEFAULT_ANOMALY_RULES.threshold('ALTITUDE_LIMIT', 'altitude')      # m
     
-    def __init__(self):
-        self.anomalies: List[Dict] = []
+    def __init__(self, rules: Optional[AnomalyRuleSet] = None, store: Optional[AnomalyStore] = None):
+        """
+        Args:
+            rules: 이상 탐지 규칙 집합 (None이면 DEFAULT_ANOMALY_RULES)
+            store: 탐지 결과 저장소 (None이면 기본 용량의 AnomalyStore)
+        """
+        self.rules = rules or DEFAULT_ANOMALY_RULES
+        self.store = store if store is not None else AnomalyStore()
         logger.info("FlightAnalyzer initialized")
     
+    @property
+    def anomalies(self) -> List[Dict]:
+        """보관 중인 모든 이상 (get_all_anomalies 와 같음)"""
+        return self.get_all_anomalies()
+    
+    @property
+    def anomaly_count(self) -> int:
+        """이상이 탐지된 레코드 수 (중복 제외)"""
+        return self.store.record_count
+    
+    def count_anomalies(self, aircraft_ids: Iterable[Optional[str]]) -> int:
+        """
+        주어진 항공기들의 이상이 탐지된 레코드 수 (중복 제외, 항공기당 O(1))
+        
+        Args:
+            aircraft_ids: 항공기 식별자들 (None은 식별자 없이 탐지된 이상)
+            
+        Returns:
+            레코드 수
+        """
+        return sum(self.store.aircraft_record_count(aircraft_id) for aircraft_id in set(aircraft_ids))
+    
     def detect_anomalies(self, data: Dict) -> List[str]:
         """
         이상 패턴 탐지
@@ -37,41 +311,69 @@ class FlightAnalyzer:
             탐지된 이상 패턴 리스트
         """
         anomalies = []
-        
-        # 연료 부족 확인
-        if data.get('fuel_level', 100) < self.CRITICAL_FUEL_LEVEL:
-            anomaly = f"CRITICAL: Low fuel level ({data['fuel_level']:.2f}%)"
+        timestamp = data.get('timestamp')
+        for index in self.rules.evaluate(data):
+            value = self.rules.value_of(index, data)
+            anomaly = self.rules.rules[index].render(value)
             anomalies.append(anomaly)
             logger.warning(anomaly)
+            if timestamp is not None:
+                self.store.add(data.get('aircraft_id'), timestamp, self.rules.rules[index], value)
         
-        # 엔진 과열 확인
-        if data.get('engine_temp', 0) > self.HIGH_ENGINE_TEMP:
-            anomaly = f"WARNING: High engine temperature ({data['engine_temp']:.2f}°C)"
-            anomalies.append(anomaly)
-            logger.warning(anomaly)
+        return anomalies
+    
+    def detect_anomalies_batch(
+        self,
+        data: Union[List[Dict], Dict[str, np.ndarray]],
+        aircraft_id: Optional[Union[str, Sequence[str]]] = None
+    ) -> AnomalyBatch:
+        """
+        배치 이상 패턴 탐지 (규칙 집합의 컬럼 단위 평가기로 모든 규칙을 한 번에 평가)
         
-        # 고도 초과 확인
-        if data.get('altitude', 0) > self.MAX_SAFE_ALTITUDE:
-            anomaly = f"WARNING: Altitude exceeds safe limit ({data['altitude']:.2f}m)"
-            anomalies.append(anomaly)
-            logger.warning(anomaly)
+        레코드마다 detect_anomalies 를 호출한 것과 같은 이상을 탐지하지만, 메시지 문자열과
+        레코드별 경고 로그 대신 요약 로그 한 번과 (행, 코드) 배열을 남깁니다.
+        타임스탬프가 있는 행의 이상은 저장소에 추가되며, 메시지는 조회할 때 만듭니다.
         
-        # 속도 이상 확인
-        altitude = data.get('altitude', 0)
-        speed = data.get('speed', 0)
-        if altitude > 8000 and speed < 300:
-            anomaly = "WARNING: Unusually low speed at high altitude"
-            anomalies.append(anomaly)
-            logger.warning(anomaly)
+        Args:
+            data: 레코드 리스트 또는 필드별 배열 (없는 필드는 정상 값으로 간주)
+            aircraft_id: 컬럼 입력의 항공기 식별자 또는 행별 식별자 (레코드 입력은 레코드의 값 사용)
+            
+        Returns:
+            탐지 결과
+        """
+        records = data if isinstance(data, list) else None
+        if records is not None:
+            n = len(records)
+            values = self.rules.gather(records)
+        else:
+            n = len(data['timestamp']) if 'timestamp' in data else len(next(iter(data.values())))
+            values = self.rules.stack_columns(data, n)
         
-        if anomalies:
-            self.anomalies.append({
-                'timestamp': data.get('timestamp'),
-                'aircraft_id': data.get('aircraft_id'),
-                'anomalies': anomalies
-            })
+        rows, rules, shown = self.rules.evaluate_values(values)
+        codes = rules.astype(np.int16 if len(self.rules) > 127 else np.int8)
         
-        return anomalies
+        hit_rows = np.unique(rows).tolist()
+        if records is not None:
+            timestamps = {row: records[row].get('timestamp') for row in hit_rows}
+            aircraft_ids = {row: records[row].get('aircraft_id') for row in hit_rows}
+        else:
+            source = data.get('timestamp')
+            if source is None:
+                timestamps = dict.fromkeys(hit_rows)
+            elif isinstance(source, np.ndarray):
+                timestamps = dict(zip(hit_rows, source[hit_rows].tolist()))
+            else:
+                timestamps = {row: source[row] for row in hit_rows}
+            if aircraft_id is None or isinstance(aircraft_id, str):
+                aircraft_ids = dict.fromkeys(hit_rows, aircraft_id)
+            else:
+                aircraft_ids = {row: aircraft_id[row] for row in hit_rows}
+        
+        batch = AnomalyBatch(self.rules, rows, codes, shown, timestamps, aircraft_ids)
+        if len(batch):
+            self.store.add_batch(batch)
+            logger.warning(f"Detected {len(batch)} anomalies in {batch.record_count}/{n} records: {batch.counts()}")
+        return batch
     
     def analyze_flight_pattern(self, data_list: List[Dict]) -> Dict:
         """
@@ -86,29 +388,48 @@ class FlightAnalyzer:
         if not data_list:
             return {}
         
-        # 평균값 계산
-        avg_altitude = sum(d['altitude'] for d in data_list) / len(data_list)
-        avg_speed = sum(d['speed'] for d in data_list) / len(data_list)
-        avg_fuel = sum(d['fuel_level'] for d in data_list) / len(data_list)
+        # 평균, 처음/마지막 샘플을 한 번에 누적
+        accumulator = _PatternAccumulator()
+        for data in data_list:
+            accumulator.add(data)
+        
+        # 이상 수는 분석하는 데이터의 항공기 것만 집계
+        aircraft_ids = {data.get('aircraft_id') for data in data_list}
+        analysis = self._pattern_analysis(accumulator, aircraft_ids)
+        logger.info(f"Flight pattern analysis: {analysis}")
+        return analysis
+    
+    def _pattern_analysis(self, accumulator: '_PatternAccumulator', aircraft_ids: Iterable[Optional[str]]) -> Dict:
+        """
+        누적 합계로 비행 패턴 분석 결과 생성 (O(1))
+        
+        Args:
+            accumulator: 샘플이 하나 이상 누적된 합계
+            aircraft_ids: 이상 수를 집계할 항공기 식별자들
+            
+        Returns:
+            분석 결과 딕셔너리
+        """
+        count = accumulator.count
+        avg_altitude = accumulator.altitude_sum / count
+        avg_speed = accumulator.speed_sum / count
+        avg_fuel = accumulator.fuel_sum / count
         
         # 비행 상태 판단
         flight_phase = self._determine_flight_phase(avg_altitude, avg_speed)
         
         # 연료 소비율 계산
-        fuel_consumption_rate = self._calculate_fuel_consumption(data_list)
+        fuel_consumption_rate = self._fuel_consumption_rate(accumulator.first, accumulator.last, count)
         
-        analysis = {
-            'total_samples': len(data_list),
+        return {
+            'total_samples': count,
             'avg_altitude': round(avg_altitude, 2),
             'avg_speed': round(avg_speed, 2),
             'avg_fuel_level': round(avg_fuel, 2),
             'flight_phase': flight_phase,
             'fuel_consumption_rate': round(fuel_consumption_rate, 2),
-            'anomaly_count': len(self.anomalies)
+            'anomaly_count': self.count_anomalies(aircraft_ids)
         }
-        
-        logger.info(f"Flight pattern analysis: {analysis}")
-        return analysis
     
     def _determine_flight_phase(self, altitude: float, speed: float) -> str:
         """
@@ -147,16 +468,34 @@ class FlightAnalyzer:
         if len(data_list) < 2:
             return 0.0
         
-        # 시간 경과 계산
-        first = datetime.fromisoformat(data_list[0]['timestamp'].replace('Z', '+00:00'))
-        last = datetime.fromisoformat(data_list[-1]['timestamp'].replace('Z', '+00:00'))
-        time_diff = (last - first).total_seconds() / 3600.0  # hours
+        first = (data_list[0]['timestamp'], data_list[0]['fuel_level'])
+        last = (data_list[-1]['timestamp'], data_list[-1]['fuel_level'])
+        return self._fuel_consumption_rate(first, last, len(data_list))
+    
+    @staticmethod
+    def _fuel_consumption_rate(first: Tuple, last: Tuple, count: int) -> float:
+        """
+        처음과 마지막 샘플의 (타임스탬프, 연료량)으로 연료 소비율 계산
+        
+        Args:
+            first: 처음 샘플의 (타임스탬프, 연료량)
+            last: 마지막 샘플의 (타임스탬프, 연료량)
+            count: 샘플 수
+            
+        Returns:
+            연료 소비율 (%/hour)
+        """
+        if count < 2:
+            return 0.0
+        
+        # 시간 경과 계산 (정수 epoch ns)
+        time_diff = (to_epoch_ns(last[0]) - to_epoch_ns(first[0])) / NS_PER_HOUR  # hours
         
         if time_diff == 0:
             return 0.0
         
         # 연료 소비량
-        fuel_diff = data_list[0]['fuel_level'] - data_list[-1]['fuel_level']
+        fuel_diff = first[1] - last[1]
         
         # 시간당 소비율
         consumption_rate = fuel_diff / time_diff if time_diff > 0 else 0.0
@@ -174,8 +513,6 @@ class FlightAnalyzer:
         Returns:
             거리 (km)
         """
-        import math
-        
         lat1 = math.radians(start['latitude'])
         lon1 = math.radians(start['longitude'])
         lat2 = math.radians(end['latitude'])
@@ -188,17 +525,43 @@ class FlightAnalyzer:
         a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
         c = 2 * math.asin(math.sqrt(a))
         
-        # 지구 반경 (km)
-        r = 6371
+        return c * EARTH_RADIUS_KM
+    
+    def calculate_track_distance(self, data_list: List[Dict]) -> TrackDistance:
+        """
+        항적 전체의 구간 거리와 누적 거리 계산 (벡터 연산)
         
-        return c * r
+        Args:
+            data_list: 시각 순 데이터 리스트
+            
+        Returns:
+            구간 거리, 전체 거리, 임의 구간 O(1) 거리 조회를 제공하는 TrackDistance
+        """
+        return TrackDistance.from_records(data_list)
     
     def generate_risk_assessment(self, data_list: List[Dict]) -> Dict:
         """
         위험도 평가
         
         Args:
-            data_list: 분석할 데이터 리스트
+            data_list: 분석할 데이터 리스트 (이상 수는 리스트에 있는 항공기 것만 집계)
+            
+        Returns:
+            위험도 평가 결과
+        """
+        anomaly_count = self.count_anomalies(data.get('aircraft_id') for data in data_list)
+        avg_fuel = sum(d['fuel_level'] for d in data_list) / len(data_list) if data_list else 100
+        avg_temp = sum(d['engine_temp'] for d in data_list) / len(data_list) if data_list else 0
+        return self._risk_assessment(anomaly_count, avg_fuel, avg_temp)
+    
+    def _risk_assessment(self, anomaly_count: int, avg_fuel: float, avg_temp: float) -> Dict:
+        """
+        이상 수와 평균값으로 위험도 평가 결과 생성 (O(1))
+        
+        Args:
+            anomaly_count: 이상이 탐지된 레코드 수
+            avg_fuel: 평균 연료량
+            avg_temp: 평균 엔진 온도
             
         Returns:
             위험도 평가 결과
@@ -207,18 +570,16 @@ class FlightAnalyzer:
         risk_factors = []
         
         # 이상치 개수에 따른 위험도
-        if len(self.anomalies) > 0:
-            risk_score += len(self.anomalies) * 10
-            risk_factors.append(f"{len(self.anomalies)} anomalies detected")
+        if anomaly_count > 0:
+            risk_score += anomaly_count * 10
+            risk_factors.append(f"{anomaly_count} anomalies detected")
         
         # 평균 연료량에 따른 위험도
-        avg_fuel = sum(d['fuel_level'] for d in data_list) / len(data_list) if data_list else 100
         if avg_fuel < 30:
             risk_score += 30
             risk_factors.append("Low average fuel level")
         
         # 평균 엔진 온도에 따른 위험도
-        avg_temp = sum(d['engine_temp'] for d in data_list) / len(data_list) if data_list else 0
         if avg_temp > 650:
             risk_score += 20
             risk_factors.append("High average engine temperature")
@@ -241,8 +602,29 @@ class FlightAnalyzer:
         return assessment
     
     def get_all_anomalies(self) -> List[Dict]:
-        """모든 탐지된 이상 패턴 반환"""
-        return self.anomalies.copy()
+        """모든 탐지된 이상 패턴 반환 (시각 순, 메시지는 이때 생성)"""
+        return self.store.query()
+    
+    def get_anomalies(
+        self,
+        aircraft_id: Optional[str] = None,
+        start: Optional[Union[int, str]] = None,
+        end: Optional[Union[int, str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        항공기, 시각 범위로 이상 조회 (색인 이진 탐색)
+        
+        Args:
+            aircraft_id: 항공기 식별자 (None이면 전체)
+            start: 시작 시각, 포함 (epoch ns 또는 ISO 문자열)
+            end: 종료 시각, 포함
+            limit: 최근 limit 개 레코드만 반환
+            
+        Returns:
+            timestamp/aircraft_id/anomalies 딕셔너리 리스트
+        """
+        return self.store.query(aircraft_id, start, end, limit)
     
     def predict_remaining_flight_time(self, data_list: List[Dict]) -> Dict:
         """
@@ -288,6 +670,195 @@ class FlightAnalyzer:
         return prediction
 
 
+class IncrementalFlightAnalyzer:
+    """
+    증분 비행 패턴 분석기
+
+    항공기별 누적 합계와 처음/마지막 샘플만 유지하므로 analysis 는 쌓인 이력 크기와 무관하게
+    analyze_flight_pattern 과 같은 딕셔너리를 O(1)로 반환합니다.
+    샘플을 직접 반영(update, update_columns)하면 반영한 모든 샘플을, 버퍼 스냅샷과 동기화(sync)하면
+    버퍼에 남아 있는 샘플만 분석합니다. 한 항공기에는 두 방식 중 하나만 사용하며, 요청 스레드가
+    공유할 수 있도록 갱신과 조회는 잠금으로 직렬화합니다.
+    """
+
+    def __init__(self, analyzer: Optional[FlightAnalyzer] = None):
+        """
+        Args:
+            analyzer: 비행 단계 판단과 이상 수에 사용할 분석기 (None이면 새로 생성)
+        """
+        self.analyzer = analyzer if analyzer is not None else FlightAnalyzer()
+        self._accumulators: Dict[str, _PatternAccumulator] = {}
+        # sync 로 마지막에 동기화한 항공기별 버퍼 스냅샷
+        self._snapshots: Dict[str, BufferSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def _accumulator(self, aircraft_id: str) -> _PatternAccumulator:
+        """항공기 누적 합계 반환 (없으면 생성, _lock 을 잡은 상태에서 호출)"""
+        accumulator = self._accumulators.get(aircraft_id)
+        if accumulator is None:
+            accumulator = self._accumulators[aircraft_id] = _PatternAccumulator()
+        return accumulator
+
+    def update(self, data: Dict):
+        """
+        샘플 하나 반영 (O(1))
+
+        Args:
+            data: 'aircraft_id'와 altitude/speed/fuel_level/timestamp 를 가진 레코드 (시각 순서로 반영)
+        """
+        with self._lock:
+            self._accumulator(data.get('aircraft_id')).add(data)
+
+    def update_many(self, data_list: Iterable[Dict]):
+        """
+        여러 샘플 반영
+
+        Args:
+            data_list: 레코드들
+        """
+        for data in data_list:
+            self.update(data)
+
+    def update_columns(self, aircraft_id: str, columns: Dict[str, np.ndarray]):
+        """
+        한 항공기의 컬럼 배치 반영 (FleetCollector.collect 결과 등)
+
+        Args:
+            aircraft_id: 항공기 식별자
+            columns: 'timestamp'(int64 epoch ns)와 altitude/speed/fuel_level 배열
+        """
+        with self._lock:
+            self._accumulator(aircraft_id).add_columns(columns)
+
+    def sync(
+        self,
+        aircraft_id: str,
+        snapshot: BufferSnapshot,
+        row_filter: Optional[Callable[[Dict[str, np.ndarray]], np.ndarray]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        항공기 분석 범위를 버퍼 스냅샷에 맞춤 (마지막 동기화 이후 바뀐 샘플 수에 비례)
+
+        마지막 동기화 이후 추가된 샘플은 더하고, 버퍼에서 밀려난 샘플은 이전 스냅샷에서 읽어 합계에서 뺍니다.
+        버퍼 청크는 다시 쓰지 않으므로 이전 스냅샷은 그대로 읽을 수 있습니다. 분석 범위가 모두 바뀐 경우에는
+        새 스냅샷으로 다시 계산해 빼기로 쌓이는 반올림 오차를 없앱니다.
+
+        Args:
+            aircraft_id: 항공기 식별자
+            snapshot: 항공기 버퍼의 스냅샷 (이미 동기화한 것보다 오래된 스냅샷은 무시)
+            row_filter: 분석에 포함할 샘플 마스크를 반환하는 함수 (같은 샘플에는 항상 같은 결과, None이면 전체)
+
+        Returns:
+            마지막 동기화 이후 버퍼에 추가된 샘플의 컬럼 (row_filter 적용 전)
+        """
+        with self._lock:
+            previous = self._snapshots.get(aircraft_id)
+            if previous is not None and (
+                snapshot.total_appended < previous.total_appended
+                or snapshot.oldest_sequence < previous.oldest_sequence
+            ):
+                return snapshot.to_columns(since=snapshot.total_appended)
+
+            since = 0 if previous is None else previous.total_appended
+            added = snapshot.to_columns(since=since)
+            evicted_start = since if previous is None else previous.oldest_sequence
+            evicted_stop = min(snapshot.oldest_sequence, since)
+            accumulator = self._accumulators.get(aircraft_id)
+
+            if accumulator is None or previous is None or evicted_stop - evicted_start >= len(snapshot):
+                accumulator = self._accumulators[aircraft_id] = _PatternAccumulator()
+                accumulator.add_columns(self._filter_rows(snapshot.to_columns(), row_filter))
+            else:
+                if evicted_stop > evicted_start:
+                    evicted = previous.to_columns(since=evicted_start, until=evicted_stop)
+                    accumulator.remove_columns(self._filter_rows(evicted, row_filter))
+                accumulator.add_columns(self._filter_rows(added, row_filter))
+                if not accumulator.count:
+                    accumulator.first = accumulator.last = None
+                elif evicted_stop > evicted_start:
+                    accumulator.first = self._first_sample(snapshot, row_filter)
+
+            self._snapshots[aircraft_id] = snapshot
+            return added
+
+    @staticmethod
+    def _filter_rows(columns: Dict[str, np.ndarray], row_filter) -> Dict[str, np.ndarray]:
+        """row_filter 를 통과한 샘플만 남긴 컬럼"""
+        if row_filter is None or not len(columns['timestamp']):
+            return columns
+        mask = row_filter(columns)
+        if mask.all():
+            return columns
+        return {name: values[mask] for name, values in columns.items()}
+
+    @classmethod
+    def _first_sample(cls, snapshot: BufferSnapshot, row_filter) -> Optional[Tuple]:
+        """스냅샷에서 row_filter 를 통과하는 가장 오래된 샘플의 (타임스탬프, 연료량)"""
+        start = snapshot.oldest_sequence
+        step = 1 if row_filter is None else 64
+        while start < snapshot.total_appended:
+            columns = cls._filter_rows(snapshot.to_columns(since=start, until=start + step), row_filter)
+            if len(columns['timestamp']):
+                return (int(columns['timestamp'][0]), float(columns['fuel_level'][0]))
+            start += step
+            step *= 2
+        return None
+
+    def analysis(self, aircraft_id: str) -> Dict:
+        """
+        항공기의 비행 패턴 분석 결과 (O(1))
+
+        Args:
+            aircraft_id: 항공기 식별자
+
+        Returns:
+            analyze_flight_pattern 과 같은 분석 딕셔너리 (샘플이 없으면 빈 딕셔너리)
+        """
+        with self._lock:
+            accumulator = self._accumulators.get(aircraft_id)
+            if accumulator is None or not accumulator.count:
+                return {}
+            return self.analyzer._pattern_analysis(accumulator, (aircraft_id,))
+
+    def risk_assessment(self, aircraft_id: str) -> Dict:
+        """
+        항공기의 위험도 평가 결과 (O(1))
+
+        Args:
+            aircraft_id: 항공기 식별자
+
+        Returns:
+            분석 중인 샘플로 generate_risk_assessment 를 호출한 것과 같은 평가 결과
+        """
+        with self._lock:
+            accumulator = self._accumulators.get(aircraft_id)
+            count = 0 if accumulator is None else accumulator.count
+            avg_fuel = accumulator.fuel_sum / count if count else 100
+            avg_temp = accumulator.temp_sum / count if count else 0
+        anomaly_count = self.analyzer.count_anomalies((aircraft_id,))
+        return self.analyzer._risk_assessment(anomaly_count, avg_fuel, avg_temp)
+
+    def reset(self, aircraft_id: Optional[str] = None):
+        """
+        누적 합계 초기화
+
+        Args:
+            aircraft_id: 초기화할 항공기 (None이면 전체)
+        """
+        with self._lock:
+            if aircraft_id is None:
+                self._accumulators.clear()
+                self._snapshots.clear()
+            else:
+                self._accumulators.pop(aircraft_id, None)
+                self._snapshots.pop(aircraft_id, None)
+
+    def get_aircraft_ids(self) -> List[str]:
+        """누적 중인 항공기 식별자 목록"""
+        with self._lock:
+            return list(self._accumulators)
+
+
 def main():
     """메인 함수"""
     # 테스트 데이터
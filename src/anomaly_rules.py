@@ -0,0 +1,341 @@
+"""
+이상 탐지 규칙 모듈
+Anomaly Rules Module
+
+이상 탐지 규칙을 (필드, 연산자, 임계값) 조건과 심각도로 선언하고, 한 번 컴파일해
+레코드 단위 평가기와 컬럼 단위(벡터) 평가기로 사용합니다.
+"""
+
+import logging
+import operator
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# 비교 연산자
+OPERATORS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+}
+
+# 심각도
+SEVERITY_CRITICAL = 'CRITICAL'
+SEVERITY_WARNING = 'WARNING'
+SEVERITIES = (SEVERITY_CRITICAL, SEVERITY_WARNING)
+
+# 벡터 평가 시 한 번에 처리하는 행 수 (규칙 수 × 행 수 마스크 메모리 제한)
+_BLOCK_ROWS = 65536
+
+
+class Condition:
+    """규칙 조건 하나 (필드 연산자 임계값)"""
+
+    def __init__(self, field: str, op: str, threshold: float):
+        """
+        Args:
+            field: 필드명
+            op: 비교 연산자 ('<', '<=', '>', '>=', '==')
+            threshold: 임계값
+        """
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator: {op}")
+
+        self.field = field
+        self.op = op
+        self.threshold = float(threshold)
+
+    def key(self) -> Tuple[str, str, float]:
+        """같은 조건을 한 번만 평가하기 위한 키"""
+        return self.field, self.op, self.threshold
+
+    def __repr__(self) -> str:
+        return f"Condition({self.field!r}, {self.op!r}, {self.threshold!r})"
+
+
+class AnomalyRule:
+    """이상 탐지 규칙 선언 (모든 조건을 만족하면 탐지)"""
+
+    def __init__(
+        self,
+        code: str,
+        conditions: Sequence[Union[Condition, Tuple[str, str, float]]],
+        severity: str = SEVERITY_WARNING,
+        message: Optional[str] = None,
+        value_field: Optional[str] = None
+    ):
+        """
+        Args:
+            code: 이상 코드 (규칙 집합 안에서 고유)
+            conditions: AND 로 결합할 조건 또는 (필드, 연산자, 임계값) 튜플
+            severity: 심각도 ('CRITICAL', 'WARNING')
+            message: 메시지 템플릿 ('{value}'는 value_field 값, None이면 코드)
+            value_field: 메시지에 표시할 필드 (None이면 첫 조건의 필드)
+        """
+        if not conditions:
+            raise ValueError(f"Rule needs at least one condition: {code}")
+        if severity not in SEVERITIES:
+            raise ValueError(f"Unknown severity: {severity}")
+
+        self.code = code
+        self.conditions: Tuple[Condition, ...] = tuple(
+            c if isinstance(c, Condition) else Condition(*c) for c in conditions
+        )
+        self.severity = severity
+        self.message = code if message is None else message
+        self.value_field = value_field or self.conditions[0].field
+
+    def render(self, value: float) -> str:
+        """
+        사람이 읽는 메시지 생성
+
+        Args:
+            value: value_field 값
+
+        Returns:
+            '심각도: 메시지' 문자열
+        """
+        return f"{self.severity}: {self.message.format(value=value)}"
+
+    def __repr__(self) -> str:
+        return f"AnomalyRule({self.code!r}, {list(self.conditions)!r}, severity={self.severity!r})"
+
+
+class AnomalyRuleSet:
+    """
+    컴파일된 이상 탐지 규칙 집합
+
+    evaluate(data) 는 선언으로부터 만든 레코드 단위 평가 함수로, 탐지된 규칙 인덱스 리스트(선언 순서)를 반환합니다.
+    같은 조건은 규칙 수와 무관하게 한 번만 평가하고, 컬럼 단위 평가는 연산자별 2차원 배열 비교와
+    조건 개수만큼의 AND 로 모든 규칙을 계산하므로 규칙을 추가해도 Python 호출 수가 늘지 않습니다.
+    """
+
+    def __init__(self, rules: Iterable[AnomalyRule], defaults: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            rules: 평가 순서의 규칙
+            defaults: 필드가 없는 레코드에 사용할 값 (없는 필드는 NaN 으로 보아 조건이 거짓)
+        """
+        self.rules: Tuple[AnomalyRule, ...] = tuple(rules)
+        codes = [rule.code for rule in self.rules]
+        if len(set(codes)) != len(codes):
+            raise ValueError("Duplicate rule code in anomaly rule set")
+
+        self.codes = tuple(codes)
+        self.defaults = dict(defaults or {})
+
+        # 컴파일: 필드와 고유 조건 표
+        fields: Dict[str, int] = {}
+        conditions: Dict[Tuple[str, str, float], int] = {}
+        for rule in self.rules:
+            for condition in rule.conditions:
+                fields.setdefault(condition.field, len(fields))
+                conditions.setdefault(condition.key(), len(conditions))
+            fields.setdefault(rule.value_field, len(fields))
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self._conditions = tuple(conditions)
+        self._field_defaults = np.array(
+            [self.defaults.get(field, np.nan) for field in self.fields], dtype=np.float64
+        )
+        self._value_rows = np.array([fields[rule.value_field] for rule in self.rules], dtype=np.intp)
+
+        # 연산자별 (필드 행, 임계값, 조건 행)
+        self._operator_groups = []
+        for op in OPERATORS:
+            rows = [i for i, (_, condition_op, _) in enumerate(self._conditions) if condition_op == op]
+            if rows:
+                self._operator_groups.append((
+                    OPERATORS[op],
+                    np.array([fields[self._conditions[i][0]] for i in rows], dtype=np.intp),
+                    np.array([self._conditions[i][2] for i in rows], dtype=np.float64)[:, None],
+                    np.array(rows, dtype=np.intp),
+                ))
+
+        # 규칙별 조건 행 (조건 수가 적은 규칙은 항상 참인 마지막 행으로 채움)
+        width = max((len(rule.conditions) for rule in self.rules), default=1)
+        always = len(self._conditions)
+        self._rule_conditions = np.full((len(self.rules), width), always, dtype=np.intp)
+        for i, rule in enumerate(self.rules):
+            for j, condition in enumerate(rule.conditions):
+                self._rule_conditions[i, j] = conditions[condition.key()]
+
+        self.evaluate = self._compile_evaluate()
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def _compile_evaluate(self) -> Callable[[Dict], List[int]]:
+        """
+        레코드 단위 평가 함수 생성
+
+        필드 기본값, 고유 조건의 (필드 위치, 연산자 함수, 임계값), 규칙별 조건 위치를 한 번 표로 만들어
+        클로저에 묶으므로, 필드는 한 번씩만 읽고 고유 조건은 한 번씩만 비교합니다.
+        """
+        field_defaults = tuple(zip(self.fields, self._field_defaults.tolist()))
+        field_rows = {field: i for i, field in enumerate(self.fields)}
+        conditions = tuple(
+            (field_rows[field], OPERATORS[op], threshold) for field, op, threshold in self._conditions
+        )
+        rule_conditions = tuple(
+            (i, tuple(self._rule_conditions[i, :len(rule.conditions)].tolist()))
+            for i, rule in enumerate(self.rules)
+        )
+
+        def evaluate(data: Dict) -> List[int]:
+            get = data.get
+            values = []
+            for field, default in field_defaults:
+                values.append(get(field, default))
+            passed = []
+            for row, compare, threshold in conditions:
+                passed.append(compare(values[row], threshold))
+            hits = []
+            for i, rows in rule_conditions:
+                for row in rows:
+                    if not passed[row]:
+                        break
+                else:
+                    hits.append(i)
+            return hits
+
+        return evaluate
+
+    def gather(self, data_list: List[Dict]) -> np.ndarray:
+        """
+        레코드 리스트를 필드 × 행 값 배열로 모음
+
+        Args:
+            data_list: 레코드 리스트
+
+        Returns:
+            fields 순서의 (필드 수, 레코드 수) float64 배열 (없는 값은 기본값 또는 NaN)
+        """
+        n = len(data_list)
+        values = np.empty((len(self.fields), n), dtype=np.float64)
+        for i, field in enumerate(self.fields):
+            default = self._field_defaults[i]
+            values[i] = np.fromiter((d.get(field, default) for d in data_list), dtype=np.float64, count=n)
+        return values
+
+    def stack_columns(self, columns: Dict[str, np.ndarray], n: int) -> np.ndarray:
+        """
+        컬럼 딕셔너리를 필드 × 행 값 배열로 변환
+
+        Args:
+            columns: 필드별 배열 (없는 필드는 기본값 또는 NaN)
+            n: 행 수
+
+        Returns:
+            fields 순서의 (필드 수, 행 수) float64 배열
+        """
+        values = np.empty((len(self.fields), n), dtype=np.float64)
+        for i, field in enumerate(self.fields):
+            if field in columns:
+                values[i] = columns[field]
+            else:
+                values[i] = self._field_defaults[i]
+        return values
+
+    def evaluate_values(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        컬럼 단위 규칙 평가
+
+        Args:
+            values: gather/stack_columns 결과 (필드 수, 행 수)
+
+        Returns:
+            (탐지된 행 인덱스, 규칙 인덱스, 메시지 표시 값), 행 → 규칙 선언 순서로 정렬
+        """
+        n = values.shape[1]
+        always = len(self._conditions)
+        found_rows = []
+        found_rules = []
+        for start in range(0, n, _BLOCK_ROWS):
+            block = values[:, start:start + _BLOCK_ROWS]
+            passed = np.ones((always + 1, block.shape[1]), dtype=bool)
+            for compare, field_rows, thresholds, condition_rows in self._operator_groups:
+                passed[condition_rows] = compare(block[field_rows], thresholds)
+
+            masks = passed[self._rule_conditions[:, 0]]
+            for j in range(1, self._rule_conditions.shape[1]):
+                masks &= passed[self._rule_conditions[:, j]]
+
+            rows, rules = np.nonzero(masks.T)
+            found_rows.append(rows + start)
+            found_rules.append(rules)
+
+        rows = np.concatenate(found_rows) if found_rows else np.empty(0, dtype=np.intp)
+        rules = np.concatenate(found_rules) if found_rules else np.empty(0, dtype=np.intp)
+        shown = values[self._value_rows[rules], rows]
+        return rows, rules, shown
+
+    def threshold(self, code: str, field: str) -> float:
+        """
+        규칙 조건의 임계값 조회
+
+        Args:
+            code: 이상 코드
+            field: 조건 필드명
+
+        Returns:
+            해당 규칙에서 field 에 대한 첫 조건의 임계값
+
+        Raises:
+            KeyError: 코드나 필드 조건이 없는 경우
+        """
+        if code not in self.codes:
+            raise KeyError(code)
+        for condition in self.rules[self.codes.index(code)].conditions:
+            if condition.field == field:
+                return condition.threshold
+        raise KeyError(f"{code}.{field}")
+
+    def value_of(self, rule_index: int, data: Dict) -> float:
+        """
+        레코드에서 규칙 메시지에 표시할 값
+
+        Args:
+            rule_index: 규칙 인덱스
+            data: 레코드
+
+        Returns:
+            value_field 값 (없으면 기본값 또는 NaN)
+        """
+        field = self.rules[rule_index].value_field
+        return data.get(field, self.defaults.get(field, float('nan')))
+
+    def render(self, rule_index: int, data: Dict) -> str:
+        """
+        레코드 하나의 탐지 메시지 생성
+
+        Args:
+            rule_index: 규칙 인덱스
+            data: 레코드
+
+        Returns:
+            '심각도: 메시지' 문자열
+        """
+        return self.rules[rule_index].render(self.value_of(rule_index, data))
+
+
+# 기본 이상 탐지 규칙 (FlightAnalyzer 기본값)
+DEFAULT_ANOMALY_RULES = AnomalyRuleSet(
+    [
+        AnomalyRule('LOW_FUEL', [('fuel_level', '<', 20.0)], SEVERITY_CRITICAL,
+                    "Low fuel level ({value:.2f}%)"),
+        AnomalyRule('HIGH_ENGINE_TEMP', [('engine_temp', '>', 700.0)], SEVERITY_WARNING,
+                    "High engine temperature ({value:.2f}°C)"),
+        AnomalyRule('ALTITUDE_LIMIT', [('altitude', '>', 12000.0)], SEVERITY_WARNING,
+                    "Altitude exceeds safe limit ({value:.2f}m)"),
+        AnomalyRule('LOW_SPEED_HIGH_ALTITUDE', [('altitude', '>', 8000.0), ('speed', '<', 300.0)],
+                    SEVERITY_WARNING, "Unusually low speed at high altitude"),
+    ],
+    defaults={'fuel_level': 100.0, 'engine_temp': 0.0, 'altitude': 0.0, 'speed': 0.0}
+)
@@ -0,0 +1,310 @@
+"""
+이상 탐지 결과 저장소 모듈
+Anomaly Store Module
+
+탐지된 이상을 (항공기, 시각, 규칙) 단위로 중복 없이 보관하고, 용량과 보존 기간을 넘으면 오래된 것부터
+제거합니다. 항공기별, 시각별로 정렬된 색인을 두어 조회는 전체를 훑지 않고 이진 탐색으로 범위를 찾습니다.
+이상은 대부분 시각 순으로 들어오므로 색인은 deque 끝에 추가하고 앞에서 제거하며, 순서가 어긋난 이상만
+중간에 끼워 넣습니다. 여러 요청 스레드가 공유할 수 있도록 변경과 조회는 잠금으로 직렬화합니다.
+"""
+
+import logging
+import threading
+from bisect import bisect_left, insort
+from collections import deque
+from itertools import count, islice
+from typing import Deque, Dict, List, Optional, Tuple, Union
+
+try:
+    from .flight_buffer import to_epoch_ns
+    from .anomaly_rules import AnomalyRule
+except ImportError:  # src/ 에서 직접 실행하는 경우 (api_server.py)
+    from flight_buffer import to_epoch_ns
+    from anomaly_rules import AnomalyRule
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# 기본 최대 보관 이상 수
+DEFAULT_STORE_CAPACITY = 100_000
+
+# 중복 판정 키: (epoch ns, 항공기 식별자, 규칙 코드), 항공기 식별자가 없으면 ''
+AnomalyKey = Tuple[int, str, str]
+# 시각 색인 키: (epoch ns, 항공기 식별자, 추가 순번, 규칙 코드), 같은 레코드 안에서는 탐지 순서 유지
+TimeKey = Tuple[int, str, int, str]
+
+
+class AnomalyStore:
+    """
+    용량 제한과 색인이 있는 이상 저장소
+
+    같은 (항공기, 시각, 규칙) 이상은 한 번만 보관하므로 같은 데이터를 다시 분석해도 늘어나지 않습니다.
+    메시지는 규칙과 값만 보관했다가 조회할 때 만듭니다.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_STORE_CAPACITY, retention_s: Optional[float] = None):
+        """
+        Args:
+            capacity: 최대 보관 이상 수 (넘으면 가장 오래된 시각부터 제거)
+            retention_s: 보존 기간 (초, 가장 최근 이상 시각 기준, None이면 제한 없음)
+        """
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive: {capacity}")
+        if retention_s is not None and retention_s <= 0:
+            raise ValueError(f"Retention must be positive: {retention_s}")
+
+        self.capacity = capacity
+        self.retention_ns = None if retention_s is None else int(round(retention_s * 1e9))
+        self.duplicates = 0
+        self.evicted = 0
+        self._entries: Dict[AnomalyKey, Tuple[int, AnomalyRule, float]] = {}
+        self._by_time: Deque[TimeKey] = deque()
+        self._by_aircraft: Dict[str, Deque[Tuple[int, int, str]]] = {}
+        self._record_sizes: Dict[Tuple[int, str], int] = {}
+        self._aircraft_records: Dict[str, int] = {}
+        self._sequence = count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def record_count(self) -> int:
+        """이상이 하나 이상 있는 (항공기, 시각) 레코드 수"""
+        return len(self._record_sizes)
+
+    def aircraft_record_count(self, aircraft_id: Optional[str]) -> int:
+        """
+        한 항공기의 이상이 하나 이상 있는 레코드 수 (O(1))
+
+        Args:
+            aircraft_id: 항공기 식별자 (None이면 식별자 없이 추가된 이상)
+
+        Returns:
+            레코드 수
+        """
+        return self._aircraft_records.get('' if aircraft_id is None else aircraft_id, 0)
+
+    def add(self, aircraft_id: Optional[str], timestamp: Union[int, str], rule: AnomalyRule, value: float) -> bool:
+        """
+        이상 하나 추가 (시각 순이면 O(1), 순서가 어긋나면 중간 삽입)
+
+        Args:
+            aircraft_id: 항공기 식별자
+            timestamp: 레코드 시각 (epoch ns 또는 ISO 문자열)
+            rule: 탐지한 규칙
+            value: 메시지에 표시할 값
+
+        Returns:
+            추가 여부 (이미 있거나 보존 기간이 지난 경우 False)
+        """
+        timestamp_ns = to_epoch_ns(timestamp)
+        with self._lock:
+            return self._add(aircraft_id, timestamp_ns, rule, value)
+
+    def _add(self, aircraft_id: Optional[str], timestamp_ns: int, rule: AnomalyRule, value: float) -> bool:
+        """이상 하나 추가 (_lock 을 잡은 상태에서 호출)"""
+        aircraft = '' if aircraft_id is None else aircraft_id
+        key = (timestamp_ns, aircraft, rule.code)
+        if key in self._entries:
+            self.duplicates += 1
+            return False
+        if self.retention_ns is not None and self._by_time \
+                and timestamp_ns < self._by_time[-1][0] - self.retention_ns:
+            self.evicted += 1
+            return False
+
+        sequence = next(self._sequence)
+        self._entries[key] = (sequence, rule, value)
+        self._insert(self._by_time, (timestamp_ns, aircraft, sequence, rule.code))
+        index = self._by_aircraft.get(aircraft)
+        if index is None:
+            index = self._by_aircraft[aircraft] = deque()
+        self._insert(index, (timestamp_ns, sequence, rule.code))
+        record = (timestamp_ns, aircraft)
+        size = self._record_sizes.get(record, 0)
+        self._record_sizes[record] = size + 1
+        if not size:
+            self._aircraft_records[aircraft] = self._aircraft_records.get(aircraft, 0) + 1
+        self._evict()
+        return True
+
+    @staticmethod
+    def _insert(index: deque, entry: tuple):
+        """정렬된 색인에 추가 (시각 순이면 끝에 O(1)로 추가, 아니면 이진 탐색 위치에 삽입)"""
+        if not index or index[-1] <= entry:
+            index.append(entry)
+        else:
+            insort(index, entry)
+
+    def add_batch(self, batch) -> int:
+        """
+        FlightAnalyzer.detect_anomalies_batch 결과 추가
+
+        Args:
+            batch: AnomalyBatch
+
+        Returns:
+            새로 추가된 이상 수
+        """
+        rules = batch.rules.rules
+        timestamps = {
+            row: to_epoch_ns(timestamp) for row, timestamp in batch.timestamps.items() if timestamp is not None
+        }
+        added = 0
+        with self._lock:
+            for row, code, value in zip(batch.rows.tolist(), batch.codes.tolist(), batch.values.tolist()):
+                timestamp_ns = timestamps.get(row)
+                if timestamp_ns is None:
+                    continue
+                added += self._add(batch.aircraft_ids[row], timestamp_ns, rules[code], value)
+        return added
+
+    def _evict(self):
+        """보존 기간과 용량을 넘는 오래된 이상 제거 (색인 앞에서 꺼내므로 이상당 O(1))"""
+        by_time = self._by_time
+        cut = 0
+        if self.retention_ns is not None:
+            cutoff = by_time[-1][0] - self.retention_ns
+            cut = bisect_left(by_time, (cutoff,))
+        if len(by_time) > self.capacity:
+            # 용량 초과 시 여유분까지 한 번에 잘라 제거 비용을 분할 상환
+            cut = max(cut, len(by_time) - self.capacity + self.capacity // 64)
+        if cut <= 0:
+            return
+
+        for _ in range(cut):
+            timestamp_ns, aircraft, _, code = by_time.popleft()
+            del self._entries[(timestamp_ns, aircraft, code)]
+            record = (timestamp_ns, aircraft)
+            remaining = self._record_sizes[record] - 1
+            if remaining:
+                self._record_sizes[record] = remaining
+            else:
+                del self._record_sizes[record]
+                self._aircraft_records[aircraft] -= 1
+            # 전체 색인에서 가장 오래된 이상은 해당 항공기 색인에서도 가장 오래된 이상
+            index = self._by_aircraft[aircraft]
+            index.popleft()
+            if not index:
+                del self._by_aircraft[aircraft]
+                del self._aircraft_records[aircraft]
+        self.evicted += cut
+
+    def query(
+        self,
+        aircraft_id: Optional[str] = None,
+        start: Optional[Union[int, str]] = None,
+        end: Optional[Union[int, str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        이상 조회 (시각 순)
+
+        항공기와 시각 범위는 정렬된 색인의 이진 탐색으로 찾고, limit 는 범위 끝에서 거꾸로 레코드 수를 세어
+        시작 위치를 정하므로 반환하는 결과 크기에 비례해 걸립니다.
+
+        Args:
+            aircraft_id: 항공기 식별자 (None이면 전체)
+            start: 시작 시각, 포함 (None이면 처음부터)
+            end: 종료 시각, 포함 (None이면 끝까지)
+            limit: 최근 limit 개 레코드만 반환 (None이면 전체)
+
+        Returns:
+            timestamp/aircraft_id/anomalies(메시지 리스트) 딕셔너리 리스트
+        """
+        start_ns = None if start is None else to_epoch_ns(start)
+        end_ns = None if end is None else to_epoch_ns(end)
+
+        with self._lock:
+            if aircraft_id is None:
+                index = self._by_time
+            else:
+                index = self._by_aircraft.get(aircraft_id, ())
+            low = 0 if start_ns is None else bisect_left(index, (start_ns,))
+            high = len(index) if end_ns is None else bisect_left(index, (end_ns + 1,))
+            if limit is not None:
+                low = self._limit_start(index, low, high, limit, aircraft_id is None)
+            entries = self._slice(index, low, high)
+            if aircraft_id is None:
+                keys = [(timestamp_ns, aircraft, code) for timestamp_ns, aircraft, _, code in entries]
+            else:
+                keys = [(timestamp_ns, aircraft_id, code) for timestamp_ns, _, code in entries]
+            found = [self._entries[key] for key in keys]
+
+        records: List[Dict] = []
+        current = None
+        for key, (_, rule, value) in zip(keys, found):
+            if current != key[:2]:
+                current = key[:2]
+                records.append({
+                    'timestamp': key[0],
+                    'aircraft_id': key[1] or None,
+                    'anomalies': []
+                })
+            records[-1]['anomalies'].append(rule.render(value))
+        return records
+
+    @staticmethod
+    def _slice(index: deque, low: int, high: int) -> List[tuple]:
+        """색인 구간 [low, high) 를 가까운 쪽 끝에서부터 꺼냄 (최근 구간 조회는 결과 크기에 비례)"""
+        if low >= high:
+            return []
+        if low <= len(index) - high:
+            return list(islice(index, low, high))
+        tail = list(islice(reversed(index), len(index) - high, len(index) - low))
+        tail.reverse()
+        return tail
+
+    @staticmethod
+    def _limit_start(index: list, low: int, high: int, limit: int, by_time: bool) -> int:
+        """
+        색인 구간 [low, high) 의 마지막 limit 개 레코드가 시작하는 위치
+
+        같은 레코드의 이상은 색인에서 연속하므로, 끝에서 거꾸로 걸으며 레코드가 바뀌는 지점만 셉니다.
+        """
+        if limit <= 0:
+            return high
+        seen = 0
+        current = None
+        position = high
+        while position > low:
+            entry = index[position - 1]
+            record = entry[:2] if by_time else entry[0]
+            if record != current:
+                if seen == limit:
+                    break
+                seen += 1
+                current = record
+            position -= 1
+        return position
+
+    def get_aircraft_ids(self) -> List[str]:
+        """이상이 보관된 항공기 식별자 목록"""
+        with self._lock:
+            return [aircraft for aircraft in self._by_aircraft if aircraft]
+
+    def clear(self, aircraft_id: Optional[str] = None):
+        """
+        이상 삭제
+
+        Args:
+            aircraft_id: 삭제할 항공기 (None이면 전체)
+        """
+        with self._lock:
+            if aircraft_id is None:
+                self._entries.clear()
+                self._by_time.clear()
+                self._by_aircraft.clear()
+                self._record_sizes.clear()
+                self._aircraft_records.clear()
+                return
+
+            index = self._by_aircraft.pop(aircraft_id, ())
+            for timestamp_ns, _, code in index:
+                del self._entries[(timestamp_ns, aircraft_id, code)]
+                self._record_sizes.pop((timestamp_ns, aircraft_id), None)
+            self._aircraft_records.pop(aircraft_id, None)
+            self._by_time = deque(key for key in self._by_time if key[1] != aircraft_id)
@@ -9,11 +9,15 @@ from flask import Flask, jsonify, request
 from flask_cors import CORS
 import logging
 import json
+import os
+import threading
 from datetime import datetime
+from typing import List
 
-from data_collector import FlightDataCollector
+from data_collector import FleetCollector
+from flight_buffer import columns_to_records, serialize_records
 from data_processor import DataProcessor
-from analyzer import FlightAnalyzer
+from analyzer import FlightAnalyzer, IncrementalFlightAnalyzer
 from report_generator import ReportGenerator
 
 
@@ -23,11 +27,72 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)  # CORS 활성화
 
+# 항공기 식별자를 지정하지 않은 요청에 사용할 기본 항공기
+DEFAULT_AIRCRAFT_ID = "API-AIRCRAFT-001"
+
+# 시작 시 등록할 항공기 목록 환경 변수 (쉼표로 구분, 없으면 기본 항공기만)
+FLEET_AIRCRAFT_ENV = "FLIGHT_API_AIRCRAFT"
+
+# 등록 가능한 최대 항공기 수 (항공기마다 버퍼를 두므로 요청으로 메모리가 무한히 늘어나는 것 방지)
+MAX_FLEET_SIZE = 64
+
+# /api/analyze 응답에 포함할 최근 이상 레코드 수 기본값
+DEFAULT_ANOMALY_LIMIT = 100
+
+
+def _initial_aircraft_ids() -> List[str]:
+    """시작 시 등록할 항공기 목록 (FLIGHT_API_AIRCRAFT 환경 변수)"""
+    configured = os.environ.get(FLEET_AIRCRAFT_ENV, '')
+    aircraft_ids = list(dict.fromkeys(a.strip() for a in configured.split(',') if a.strip()))
+    if not aircraft_ids:
+        aircraft_ids = [DEFAULT_AIRCRAFT_ID]
+    if len(aircraft_ids) > MAX_FLEET_SIZE:
+        raise ValueError(f"{FLEET_AIRCRAFT_ENV} lists {len(aircraft_ids)} aircraft (max {MAX_FLEET_SIZE})")
+    return aircraft_ids
+
+
 # 전역 객체
-collector = FlightDataCollector("API-AIRCRAFT-001")
+fleet = FleetCollector(_initial_aircraft_ids())
+# 항공기 등록 시 최대 수 확인과 등록을 묶음
+fleet_lock = threading.Lock()
 processor = DataProcessor()
 analyzer = FlightAnalyzer()
-report_gen = ReportGenerator("API-AIRCRAFT-001")
+# 항공기별 버퍼에 남아 있는 유효 샘플의 증분 패턴, 위험도 분석 (동기화 비용은 바뀐 샘플 수에 비례)
+patterns = IncrementalFlightAnalyzer(analyzer)
+
+
+def _valid_rows(columns):
+    """process_batch 가 받아들일 샘플 마스크 (처리 통계에 집계하지 않음)"""
+    return processor.validate_columns(columns)[0]
+
+
+def _sync_aircraft(aircraft_id: str):
+    """
+    항공기 버퍼와 증분 분석 동기화
+    
+    마지막 동기화 이후 새로 들어온 샘플만 검증, 정규화해 이상을 탐지합니다
+    (이전 샘플의 이상은 이미 저장소에 있음).
+    
+    Args:
+        aircraft_id: 등록된 항공기 식별자
+        
+    Returns:
+        동기화한 버퍼 스냅샷
+    """
+    snapshot = fleet.get_collector(aircraft_id).snapshot()
+    added = patterns.sync(aircraft_id, snapshot, _valid_rows)
+    if len(added['timestamp']):
+        processed, _ = processor.process_columns(added)
+        analyzer.detect_anomalies_batch(processed, aircraft_id=aircraft_id)
+    return snapshot
+
+
+def _unknown_aircraft(aircraft_id: str):
+    """등록되지 않은 항공기 응답"""
+    return jsonify({
+        'success': False,
+        'error': f'Unknown aircraft: {aircraft_id}'
+    }), 404
 
 
 @app.route('/')
@@ -43,7 +108,8 @@ def index():
             '/api/collect': 'POST - 데이터 수집',
             '/api/data': 'GET - 수집된 데이터 조회',
             '/api/analyze': 'POST - 데이터 분석',
-            '/api/report': 'GET - 보고서 생성'
+            '/api/report': 'GET - 보고서 생성',
+            '/api/fleet': 'GET - 항공기별 버퍼 현황, POST - 항공기 등록'
         }
     })
 
@@ -64,17 +130,38 @@ def collect_data():
     
     Request Body (선택):
         {
-            "samples": 1  // 수집할 샘플 수
+            "samples": 1,  // 항공기당 수집할 샘플 수 (0 이상, 버퍼 용량 이하)
+            "aircraft_id": "API-AIRCRAFT-001",  // 수집할 항공기
+            "aircraft_ids": []  // 여러 항공기를 동시에 수집 (aircraft_id 보다 우선, 등록된 항공기만)
         }
     """
     try:
         data = request.get_json() or {}
         samples = data.get('samples', 1)
+        aircraft_ids = data.get('aircraft_ids') or [data.get('aircraft_id', DEFAULT_AIRCRAFT_ID)]
+        
+        # bool 은 int 의 하위 타입이므로 따로 거부
+        if isinstance(samples, bool) or not isinstance(samples, int) or not 0 <= samples <= fleet.buffer_capacity:
+            return jsonify({
+                'success': False,
+                'error': f'samples must be an integer between 0 and {fleet.buffer_capacity}'
+            }), 400
+        if not isinstance(aircraft_ids, list) or not all(isinstance(a, str) for a in aircraft_ids):
+            return jsonify({
+                'success': False,
+                'error': 'aircraft_ids must be a list of strings'
+            }), 400
+        
+        # 미등록 항공기는 자동 등록하지 않음 (POST /api/fleet 로 최대 MAX_FLEET_SIZE 대까지 등록)
+        for aircraft_id in aircraft_ids:
+            if aircraft_id not in fleet:
+                return _unknown_aircraft(aircraft_id)
         
         collected = []
-        for _ in range(samples):
-            sample = collector.collect_sensor_data()
-            collected.append(sample)
+        for aircraft_id, columns in fleet.collect(samples, aircraft_ids).items():
+            # 수집할 때마다 동기화해 밀려난 샘플의 청크를 오래 붙잡지 않음
+            _sync_aircraft(aircraft_id)
+            collected.extend(columns_to_records(columns, aircraft_id, iso_timestamps=True))
         
         return jsonify({
             'success': True,
@@ -96,19 +183,21 @@ def get_data():
     
     Query Parameters:
         limit: 반환할 최대 데이터 수 (기본값: 100)
+        aircraft_id: 조회할 항공기 (기본값: DEFAULT_AIRCRAFT_ID)
     """
     try:
         limit = request.args.get('limit', 100, type=int)
-        data = collector.get_buffer_data()
+        aircraft_id = request.args.get('aircraft_id', DEFAULT_AIRCRAFT_ID)
+        if aircraft_id not in fleet:
+            return _unknown_aircraft(aircraft_id)
         
-        # 제한 적용
-        if limit > 0:
-            data = data[-limit:]
+        # 제한이 있으면 버퍼 끝부분만 변환
+        data = fleet.get_aircraft_data(aircraft_id, limit if limit > 0 else None)
         
         return jsonify({
             'success': True,
             'count': len(data),
-            'data': data
+            'data': serialize_records(data)
         })
     except Exception as e:
         logger.error(f"Error in get_data: {e}")
@@ -125,43 +214,68 @@ def analyze_data():
     
     Request Body (선택):
         {
-            "data": []  // 분석할 데이터 (없으면 버퍼의 데이터 사용)
+            "data": [],  // 분석할 데이터 (없으면 버퍼의 데이터 사용)
+            "aircraft_id": "API-AIRCRAFT-001",  // data 가 없을 때 버퍼를 사용하고 이상을 조회할 항공기
+            "anomaly_limit": 100  // 반환할 최근 이상 레코드 수
         }
     """
     try:
         request_data = request.get_json() or {}
-        data_list = request_data.get('data', collector.get_buffer_data())
-        
-        if not data_list:
+        data_list = request_data.get('data')
+        from_buffer = data_list is None
+        aircraft_id = request_data.get('aircraft_id', DEFAULT_AIRCRAFT_ID)
+        anomaly_limit = request_data.get('anomaly_limit', DEFAULT_ANOMALY_LIMIT)
+        if not isinstance(anomaly_limit, int) or anomaly_limit < 0:
             return jsonify({
                 'success': False,
-                'error': 'No data available for analysis'
+                'error': 'anomaly_limit must be a non-negative integer'
             }), 400
-        
-        # 데이터 처리
-        processed = processor.process_batch(data_list)
-        
-        # 이상 탐지
-        for data in processed:
-            analyzer.detect_anomalies(data)
-        
-        # 패턴 분석
-        pattern = analyzer.analyze_flight_pattern(processed)
-        
-        # 위험도 평가
-        risk = analyzer.generate_risk_assessment(processed)
-        
-        # 이상 패턴
-        anomalies = analyzer.get_all_anomalies()
+        if from_buffer:
+            if aircraft_id not in fleet:
+                return _unknown_aircraft(aircraft_id)
+            
+            # 버퍼는 증분 분석 결과 사용 (새 샘플만 처리하고 이상 탐지)
+            snapshot = _sync_aircraft(aircraft_id)
+            if not len(snapshot):
+                return jsonify({
+                    'success': False,
+                    'error': 'No data available for analysis'
+                }), 400
+            
+            pattern = patterns.analysis(aircraft_id)
+            risk = patterns.risk_assessment(aircraft_id)
+            # 요청한 항공기의 최근 이상
+            anomalies = analyzer.get_anomalies(aircraft_id, limit=anomaly_limit)
+            processed_count = pattern.get('total_samples', 0)
+            invalid_count = len(snapshot) - processed_count
+        else:
+            if not data_list:
+                return jsonify({
+                    'success': False,
+                    'error': 'No data available for analysis'
+                }), 400
+            
+            # 데이터 처리
+            processed = processor.process_batch(data_list)
+            
+            # 이상 탐지 (규칙별 벡터 마스크, 메시지는 응답 직렬화 시 생성)
+            batch = analyzer.detect_anomalies_batch(processed)
+            
+            pattern = analyzer.analyze_flight_pattern(processed)
+            risk = analyzer.generate_risk_assessment(processed)
+            # 전달된 데이터에서 탐지한 이상
+            anomalies = batch.to_records()[-anomaly_limit:] if anomaly_limit else []
+            processed_count = len(processed)
+            invalid_count = len(data_list) - len(processed)
         
         return jsonify({
             'success': True,
             'analysis': {
                 'pattern': pattern,
                 'risk_assessment': risk,
-                'anomalies': anomalies,
-                'processed_count': len(processed),
-                'invalid_count': len(data_list) - len(processed)
+                'anomalies': serialize_records(anomalies),
+                'processed_count': processed_count,
+                'invalid_count': invalid_count
             }
         })
     except Exception as e:
@@ -179,30 +293,29 @@ def generate_report():
     
     Query Parameters:
         format: 보고서 형식 (json, html) 기본값: json
+        aircraft_id: 보고서를 생성할 항공기 (기본값: DEFAULT_AIRCRAFT_ID)
     """
     try:
         report_format = request.args.get('format', 'json')
+        aircraft_id = request.args.get('aircraft_id', DEFAULT_AIRCRAFT_ID)
+        if aircraft_id not in fleet:
+            return _unknown_aircraft(aircraft_id)
         
-        # 데이터 가져오기
-        data_list = collector.get_buffer_data()
+        # 버퍼와 증분 분석 동기화 (새 샘플만 처리하고 이상 탐지)
+        snapshot = _sync_aircraft(aircraft_id)
         
-        if not data_list:
+        if not len(snapshot):
             return jsonify({
                 'success': False,
                 'error': 'No data available for report'
             }), 400
         
-        # 데이터 처리 및 분석
-        processed = processor.process_batch(data_list)
-        
-        for data in processed:
-            analyzer.detect_anomalies(data)
-        
-        pattern = analyzer.analyze_flight_pattern(processed)
-        risk = analyzer.generate_risk_assessment(processed)
-        anomalies = analyzer.get_all_anomalies()
+        pattern = patterns.analysis(aircraft_id)
+        risk = patterns.risk_assessment(aircraft_id)
+        anomalies = analyzer.get_anomalies(aircraft_id)
         
         # 보고서 생성
+        report_gen = ReportGenerator(aircraft_id)
         if report_format == 'html':
             file_path = report_gen.generate_html_report(pattern, risk, anomalies)
             return jsonify({
@@ -232,11 +345,86 @@ def generate_report():
         }), 500
 
 
+@app.route('/api/fleet', methods=['GET'])
+def get_fleet():
+    """항공기별 버퍼 현황 조회 엔드포인트"""
+    try:
+        summary = fleet.get_fleet_summary()
+        return jsonify({
+            'success': True,
+            'aircraft_count': len(summary),
+            'aircraft': summary
+        })
+    except Exception as e:
+        logger.error(f"Error in get_fleet: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/api/fleet', methods=['POST'])
+def register_aircraft():
+    """
+    항공기 등록 엔드포인트
+    
+    Request Body:
+        {
+            "aircraft_id": "TAIL-7"  // 등록할 항공기 (이미 등록된 경우 그대로 성공)
+        }
+    """
+    try:
+        request_data = request.get_json(silent=True) or {}
+        aircraft_id = request_data.get('aircraft_id')
+        if not isinstance(aircraft_id, str) or not aircraft_id.strip():
+            return jsonify({
+                'success': False,
+                'error': 'aircraft_id must be a non-empty string'
+            }), 400
+        
+        with fleet_lock:
+            if aircraft_id in fleet:
+                created = False
+            elif len(fleet) >= MAX_FLEET_SIZE:
+                return jsonify({
+                    'success': False,
+                    'error': f'Fleet size limit reached ({MAX_FLEET_SIZE})'
+                }), 409
+            else:
+                fleet.add_aircraft(aircraft_id)
+                created = True
+        
+        return jsonify({
+            'success': True,
+            'aircraft_id': aircraft_id,
+            'aircraft_count': len(fleet)
+        }), 201 if created else 200
+    except Exception as e:
+        logger.error(f"Error in register_aircraft: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @app.route('/api/clear', methods=['POST'])
 def clear_data():
-    """데이터 버퍼 초기화 엔드포인트"""
+    """
+    데이터 버퍼 초기화 엔드포인트
+    
+    Request Body (선택):
+        {
+            "aircraft_id": "API-AIRCRAFT-001"  // 초기화할 항공기 (없으면 전체)
+        }
+    """
     try:
-        collector.clear_buffer()
+        request_data = request.get_json(silent=True) or {}
+        aircraft_id = request_data.get('aircraft_id')
+        if aircraft_id is not None and aircraft_id not in fleet:
+            return _unknown_aircraft(aircraft_id)
+        
+        fleet.clear(aircraft_id)
+        patterns.reset(aircraft_id)
         return jsonify({
             'success': True,
             'message': 'Data buffer cleared'
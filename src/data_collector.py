@@ -7,10 +7,27 @@ Flight Data Collector Module
 
 import json
 import logging
-from datetime import datetime, timezone
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
 import random
 
+import numpy as np
+
+try:
+    from .flight_buffer import (
+        BufferSnapshot, DEFAULT_BUFFER_CAPACITY, FlightDataBuffer, columns_to_records, serialize_records
+    )
+    from .storage import COLUMNAR_EXTENSION, JsonLinesWriter, write_columnar
+    from .sensor_drivers import AsyncSensorReader, DriverLike, create_simulated_drivers
+except ImportError:  # src/ 에서 직접 실행하는 경우 (api_server.py)
+    from flight_buffer import (
+        BufferSnapshot, DEFAULT_BUFFER_CAPACITY, FlightDataBuffer, columns_to_records, serialize_records
+    )
+    from storage import COLUMNAR_EXTENSION, JsonLinesWriter, write_columnar
+    from sensor_drivers import AsyncSensorReader, DriverLike, create_simulated_drivers
+
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,13 +36,47 @@ logger = logging.getLogger(__name__)
 class FlightDataCollector:
     """비행 데이터 수집 클래스"""
     
-    def __init__(self, aircraft_id: str):
+    # 센서별 시뮬레이션 범위 (최소, 최대)
+    SENSOR_RANGES = {
+        'altitude': (1000, 10000),    # m
+        'speed': (200, 900),          # km/h
+        'heading': (0, 360),          # 도
+        'latitude': (-90, 90),
+        'longitude': (-180, 180),
+        'fuel_level': (0, 100),       # %
+        'engine_temp': (200, 800),    # °C
+    }
+    
+    # 배치 수집 시 샘플 간격 (ISO 문자열의 마이크로초 정밀도에서도 구분되도록 1µs)
+    BATCH_INTERVAL_NS = 1000
+    
+    def __init__(
+        self,
+        aircraft_id: str,
+        buffer_capacity: int = DEFAULT_BUFFER_CAPACITY,
+        sensor_drivers: Optional[Dict[str, DriverLike]] = None,
+        sensor_timeout: float = 1.0
+    ):
         """
         Args:
             aircraft_id: 항공기 식별자
+            buffer_capacity: 버퍼 최대 레코드 수 (초과 시 오래된 데이터부터 제거)
+            sensor_drivers: 비동기 수집에 사용할 필드명별 센서 드라이버 (None이면 시뮬레이션 드라이버)
+            sensor_timeout: 비동기 수집 시 센서별 읽기 제한 시간 (초)
         """
         self.aircraft_id = aircraft_id
-        self.data_buffer: List[Dict] = []
+        # 버퍼가 쓰기를 자체 잠금으로 직렬화하고, 읽기는 잠금 없는 스냅샷을 사용
+        self.data_buffer = FlightDataBuffer(aircraft_id, buffer_capacity)
+        # 타임스탬프 발급과 버퍼 기록을 묶어 버퍼의 시각 순서를 보장 (마지막 발급 시각 이후로만 발급)
+        self._clock_lock = threading.Lock()
+        self._last_timestamp_ns = 0
+        self._rng = np.random.default_rng()
+        if sensor_drivers is None:
+            sensor_drivers = create_simulated_drivers(self.SENSOR_RANGES)
+        self.sensor_reader = AsyncSensorReader(sensor_drivers, timeout=sensor_timeout)
+        # 파일별 JSON Lines 기록기와 마지막으로 저장한 레코드 순번
+        self._writers: Dict[str, JsonLinesWriter] = {}
+        self._saved_sequence: Dict[str, int] = {}
         logger.info(f"FlightDataCollector initialized for aircraft: {aircraft_id}")
     
     def collect_sensor_data(self) -> Dict:
@@ -33,11 +84,10 @@ class FlightDataCollector:
         센서 데이터 수집
         
         Returns:
-            센서 데이터 딕셔너리
+            센서 데이터 딕셔너리 (timestamp 는 int epoch ns)
         """
         try:
             data = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "aircraft_id": self.aircraft_id,
                 "altitude": self._read_altitude(),
                 "speed": self._read_speed(),
@@ -48,7 +98,10 @@ class FlightDataCollector:
                 "engine_temp": self._read_engine_temp()
             }
             
-            self.data_buffer.append(data)
+            with self._clock_lock:
+                timestamp_ns = self._next_start_ns(1, self.BATCH_INTERVAL_NS)
+                data = {"timestamp": timestamp_ns, **data}
+                self.data_buffer.append(timestamp_ns, data)
             logger.debug(f"Collected data: {data}")
             return data
             
@@ -56,43 +109,135 @@ class FlightDataCollector:
             logger.error(f"Error collecting sensor data: {e}")
             raise
     
+    async def collect_sensor_data_async(self) -> Dict:
+        """
+        센서 드라이버를 동시에 읽어 센서 데이터 수집
+        
+        제한 시간 안에 응답하지 않은 센서 값은 NaN 으로 기록됩니다.
+        
+        Returns:
+            센서 데이터 딕셔너리
+        """
+        try:
+            values = await self.sensor_reader.read_all()
+            
+            # 타임스탬프는 모든 센서 응답 이후 발급 (동시 수집 간에도 버퍼 시각 순서 유지)
+            with self._clock_lock:
+                timestamp_ns = self._next_start_ns(1, self.BATCH_INTERVAL_NS)
+                data = {
+                    "timestamp": timestamp_ns,
+                    "aircraft_id": self.aircraft_id,
+                    **{field: values.get(field, float('nan')) for field in self.SENSOR_RANGES}
+                }
+                self.data_buffer.append(timestamp_ns, data)
+            logger.debug(f"Collected data: {data}")
+            return data
+            
+        except Exception as e:
+            logger.error(f"Error collecting sensor data: {e}")
+            raise
+    
+    def collect_batch(self, n: int, interval_ns: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        센서 데이터 n개를 컬럼 단위로 한 번에 수집
+        
+        Args:
+            n: 수집할 샘플 수
+            interval_ns: 샘플 간 타임스탬프 간격 (기본값: BATCH_INTERVAL_NS)
+            
+        Returns:
+            'timestamp'(int64 epoch ns)와 센서 필드별 배열 딕셔너리
+        """
+        if n < 0:
+            raise ValueError(f"Sample count must be non-negative: {n}")
+        
+        if interval_ns is None:
+            interval_ns = self.BATCH_INTERVAL_NS
+        
+        try:
+            columns = {}
+            for field, (low, high) in self.SENSOR_RANGES.items():
+                columns[field] = self._rng.uniform(low, high, n)
+            
+            with self._clock_lock:
+                start_ns = self._next_start_ns(n, interval_ns)
+                columns = {'timestamp': start_ns + np.arange(n, dtype=np.int64) * interval_ns, **columns}
+                self.data_buffer.extend(columns['timestamp'], columns)
+            logger.debug(f"Collected batch of {n} samples")
+            return columns
+            
+        except Exception as e:
+            logger.error(f"Error collecting sensor batch: {e}")
+            raise
+    
+    def _next_start_ns(self, n: int, interval_ns: int) -> int:
+        """
+        n개 샘플의 시작 타임스탬프 발급 (_clock_lock 을 잡은 상태에서 호출)
+        
+        현재 시각과 직전 발급 시각 + 간격 중 늦은 시각에서 시작하므로,
+        배치가 현재 시각 이후로 뻗어도 다음 배치와 겹치지 않습니다.
+        
+        Args:
+            n: 샘플 수
+            interval_ns: 샘플 간 타임스탬프 간격
+            
+        Returns:
+            첫 샘플의 타임스탬프 (int epoch ns)
+        """
+        start_ns = max(time.time_ns(), self._last_timestamp_ns + interval_ns)
+        if n > 0:
+            self._last_timestamp_ns = start_ns + (n - 1) * interval_ns
+        return start_ns
+    
     def _read_altitude(self) -> float:
         """고도 센서 읽기 (미터)"""
         # 실제 구현에서는 센서 API를 호출
-        return random.uniform(1000, 10000)
+        return random.uniform(*self.SENSOR_RANGES['altitude'])
     
     def _read_speed(self) -> float:
         """속도 센서 읽기 (km/h)"""
-        return random.uniform(200, 900)
+        return random.uniform(*self.SENSOR_RANGES['speed'])
     
     def _read_heading(self) -> float:
         """방향 센서 읽기 (도)"""
-        return random.uniform(0, 360)
+        return random.uniform(*self.SENSOR_RANGES['heading'])
     
     def _read_latitude(self) -> float:
         """위도 센서 읽기"""
-        return random.uniform(-90, 90)
+        return random.uniform(*self.SENSOR_RANGES['latitude'])
     
     def _read_longitude(self) -> float:
         """경도 센서 읽기"""
-        return random.uniform(-180, 180)
+        return random.uniform(*self.SENSOR_RANGES['longitude'])
     
     def _read_fuel_level(self) -> float:
         """연료량 센서 읽기 (%)"""
-        return random.uniform(0, 100)
+        return random.uniform(*self.SENSOR_RANGES['fuel_level'])
     
     def _read_engine_temp(self) -> float:
         """엔진 온도 센서 읽기 (°C)"""
-        return random.uniform(200, 800)
+        return random.uniform(*self.SENSOR_RANGES['engine_temp'])
+    
+    def snapshot(self) -> BufferSnapshot:
+        """
+        버퍼의 불변 스냅샷 반환 (O(1), 수집을 막지 않음)
+        
+        Returns:
+            버퍼 스냅샷
+        """
+        return self.data_buffer.snapshot()
     
-    def get_buffer_data(self) -> List[Dict]:
+    def get_buffer_data(self, limit: Optional[int] = None) -> List[Dict]:
         """
         버퍼에 저장된 데이터 반환
         
+        Args:
+            limit: 마지막 limit 개만 반환 (None이면 전체)
+            
         Returns:
-            수집된 데이터 리스트
+            수집된 데이터 리스트 (timestamp 는 int epoch ns)
         """
-        return self.data_buffer.copy()
+        return self.data_buffer.snapshot().to_records(limit)
     
     def clear_buffer(self):
         """데이터 버퍼 초기화"""
@@ -103,16 +248,257 @@ class FlightDataCollector:
         """
         수집된 데이터를 파일로 저장
         
+        '.jsonl' 파일은 마지막 저장 이후의 새 레코드만 추가하고,
+        '.fdcol' 파일은 바이너리 컬럼형 형식으로, 그 외에는 버퍼 전체를 JSON 배열로 기록합니다.
+        
         Args:
             filename: 저장할 파일 경로
         """
+        if filename.endswith('.jsonl'):
+            self.append_to_file(filename)
+            return
+        
+        if filename.endswith(COLUMNAR_EXTENSION):
+            write_columnar(filename, self.data_buffer.to_columns(), self.aircraft_id)
+            return
+        
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.data_buffer, f, indent=2, ensure_ascii=False)
+                json.dump(serialize_records(self.get_buffer_data()), f, indent=2, ensure_ascii=False)
             logger.info(f"Data saved to {filename}")
         except Exception as e:
             logger.error(f"Error saving data to file: {e}")
             raise
+    
+    def append_to_file(
+        self,
+        filename: str,
+        fsync_every: int = 0,
+        max_bytes: int = 0,
+        backup_count: int = 5
+    ) -> int:
+        """
+        마지막 저장 이후 수집된 레코드를 JSON Lines 파일에 추가
+        
+        기록기 옵션은 해당 파일에 처음 저장할 때 적용됩니다.
+        
+        Args:
+            filename: 저장할 파일 경로
+            fsync_every: fsync 간격 (레코드 수, 0이면 fsync 하지 않음)
+            max_bytes: 파일 회전 기준 크기 (바이트, 0이면 회전하지 않음)
+            backup_count: 보관할 회전 파일 수
+            
+        Returns:
+            추가된 레코드 수
+        """
+        try:
+            writer = self._writers.get(filename)
+            if writer is None:
+                writer = JsonLinesWriter(filename, fsync_every, max_bytes, backup_count)
+                self._writers[filename] = writer
+            
+            since = self._saved_sequence.get(filename, 0)
+            snapshot = self.data_buffer.snapshot()
+            evicted = snapshot.oldest_sequence - since
+            columns = snapshot.to_columns(since=since)
+            saved_sequence = snapshot.total_appended
+            
+            if evicted > 0:
+                logger.warning(f"{evicted} records were evicted before being saved to {filename}")
+            
+            written = writer.write_records(columns_to_records(columns, self.aircraft_id, iso_timestamps=True))
+            self._saved_sequence[filename] = saved_sequence
+            
+            logger.info(f"Appended {written} records to {filename}")
+            return written
+        except Exception as e:
+            logger.error(f"Error appending data to file: {e}")
+            raise
+    
+    def close(self):
+        """열려 있는 파일 기록기 닫기"""
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+
+class FleetCollector:
+    """다중 항공기 데이터 수집 클래스 (항공기별 버퍼 샤딩)"""
+    
+    def __init__(
+        self,
+        aircraft_ids: Optional[Iterable[str]] = None,
+        buffer_capacity: int = DEFAULT_BUFFER_CAPACITY,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Args:
+            aircraft_ids: 초기 등록할 항공기 식별자 목록
+            buffer_capacity: 항공기별 버퍼 최대 레코드 수
+            max_workers: 수집 작업자 스레드 수 (None이면 기본값)
+        """
+        self.buffer_capacity = buffer_capacity
+        self._collectors: Dict[str, FlightDataCollector] = {}
+        # 항공기 등록/해제에만 사용 (수집과 조회는 항공기별 잠금 사용)
+        self._registry_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fleet-collector")
+        
+        for aircraft_id in aircraft_ids or []:
+            self.add_aircraft(aircraft_id)
+        
+        logger.info(f"FleetCollector initialized with {len(self._collectors)} aircraft")
+    
+    def __len__(self) -> int:
+        return len(self._collectors)
+    
+    def __contains__(self, aircraft_id: str) -> bool:
+        return aircraft_id in self._collectors
+    
+    @property
+    def aircraft_ids(self) -> List[str]:
+        """등록된 항공기 식별자 목록"""
+        return list(self._collectors)
+    
+    def add_aircraft(self, aircraft_id: str) -> FlightDataCollector:
+        """
+        항공기 등록 (이미 등록된 경우 기존 수집기 반환)
+        
+        Args:
+            aircraft_id: 항공기 식별자
+            
+        Returns:
+            해당 항공기의 수집기
+        """
+        collector = self._collectors.get(aircraft_id)
+        if collector is not None:
+            return collector
+        
+        with self._registry_lock:
+            collector = self._collectors.get(aircraft_id)
+            if collector is None:
+                collector = FlightDataCollector(aircraft_id, self.buffer_capacity)
+                self._collectors[aircraft_id] = collector
+            return collector
+    
+    def remove_aircraft(self, aircraft_id: str):
+        """
+        항공기 등록 해제
+        
+        Args:
+            aircraft_id: 항공기 식별자
+        """
+        with self._registry_lock:
+            collector = self._collectors.pop(aircraft_id)
+        collector.close()
+        logger.info(f"Aircraft removed from fleet: {aircraft_id}")
+    
+    def get_collector(self, aircraft_id: str) -> FlightDataCollector:
+        """
+        항공기 수집기 조회
+        
+        Args:
+            aircraft_id: 항공기 식별자
+            
+        Returns:
+            해당 항공기의 수집기
+            
+        Raises:
+            KeyError: 등록되지 않은 항공기인 경우
+        """
+        try:
+            return self._collectors[aircraft_id]
+        except KeyError:
+            raise KeyError(f"Unknown aircraft: {aircraft_id}") from None
+    
+    def collect(
+        self,
+        samples: int = 1,
+        aircraft_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        여러 항공기의 데이터를 작업자 풀에서 동시에 수집
+        
+        Args:
+            samples: 항공기당 수집할 샘플 수
+            aircraft_ids: 수집할 항공기 (None이면 전체, 미등록 항공기는 자동 등록)
+            
+        Returns:
+            항공기 식별자별 컬럼 딕셔너리
+        """
+        if aircraft_ids is None:
+            collectors = list(self._collectors.values())
+        else:
+            collectors = [self.add_aircraft(aircraft_id) for aircraft_id in aircraft_ids]
+        
+        futures = {
+            collector.aircraft_id: self._executor.submit(collector.collect_batch, samples)
+            for collector in collectors
+        }
+        return {aircraft_id: future.result() for aircraft_id, future in futures.items()}
+    
+    def get_aircraft_data(self, aircraft_id: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        항공기별 버퍼 데이터 조회
+        
+        Args:
+            aircraft_id: 항공기 식별자
+            limit: 마지막 limit 개만 반환 (None이면 전체)
+            
+        Returns:
+            해당 항공기의 데이터 리스트
+        """
+        return self.get_collector(aircraft_id).get_buffer_data(limit)
+    
+    def get_fleet_data(self) -> Dict[str, List[Dict]]:
+        """
+        전체 항공기 버퍼 데이터 조회
+        
+        Returns:
+            항공기 식별자별 데이터 리스트
+        """
+        return {
+            aircraft_id: collector.get_buffer_data()
+            for aircraft_id, collector in list(self._collectors.items())
+        }
+    
+    def get_fleet_summary(self) -> Dict[str, Dict]:
+        """
+        전체 항공기 버퍼 상태 요약
+        
+        Returns:
+            항공기 식별자별 버퍼 레코드 수와 누적 수집 수
+        """
+        snapshots = {
+            aircraft_id: collector.snapshot()
+            for aircraft_id, collector in list(self._collectors.items())
+        }
+        return {
+            aircraft_id: {
+                'buffered': len(snapshot),
+                'total_collected': snapshot.total_appended
+            }
+            for aircraft_id, snapshot in snapshots.items()
+        }
+    
+    def clear(self, aircraft_id: Optional[str] = None):
+        """
+        버퍼 초기화
+        
+        Args:
+            aircraft_id: 초기화할 항공기 (None이면 전체)
+        """
+        if aircraft_id is not None:
+            self.get_collector(aircraft_id).clear_buffer()
+            return
+        
+        for collector in list(self._collectors.values()):
+            collector.clear_buffer()
+    
+    def shutdown(self):
+        """작업자 풀 종료 및 파일 기록기 닫기"""
+        self._executor.shutdown(wait=True)
+        for collector in list(self._collectors.values()):
+            collector.close()
 
 
 def main():
@@ -6,24 +6,308 @@ Data Processor Module
 """
 
 import logging
-from typing import Dict, List, Optional
-import statistics
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from .flight_buffer import EPOCH_NS_MAX, to_epoch_ns
+    from .validation_schema import FLIGHT_DATA_SCHEMA, MISSING_FIELD, ValidationSchema
+    from .online_stats import DEFAULT_SKETCH_SIZE, OnlineStats
+except ImportError:  # src/ 에서 직접 실행하는 경우 (api_server.py)
+    from flight_buffer import EPOCH_NS_MAX, to_epoch_ns
+    from validation_schema import FLIGHT_DATA_SCHEMA, MISSING_FIELD, ValidationSchema
+    from online_stats import DEFAULT_SKETCH_SIZE, OnlineStats
 
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# 정규화 시 필드별 반올림 자릿수
+NORMALIZE_DECIMALS = {
+    'altitude': 2,
+    'speed': 2,
+    'heading': 2,
+    'latitude': 6,
+    'longitude': 6,
+    'fuel_level': 2,
+    'engine_temp': 2
+}
+
+# 병렬 처리 시 작업 하나의 레코드 수
+DEFAULT_PARALLEL_CHUNK_SIZE = 20_000
+
+# 병렬 처리를 사용하는 최소 배치 크기 (이보다 작으면 프로세스 간 전달 비용이 더 큼)
+DEFAULT_PARALLEL_MIN_BATCH = 50_000
+
+
+def iqr_bounds(values: np.ndarray, factor: float = 1.5) -> Tuple[float, float]:
+    """
+    IQR 이상치 범위 계산
+    
+    Q1, Q3 는 정렬 대신 np.partition (선택 알고리즘, O(n)) 으로 구하며,
+    정렬된 값의 n // 4, 3n // 4 번째 값을 사용합니다.
+    
+    Args:
+        values: 값 배열 (NaN 없음, 1개 이상)
+        factor: IQR 배수
+        
+    Returns:
+        (하한, 상한)
+    """
+    n = len(values)
+    k1, k3 = n // 4, (3 * n) // 4
+    partitioned = np.partition(values, (k1, k3))
+    q1 = float(partitioned[k1])
+    q3 = float(partitioned[k3])
+    iqr = q3 - q1
+    return q1 - factor * iqr, q3 + factor * iqr
+
+
+def column_statistics(columns: Dict[str, np.ndarray]) -> Dict[str, Dict]:
+    """
+    여러 컬럼의 통계를 한 번에 계산 (calculate_statistics 와 같은 딕셔너리 형태)
+    
+    길이가 같은 컬럼은 2차원 배열로 쌓아 통계별로 NumPy 호출 한 번에 모든 필드를 계산하고,
+    중앙값은 정렬 대신 np.partition (선택 알고리즘) 으로 구합니다.
+    
+    Args:
+        columns: 필드별 값 배열 (NaN 없음)
+        
+    Returns:
+        필드별 통계 딕셔너리 (값이 없는 필드는 빈 딕셔너리)
+    """
+    results: Dict[str, Dict] = {field: {} for field in columns}
+    groups: Dict[int, List[str]] = {}
+    for field, values in columns.items():
+        if len(values):
+            groups.setdefault(len(values), []).append(field)
+    
+    for n, fields in groups.items():
+        matrix = np.stack([np.asarray(columns[field], dtype=np.float64) for field in fields])
+        means = matrix.mean(axis=1)
+        minimums = matrix.min(axis=1)
+        maximums = matrix.max(axis=1)
+        middle = np.partition(matrix, ((n - 1) // 2, n // 2), axis=1)
+        medians = (middle[:, (n - 1) // 2] + middle[:, n // 2]) / 2.0
+        stdevs = matrix.std(axis=1, ddof=1) if n > 1 else None
+        
+        for i, field in enumerate(fields):
+            stats = {
+                'count': n,
+                'mean': float(means[i]),
+                'median': float(medians[i]),
+                'min': float(minimums[i]),
+                'max': float(maximums[i])
+            }
+            if stdevs is not None:
+                stats['stdev'] = float(stdevs[i])
+            results[field] = stats
+    return results
+
+
+def _round_column(values: np.ndarray, decimals: int) -> np.ndarray:
+    """
+    컬럼 전체를 Python round 와 같은 결과로 반올림
+
+    np.rint 로 한 번에 반올림한 뒤, 10^자릿수 배 값이 .5 에서 몇 ulp 안에 있어 Python round 와
+    달라질 수 있는 원소만 round 로 다시 계산합니다. 정수 컬럼은 그대로 반환합니다.
+
+    Args:
+        values: 숫자 배열
+        decimals: 소수점 자릿수
+
+    Returns:
+        반올림된 배열
+    """
+    if values.dtype.kind in 'iu':
+        return values
+    values = values.astype(np.float64, copy=False)
+    scale = 10.0 ** decimals
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+    near_half = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) <= 8 * np.spacing(np.abs(scaled)))
+    if len(near_half):
+        rounded[near_half] = [round(value, decimals) for value in values[near_half].tolist()]
+    return rounded
+
+
+def _epoch_ns_column(values: list) -> np.ndarray:
+    """
+    타임스탬프 값들을 int64 epoch ns 배열로 변환 (모두 정수이면 한 번에 변환)
+
+    int64 범위를 넘는 값은 감싸지 않고 to_epoch_ns 처럼 ValueError 로 거부합니다.
+    """
+    try:
+        array = np.array(values)
+        if array.shape == (len(values),) and (
+            array.dtype.kind == 'i' or (array.dtype.kind == 'u' and not (array > EPOCH_NS_MAX).any())
+        ):
+            return array.astype(np.int64, copy=False)
+    except (OverflowError, ValueError):
+        pass
+    return np.fromiter((to_epoch_ns(value) for value in values), dtype=np.int64, count=len(values))
+
+
+def _process_records_chunk(
+    schema: ValidationSchema,
+    chunk: List[Dict]
+) -> Tuple[np.ndarray, Dict[str, int], List[Dict]]:
+    """
+    프로세스 풀 작업: 레코드 청크를 검증하고 정규화된 레코드까지 만들어 반환
+
+    검증은 컬럼 단위로, 반올림과 타임스탬프 변환은 컬럼 전체에 한 번씩 수행하므로
+    부모 프로세스는 결과 리스트를 이어 붙이기만 합니다. 결과는 normalize_data 와 같습니다.
+
+    Returns:
+        (유효 마스크, 규칙별 거부 수, 입력 순서의 정규화된 유효 레코드)
+    """
+    gathered = schema.gather_records(chunk)
+    if gathered is None:
+        # 숫자 배열로 모을 수 없는 청크는 레코드 단위로 검증
+        valid, counts = schema.check_records_mask(chunk)
+        rows = np.flatnonzero(valid).tolist()
+        timestamps = [chunk[i]['timestamp'] for i in rows]
+        values = {field: np.array([chunk[i][field] for i in rows]) for field in NORMALIZE_DECIMALS}
+    else:
+        raw = gathered[0]
+        valid, counts = schema.check_gathered(*gathered)
+        rows = np.flatnonzero(valid).tolist()
+        timestamps = [raw['timestamp'][i] for i in rows]
+        values = {field: raw[field][rows] for field in NORMALIZE_DECIMALS}
+
+    keys = ('timestamp',) + tuple(NORMALIZE_DECIMALS)
+    columns = [_epoch_ns_column(timestamps).tolist()]
+    columns += [_round_column(values[field], decimals).tolist() for field, decimals in NORMALIZE_DECIMALS.items()]
+
+    records = []
+    for i, row in zip(rows, zip(*columns)):
+        record = chunk[i].copy()
+        record.update(zip(keys, row))
+        records.append(record)
+    return valid, counts, records
+
+
+class RejectionStats:
+    """검증 거부 집계 (규칙별 누적 카운터와 최근 거부 레코드 표본)"""
+    
+    def __init__(self, rules: Tuple[str, ...], sample_size: int = 10):
+        """
+        Args:
+            rules: 거부 사유 목록
+            sample_size: 보관할 거부 레코드 표본 수
+        """
+        self.counts: Dict[str, int] = {rule: 0 for rule in rules}
+        self.total = 0
+        self.samples = deque(maxlen=sample_size)
+    
+    def record(self, rule: str, data: Dict):
+        """
+        거부 하나 기록
+        
+        Args:
+            rule: 처음 실패한 규칙
+            data: 거부된 레코드
+        """
+        self.counts[rule] = self.counts.get(rule, 0) + 1
+        self.total += 1
+        self.samples.append((rule, data))
+    
+    def add(self, counts: Dict[str, int], samples: List[Tuple[str, Dict]] = ()):
+        """
+        배치 거부 수 합산
+        
+        Args:
+            counts: 규칙별 거부 수
+            samples: (규칙, 레코드) 표본
+        """
+        for rule, count in counts.items():
+            if count:
+                self.counts[rule] = self.counts.get(rule, 0) + count
+                self.total += count
+        self.samples.extend(samples)
+    
+    def reset(self):
+        """집계 초기화"""
+        self.counts = {rule: 0 for rule in self.counts}
+        self.total = 0
+        self.samples.clear()
+    
+    def to_dict(self) -> Dict:
+        """
+        집계 딕셔너리 반환
+        
+        Returns:
+            총 거부 수, 규칙별 거부 수, 최근 거부 표본
+        """
+        return {
+            'total': self.total,
+            'by_rule': dict(self.counts),
+            'samples': [{'rule': rule, 'record': data} for rule, data in self.samples]
+        }
+
+
+class _RateLimitedLog:
+    """경고 로그 빈도 제한 (간격 내 메시지는 생략하고 다음 출력에 생략 수를 덧붙임)"""
+    
+    def __init__(self, interval: float, clock: Callable[[], float] = time.monotonic):
+        self.interval = interval
+        self._clock = clock
+        self._next_allowed = float('-inf')
+        self.suppressed = 0
+    
+    def warning(self, message: str):
+        now = self._clock()
+        if now < self._next_allowed:
+            self.suppressed += 1
+            return
+        if self.suppressed:
+            message = f"{message} ({self.suppressed} similar messages suppressed)"
+            self.suppressed = 0
+        self._next_allowed = now + self.interval
+        logger.warning(message)
+
+
 class DataProcessor:
     """데이터 처리 클래스"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        schema: Optional[ValidationSchema] = None,
+        rejection_sample_size: int = 10,
+        log_interval: float = 10.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            schema: 검증 스키마 (None이면 FLIGHT_DATA_SCHEMA)
+            rejection_sample_size: 보관할 거부 레코드 표본 수
+            log_interval: 거부 경고 로그 최소 간격 (초)
+            clock: 로그 빈도 제한용 시계 함수 (초)
+        """
+        self.schema = schema or FLIGHT_DATA_SCHEMA
         self.processed_count = 0
+        self.rejections = RejectionStats(self.schema.rules, rejection_sample_size)
+        self._rejection_log = _RateLimitedLog(log_interval, clock)
+        # 병렬 처리는 정규화 필드와 타임스탬프가 모두 스키마의 필수 필드일 때만 사용
+        self._parallel_capable = (
+            'timestamp' in self.schema.required_fields
+            and set(NORMALIZE_DECIMALS) <= set(self.schema.required_fields) & set(self.schema.number_fields)
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_workers = 0
         logger.info("DataProcessor initialized")
     
     def validate_data(self, data: Dict) -> bool:
         """
-        데이터 유효성 검증
+        데이터 유효성 검증 (스키마의 레코드 단위 검증기 사용)
         
         Args:
             data: 검증할 데이터
@@ -31,73 +315,168 @@ class DataProcessor:
         Returns:
             유효 여부
         """
-        required_fields = [
-            'timestamp', 'aircraft_id', 'altitude', 'speed',
-            'heading', 'latitude', 'longitude', 'fuel_level', 'engine_temp'
-        ]
+        rule = self.schema.check(data)
+        if rule is None:
+            return True
         
-        # 필수 필드 확인
-        for field in required_fields:
-            if field not in data:
-                logger.warning(f"Missing required field: {field}")
-                return False
+        self.rejections.record(rule, data)
+        if rule == MISSING_FIELD:
+            self._rejection_log.warning(f"Missing required field: {self.schema.missing_field(data)}")
+        else:
+            self._rejection_log.warning(f"Invalid {rule}: {data[rule]}")
+        return False
+    
+    def normalize_data(self, data: Dict) -> Dict:
+        """
+        데이터 정규화
         
-        # 범위 검증
-        if not (0 <= data['altitude'] <= 15000):
-            logger.warning(f"Invalid altitude: {data['altitude']}")
-            return False
+        Args:
+            data: 정규화할 데이터
+            
+        Returns:
+            정규화된 데이터 (timestamp 는 int epoch ns)
+        """
+        normalized = data.copy()
+        normalized['timestamp'] = to_epoch_ns(data['timestamp'])
         
-        if not (0 <= data['speed'] <= 1000):
-            logger.warning(f"Invalid speed: {data['speed']}")
-            return False
+        # 값 반올림
+        for field, decimals in NORMALIZE_DECIMALS.items():
+            normalized[field] = round(data[field], decimals)
         
-        if not (0 <= data['heading'] <= 360):
-            logger.warning(f"Invalid heading: {data['heading']}")
-            return False
+        self.processed_count += 1
+        logger.debug("Data normalized: %s", normalized)
         
-        if not (-90 <= data['latitude'] <= 90):
-            logger.warning(f"Invalid latitude: {data['latitude']}")
-            return False
+        return normalized
+    
+    def normalize_columns(
+        self,
+        columns: Dict[str, np.ndarray],
+        out: Optional[Dict[str, np.ndarray]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        컬럼 단위 정규화 (레코드 딕셔너리를 만들지 않는 선택 경로)
         
-        if not (-180 <= data['longitude'] <= 180):
-            logger.warning(f"Invalid longitude: {data['longitude']}")
-            return False
+        반올림은 _round_column 으로 하므로 Python round 를 쓰는 normalize_data 와 결과가 같습니다.
         
-        if not (0 <= data['fuel_level'] <= 100):
-            logger.warning(f"Invalid fuel level: {data['fuel_level']}")
-            return False
+        Args:
+            columns: 'timestamp'와 정규화 필드별 배열
+            out: 반올림 값을 쓸 필드별 float64 배열 (columns 를 넘기면 제자리 정규화, None이면 새 배열)
+            
+        Returns:
+            정규화된 컬럼 (timestamp 는 int64 epoch ns)
+        """
+        normalized = {}
+        timestamps = columns['timestamp']
+        if isinstance(timestamps, np.ndarray) and timestamps.dtype == np.int64:
+            normalized['timestamp'] = timestamps
+        else:
+            normalized['timestamp'] = np.fromiter(
+                (to_epoch_ns(value) for value in timestamps), dtype=np.int64, count=len(timestamps)
+            )
         
-        if not (0 <= data['engine_temp'] <= 1000):
-            logger.warning(f"Invalid engine temperature: {data['engine_temp']}")
-            return False
+        for field, decimals in NORMALIZE_DECIMALS.items():
+            rounded = _round_column(np.asarray(columns[field], dtype=np.float64), decimals)
+            if out is not None:
+                out[field][...] = rounded
+                rounded = out[field]
+            normalized[field] = rounded
         
-        return True
+        self.processed_count += len(normalized['timestamp'])
+        return normalized
     
-    def normalize_data(self, data: Dict) -> Dict:
+    def process_columns(
+        self,
+        columns: Dict[str, np.ndarray],
+        present: Optional[np.ndarray] = None,
+        timestamp_valid: Optional[np.ndarray] = None,
+        in_place: bool = False
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, int]]:
         """
-        데이터 정규화
+        컬럼 단위 검증과 정규화를 한 번에 수행
+        
+        유효한 레코드만 남긴 컬럼을 제자리에서 반올림하므로 컬럼당 배열 하나만 할당합니다.
+        입력 컬럼은 바꾸지 않으므로 BufferSnapshot 의 읽기 전용 뷰도 그대로 넘길 수 있습니다.
         
         Args:
-            data: 정규화할 데이터
+            columns: 'timestamp'와 숫자 필드별 배열
+            present: 필수 필드를 모두 가진 레코드 마스크 (None이면 모두 가짐)
+            timestamp_valid: 타임스탬프 변환 가능 마스크 (None이면 모두 유효)
+            in_place: 모두 유효할 때 쓰기 가능한 float64 입력 컬럼을 제자리 정규화 (할당 없음, 입력이 바뀜)
             
         Returns:
-            정규화된 데이터
+            (유효 레코드의 정규화된 컬럼, 규칙별 거부 수)
         """
-        normalized = data.copy()
+        valid, counts = self.validate_columns(columns, present, timestamp_valid)
+        self.rejections.add(counts)
+        return self._normalize_valid(columns, valid, in_place), counts
+    
+    def process_batch_columns(self, data_list: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        레코드 배치를 컬럼형 결과로 처리 (검증과 정규화를 합친 선택 경로)
         
-        # 값 반올림
-        normalized['altitude'] = round(data['altitude'], 2)
-        normalized['speed'] = round(data['speed'], 2)
-        normalized['heading'] = round(data['heading'], 2)
-        normalized['latitude'] = round(data['latitude'], 6)
-        normalized['longitude'] = round(data['longitude'], 6)
-        normalized['fuel_level'] = round(data['fuel_level'], 2)
-        normalized['engine_temp'] = round(data['engine_temp'], 2)
+        레코드는 컬럼으로 모을 때 한 번만 읽고, 결과는 레코드 딕셔너리 대신 컬럼으로 반환합니다.
+        값은 process_batch 결과와 같습니다.
         
-        self.processed_count += 1
-        logger.debug(f"Data normalized: {normalized}")
+        Args:
+            data_list: 처리할 데이터 리스트
+            
+        Returns:
+            유효 레코드의 정규화된 컬럼 ('aircraft_id'가 스키마 필수 필드이면 식별자 배열 포함)
+        """
+        gathered = self.schema.gather_records(data_list)
+        if gathered is None:
+            # 숫자 배열로 모을 수 없으면 레코드 단위로 검증한 뒤 유효 레코드만 모음
+            valid, counts = self.schema.check_records_mask(data_list)
+            rows = np.flatnonzero(valid)
+            columns = {'timestamp': [data_list[i]['timestamp'] for i in rows]}
+            for field in NORMALIZE_DECIMALS:
+                columns[field] = np.array([data_list[i][field] for i in rows], dtype=np.float64)
+            valid_columns = self.normalize_columns(columns, out=columns)
+        else:
+            valid, counts = self.schema.check_gathered(*gathered)
+            rows = np.flatnonzero(valid)
+            # 모은 배열은 이 함수에서 만든 것이므로 제자리 정규화
+            valid_columns = self._normalize_valid(gathered[0], valid, in_place=True)
+        self._record_rejections(data_list, valid, counts)
         
-        return normalized
+        if 'aircraft_id' in self.schema.required_fields:
+            aircraft_ids = np.empty(len(rows), dtype=object)
+            aircraft_ids[:] = [data_list[i]['aircraft_id'] for i in rows]
+            valid_columns['aircraft_id'] = aircraft_ids
+        
+        rejected = {rule: count for rule, count in counts.items() if count}
+        if rejected:
+            self._rejection_log.warning(f"Skipping {len(data_list) - len(rows)} invalid records: {rejected}")
+        logger.info(f"Processed {len(rows)}/{len(data_list)} records")
+        return valid_columns
+    
+    def _normalize_valid(
+        self,
+        columns: Dict[str, object],
+        valid: np.ndarray,
+        in_place: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """
+        유효 레코드만 남긴 컬럼 정규화
+        
+        유효 레코드를 골라낸 복사본은 제자리에서 반올림하고, 모두 유효해 입력 배열을 그대로 쓰는 경우에는
+        in_place 일 때만 입력에 덮어쓰고 아니면 새 배열에 씁니다.
+        """
+        kept: Dict[str, object] = {}
+        all_valid = bool(valid.all())
+        timestamps = columns['timestamp']
+        if isinstance(timestamps, np.ndarray):
+            kept['timestamp'] = timestamps if all_valid else timestamps[valid]
+        else:
+            kept['timestamp'] = [timestamps[i] for i in np.flatnonzero(valid)]
+        for field in NORMALIZE_DECIMALS:
+            values = np.asarray(columns[field])
+            if not all_valid:
+                values = values[valid]
+            kept[field] = values.astype(np.float64, copy=False)
+        if all_valid and not in_place:
+            return self.normalize_columns(kept)
+        return self.normalize_columns(kept, out=kept)
     
     def filter_outliers(self, data_list: List[Dict], field: str) -> List[Dict]:
         """
@@ -118,16 +497,8 @@ class DataProcessor:
         if not values:
             return data_list
         
-        # Q1, Q3 계산
-        sorted_values = sorted(values)
-        n = len(sorted_values)
-        q1 = sorted_values[n // 4]
-        q3 = sorted_values[(3 * n) // 4]
-        iqr = q3 - q1
-        
-        # 이상치 범위
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
+        # 이상치 범위 (Q1, Q3 는 선택 알고리즘으로 O(n))
+        lower_bound, upper_bound = iqr_bounds(np.asarray(values, dtype=np.float64))
         
         # 필터링
         filtered = [
@@ -141,6 +512,75 @@ class DataProcessor:
         
         return filtered
     
+    def filter_outliers_multi(
+        self,
+        data_list: List[Dict],
+        fields: Optional[Iterable[str]] = None
+    ) -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        여러 필드 동시 이상치 필터링 (IQR 방식)
+        
+        필드마다 전체 데이터로 사분위수를 구해 범위를 정하고, 모든 필드 범위 안에 있는 레코드만 남깁니다.
+        레코드는 복사하지 않고 남는 레코드의 인덱스를 반환합니다.
+        
+        Args:
+            data_list: 데이터 리스트
+            fields: 필터링할 필드명 (None이면 스키마의 숫자 필드 전체)
+            
+        Returns:
+            (남는 레코드 인덱스 배열, 필드별 범위를 벗어난 레코드 수)
+        """
+        fields = tuple(self.schema.number_fields if fields is None else fields)
+        columns = {
+            field: np.array([d.get(field, np.nan) for d in data_list], dtype=np.float64)
+            for field in fields
+        }
+        keep, removed = self.outlier_mask(columns, fields)
+        return np.flatnonzero(keep), removed
+    
+    def outlier_mask(
+        self,
+        columns: Dict[str, np.ndarray],
+        fields: Optional[Iterable[str]] = None
+    ) -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        컬럼 단위 여러 필드 이상치 마스크 (IQR 방식)
+        
+        NaN 은 값이 없는 것으로 보아 사분위수 계산에서 빼고 해당 레코드는 제거합니다.
+        레코드가 4개 미만이거나 값이 하나도 없는 필드는 필터링하지 않습니다 (filter_outliers 와 같음).
+        
+        Args:
+            columns: 필드별 float 배열
+            fields: 필터링할 필드명 (None이면 스키마의 숫자 필드 중 columns 에 있는 것)
+            
+        Returns:
+            (남는 레코드 마스크, 필드별 범위를 벗어난 레코드 수)
+        """
+        if fields is None:
+            fields = [field for field in self.schema.number_fields if field in columns]
+        fields = tuple(fields)
+        n = len(columns[fields[0]]) if fields else 0
+        
+        keep = np.ones(n, dtype=bool)
+        removed = {field: 0 for field in fields}
+        if n < 4:
+            return keep, removed
+        
+        for field in fields:
+            values = columns[field]
+            present = values[~np.isnan(values)]
+            if not len(present):
+                continue
+            lower_bound, upper_bound = iqr_bounds(present)
+            inside = (values >= lower_bound) & (values <= upper_bound)
+            removed[field] = n - int(np.count_nonzero(inside))
+            keep &= inside
+        
+        total = n - int(np.count_nonzero(keep))
+        if total > 0:
+            logger.info(f"Removed {total} outliers: {removed}")
+        return keep, removed
+    
     def calculate_statistics(self, data_list: List[Dict], field: str) -> Dict:
         """
         통계 계산
@@ -157,42 +597,303 @@ class DataProcessor:
         if not values:
             return {}
         
-        stats = {
-            'count': len(values),
-            'mean': statistics.mean(values),
-            'median': statistics.median(values),
-            'min': min(values),
-            'max': max(values)
-        }
-        
-        if len(values) > 1:
-            stats['stdev'] = statistics.stdev(values)
+        # 스케치 크기를 값 개수로 두어 중앙값을 정확히 계산
+        accumulator = OnlineStats(sketch_size=max(2, len(values)))
+        accumulator.update_many(values)
+        stats = accumulator.to_dict()
         
         logger.info(f"Statistics for {field}: {stats}")
         return stats
     
-    def process_batch(self, data_list: List[Dict]) -> List[Dict]:
+    def update_statistics(
+        self,
+        data_list: Iterable[Dict],
+        accumulators: Optional[Dict[str, OnlineStats]] = None,
+        fields: Optional[Iterable[str]] = None,
+        sketch_size: int = DEFAULT_SKETCH_SIZE
+    ) -> Dict[str, OnlineStats]:
+        """
+        필드별 온라인 통계 누적기에 청크 누적
+        
+        청크마다 호출해 한 번에 메모리에 올릴 수 없는 데이터의 통계를 구하고,
+        샤드/프로세스별 결과는 OnlineStats.merge 로 병합합니다.
+        
+        Args:
+            data_list: 누적할 데이터 청크
+            accumulators: 기존 필드별 누적기 (None이면 새로 생성)
+            fields: 누적할 필드명 (None이면 스키마의 숫자 필드 전체)
+            sketch_size: 새 누적기의 분위수 스케치 크기
+            
+        Returns:
+            필드별 누적기 (accumulators 를 넘기면 같은 딕셔너리)
+        """
+        data_list = list(data_list)
+        fields = tuple(self.schema.number_fields if fields is None else fields)
+        if accumulators is None:
+            accumulators = {}
+        for field in fields:
+            accumulator = accumulators.get(field)
+            if accumulator is None:
+                accumulator = accumulators[field] = OnlineStats(sketch_size)
+            accumulator.update_many([d[field] for d in data_list if field in d])
+        return accumulators
+    
+    def calculate_all_statistics(
+        self,
+        data_list: List[Dict],
+        fields: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict]:
+        """
+        여러 필드의 통계를 한 번에 계산
+        
+        레코드를 한 번 훑어 모든 필드를 (레코드 수, 필드 수) 배열로 모은 뒤 column_statistics 로 계산합니다.
+        필드가 없는 레코드나 숫자가 아닌 값이 있으면 필드별로 모으고, 숫자 배열로 모을 수 없는 필드만
+        calculate_statistics 로 계산합니다.
+        
+        Args:
+            data_list: 데이터 리스트
+            fields: 통계를 계산할 필드명 (None이면 스키마의 숫자 필드 전체)
+            
+        Returns:
+            필드별 통계 딕셔너리 (각 값은 calculate_statistics 와 같은 형태)
+        """
+        fields = tuple(self.schema.number_fields if fields is None else fields)
+        columns = self._gather_all_fields(data_list, fields)
+        fallback = []
+        if columns is None:
+            columns = {}
+            for field in fields:
+                values = np.array([d[field] for d in data_list if field in d])
+                if values.dtype.kind in 'biuf' and values.ndim == 1:
+                    columns[field] = values
+                elif len(values):
+                    fallback.append(field)
+                else:
+                    columns[field] = np.empty(0)
+        
+        computed = column_statistics(columns)
+        for field in fallback:
+            computed[field] = self.calculate_statistics(data_list, field)
+        
+        results = {field: computed[field] for field in fields}
+        logger.info(f"Statistics for {len(fields)} fields over {len(data_list)} records")
+        return results
+    
+    @staticmethod
+    def _gather_all_fields(data_list: List[Dict], fields: Tuple[str, ...]) -> Optional[Dict[str, np.ndarray]]:
+        """
+        모든 레코드가 모든 필드를 숫자로 가지면 한 번에 필드별 배열로 모음
+        
+        Args:
+            data_list: 데이터 리스트
+            fields: 필드명
+            
+        Returns:
+            필드별 배열 (필드가 없는 레코드나 숫자가 아닌 값이 있으면 None)
+        """
+        if not fields:
+            return {}
+        try:
+            rows = np.array(list(map(itemgetter(*fields), data_list)))
+        except (KeyError, ValueError):
+            return None
+        if rows.dtype.kind not in 'biuf' or rows.size != len(data_list) * len(fields):
+            return None
+        rows = rows.reshape(len(data_list), len(fields))
+        return {field: rows[:, i] for i, field in enumerate(fields)}
+    
+    def validate_columns(
+        self,
+        columns: Dict[str, np.ndarray],
+        present: Optional[np.ndarray] = None,
+        timestamp_valid: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        컬럼 단위 유효성 검증 (모든 범위 검증을 불리언 마스크로 계산)
+        
+        validate_data 와 같은 순서로 검증하며, 거부된 레코드는 처음 실패한 규칙에 집계됩니다.
+        
+        Args:
+            columns: 숫자 필드별 배열
+            present: 필수 필드를 모두 가진 레코드 마스크 (None이면 모두 가짐)
+            timestamp_valid: 타임스탬프 변환 가능 마스크 (None이면 모두 유효)
+            
+        Returns:
+            (유효 레코드 마스크, 규칙별 거부 수)
+        """
+        field_valid = None if timestamp_valid is None else {'timestamp': timestamp_valid}
+        return self.schema.check_columns(columns, present, field_valid)
+    
+    def validate_batch(self, data_list: List[Dict]) -> Tuple[List[Dict], Dict[str, int]]:
+        """
+        배치 유효성 검증 (레코드를 컬럼으로 모은 뒤 스키마의 컬럼 단위 검증기로 검증)
+        
+        결과는 레코드마다 validate_data 를 호출한 것과 같습니다.
+        
+        Args:
+            data_list: 검증할 데이터 리스트
+            
+        Returns:
+            (유효한 레코드 리스트, 규칙별 거부 수)
+        """
+        valid, counts = self.schema.check_records_mask(data_list)
+        if not any(counts.values()):
+            return list(data_list), counts
+        
+        self._record_rejections(data_list, valid, counts)
+        return [data_list[i] for i in np.flatnonzero(valid)], counts
+    
+    def _record_rejections(self, data_list: List[Dict], valid: np.ndarray, counts: Dict[str, int]):
+        """거부 집계 누적 (표본은 최근 것만 보관하므로 마지막 몇 개만 다시 분류)"""
+        if not any(counts.values()):
+            return
+        rejected = np.flatnonzero(~valid)
+        sample_size = self.rejections.samples.maxlen
+        samples = [
+            (self.schema.check(data_list[i]), data_list[i])
+            for i in rejected[-sample_size:]
+        ] if sample_size else []
+        self.rejections.add(counts, samples)
+    
+    def get_rejection_stats(self) -> Dict:
+        """
+        누적 검증 거부 집계 반환
+        
+        Returns:
+            총 거부 수, 규칙별 거부 수, 최근 거부 표본
+        """
+        return self.rejections.to_dict()
+    
+    def process_batch(
+        self,
+        data_list: List[Dict],
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+        min_parallel_batch: int = DEFAULT_PARALLEL_MIN_BATCH
+    ) -> List[Dict]:
         """
         배치 데이터 처리
         
+        workers 가 2 이상이고 배치가 min_parallel_batch 이상이며 chunk_size 보다 크면 chunk_size 개씩 나눠
+        프로세스 풀에서 검증, 정규화합니다. 작업자가 정규화된 레코드까지 만들어 반환하므로 부모는 결과를
+        입력 순서대로 이어 붙이기만 하며, 결과와 거부 집계, processed_count 는 직렬 처리와 같습니다.
+        작업자 수는 CPU 수를 넘지 않으며, CPU 가 하나이면 직렬 처리합니다.
+        
         Args:
             data_list: 처리할 데이터 리스트
+            workers: 프로세스 수 (None 또는 1이면 직렬 처리)
+            chunk_size: 병렬 처리 시 작업 하나의 레코드 수
+            min_parallel_batch: 병렬 처리를 사용하는 최소 배치 크기
             
         Returns:
-            처리된 데이터 리스트
+            처리된 데이터 리스트 (입력 순서 유지)
         """
-        processed = []
-        
-        for data in data_list:
-            if self.validate_data(data):
-                normalized = self.normalize_data(data)
-                processed.append(normalized)
-            else:
-                logger.warning(f"Skipping invalid data: {data.get('timestamp', 'unknown')}")
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive: {chunk_size}")
         
+        workers = min(workers or 1, os.cpu_count() or 1)
+        if workers > 1 and len(data_list) >= min_parallel_batch and len(data_list) > chunk_size \
+                and self._parallel_capable:
+            processed = self._process_parallel(data_list, workers, chunk_size)
+        else:
+            processed = self._process_chunk(data_list)
         logger.info(f"Processed {len(processed)}/{len(data_list)} records")
         return processed
     
+    def _get_executor(self, workers: int) -> ProcessPoolExecutor:
+        """프로세스 풀 반환 (같은 프로세스 수면 재사용)"""
+        if self._executor is None or self._executor_workers != workers:
+            self.close()
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+            self._executor_workers = workers
+        return self._executor
+    
+    def close(self):
+        """병렬 처리용 프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_workers = 0
+    
+    def _process_parallel(self, data_list: List[Dict], workers: int, chunk_size: int) -> List[Dict]:
+        """청크를 프로세스 풀에서 검증, 정규화하고 입력 순서대로 이어 붙임"""
+        executor = self._get_executor(workers)
+        futures = [
+            executor.submit(_process_records_chunk, self.schema, data_list[start:start + chunk_size])
+            for start in range(0, len(data_list), chunk_size)
+        ]
+        
+        processed: List[Dict] = []
+        masks = []
+        counts = self.schema.empty_counts()
+        for future in futures:
+            valid, chunk_counts, records = future.result()
+            processed.extend(records)
+            masks.append(valid)
+            for rule, count in chunk_counts.items():
+                counts[rule] += count
+        self.processed_count += len(processed)
+        
+        rejected_total = sum(counts.values())
+        if rejected_total:
+            self._record_rejections(data_list, np.concatenate(masks), counts)
+            by_rule = {rule: count for rule, count in counts.items() if count}
+            self._rejection_log.warning(f"Skipping {rejected_total} invalid records: {by_rule}")
+        return processed
+    
+    def _process_chunk(self, data_list: List[Dict]) -> List[Dict]:
+        """청크 검증 및 정규화 (거부 요약은 청크당 한 번, 빈도 제한)"""
+        valid_records, counts = self.validate_batch(data_list)
+        
+        rejected = {rule: count for rule, count in counts.items() if count}
+        if rejected:
+            self._rejection_log.warning(
+                f"Skipping {len(data_list) - len(valid_records)} invalid records: {rejected}"
+            )
+        
+        return [self.normalize_data(data) for data in valid_records]
+    
+    def process_stream(
+        self,
+        records: Iterable[Dict],
+        chunk_size: int = 1000,
+        yield_chunks: bool = False
+    ) -> Iterator[Union[Dict, List[Dict]]]:
+        """
+        레코드 스트림을 지연 처리하는 생성기
+        
+        입력을 chunk_size 개씩 읽어 검증, 정규화하므로 입력 길이와 무관하게 메모리 사용량이 일정합니다.
+        끝이 없는 입력(파일, 소켓 리더)과 FlightAnalyzer 사이에 둘 수 있습니다.
+        
+        Args:
+            records: 레코드 이터러블
+            chunk_size: 마이크로 배치 크기 (1이면 레코드마다 바로 처리)
+            yield_chunks: True이면 처리된 청크 리스트 단위로 생성
+            
+        Yields:
+            처리된 레코드 (yield_chunks 이면 처리된 레코드 리스트)
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive: {chunk_size}")
+        
+        iterator = iter(records)
+        total = 0
+        accepted = 0
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            processed = self._process_chunk(chunk)
+            total += len(chunk)
+            accepted += len(processed)
+            if yield_chunks:
+                if processed:
+                    yield processed
+            else:
+                yield from processed
+        
+        logger.info(f"Processed stream: {accepted}/{total} records")
+    
     def get_processed_count(self) -> int:
         """처리된 데이터 개수 반환"""
         return self.processed_count
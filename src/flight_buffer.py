@@ -0,0 +1,506 @@
+"""
+비행 데이터 버퍼 모듈
+Flight Data Buffer Module
+
+고정 용량의 청크형 컬럼 버퍼로 수집된 비행 데이터를 보관하고, 잠금 없는 불변 스냅샷을 제공합니다.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# 센서 필드 (float64 컬럼으로 저장)
+SENSOR_FIELDS = (
+    'altitude', 'speed', 'heading', 'latitude',
+    'longitude', 'fuel_level', 'engine_temp'
+)
+
+# 기본 버퍼 용량 (레코드 수)
+DEFAULT_BUFFER_CAPACITY = 100_000
+
+# 버퍼 청크 크기 범위 (레코드 수)
+MIN_CHUNK_SIZE = 16
+MAX_CHUNK_SIZE = 4096
+
+# epoch 나노초 타임스탬프 표현 범위 (int64 컬럼에 저장 가능한 범위)
+EPOCH_NS_MIN = int(np.iinfo(np.int64).min)
+EPOCH_NS_MAX = int(np.iinfo(np.int64).max)
+
+# 버퍼 컬럼 (이름, dtype)
+_COLUMN_DTYPES = (('timestamp', np.int64),) + tuple((field, np.float64) for field in SENSOR_FIELDS)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def ns_to_iso(timestamp_ns: int) -> str:
+    """
+    epoch 나노초 타임스탬프를 ISO 8601 문자열로 변환
+
+    Args:
+        timestamp_ns: UTC epoch 기준 나노초
+
+    Returns:
+        ISO 8601 문자열 (마이크로초 정밀도)
+    """
+    return (_EPOCH + timedelta(microseconds=int(timestamp_ns) // 1000)).isoformat()
+
+
+def to_epoch_ns(value: Union[int, str, datetime]) -> int:
+    """
+    타임스탬프 값을 epoch 나노초로 변환
+
+    내부 레코드는 정수 타임스탬프를 사용하고, 외부 입력(ISO 문자열, datetime)만 변환합니다.
+
+    Args:
+        value: epoch 나노초 정수, ISO 8601 문자열 또는 datetime
+
+    Returns:
+        UTC epoch 기준 나노초
+
+    Raises:
+        TypeError: 지원하지 않는 타입인 경우
+        ValueError: 형식이 잘못되었거나 int64 범위를 벗어난 경우
+    """
+    if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+        timestamp_ns = int(value)
+    elif isinstance(value, str):
+        timestamp_ns = iso_to_ns(value)
+    elif isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        timestamp_ns = (value - _EPOCH) // timedelta(microseconds=1) * 1000
+    else:
+        raise TypeError(f"Unsupported timestamp type: {type(value).__name__}")
+    if not EPOCH_NS_MIN <= timestamp_ns <= EPOCH_NS_MAX:
+        raise ValueError(f"Timestamp out of int64 epoch ns range: {value}")
+    return timestamp_ns
+
+
+def serialize_record(record: Dict) -> Dict:
+    """
+    레코드를 직렬화용으로 변환 (정수 타임스탬프를 ISO 문자열로)
+
+    Args:
+        record: 레코드 딕셔너리
+
+    Returns:
+        타임스탬프가 ISO 문자열인 레코드 (변환이 필요 없으면 원본)
+    """
+    timestamp = record.get('timestamp')
+    if isinstance(timestamp, (int, np.integer)) and not isinstance(timestamp, bool):
+        record = dict(record)
+        record['timestamp'] = ns_to_iso(timestamp)
+    return record
+
+
+def serialize_records(records: Iterable[Dict]) -> List[Dict]:
+    """
+    레코드 리스트를 직렬화용으로 변환
+
+    Args:
+        records: 레코드 딕셔너리들
+
+    Returns:
+        타임스탬프가 ISO 문자열인 레코드 리스트
+    """
+    return [serialize_record(record) for record in records]
+
+
+def iso_to_ns(timestamp: str) -> int:
+    """
+    ISO 8601 문자열을 epoch 나노초 타임스탬프로 변환
+
+    Args:
+        timestamp: ISO 8601 문자열 (시간대가 없으면 UTC로 간주)
+
+    Returns:
+        UTC epoch 기준 나노초
+    """
+    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+class BufferSnapshot:
+    """
+    버퍼의 특정 시점 불변 뷰
+
+    스냅샷 생성은 청크 참조만 보관하므로 O(1)이며, 이후의 추가나 제거는 스냅샷에 영향을 주지 않습니다.
+    """
+
+    __slots__ = ('aircraft_id', 'chunk_size', 'total_appended', '_chunks', '_offset', '_size')
+
+    def __init__(self, aircraft_id: str, chunk_size: int, chunks: tuple = (),
+                 offset: int = 0, size: int = 0, total_appended: int = 0):
+        """
+        Args:
+            aircraft_id: 항공기 식별자
+            chunk_size: 청크당 레코드 수
+            chunks: 오래된 순서의 청크 (필드명별 배열 딕셔너리)
+            offset: 첫 청크에서 가장 오래된 레코드의 위치
+            size: 레코드 수
+            total_appended: 스냅샷 시점까지 추가된 누적 레코드 수
+        """
+        self.aircraft_id = aircraft_id
+        self.chunk_size = chunk_size
+        self.total_appended = total_appended
+        self._chunks = chunks
+        self._offset = offset
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def oldest_sequence(self) -> int:
+        """가장 오래된 레코드의 순번 (0부터 시작하는 누적 번호)"""
+        return self.total_appended - self._size
+
+    def _pieces(self, skip: int, stop: int):
+        """논리 구간 [skip, stop) 을 (청크, 시작, 끝) 조각으로 분할"""
+        position = self._offset + skip
+        end = self._offset + stop
+        while position < end:
+            index, begin = divmod(position, self.chunk_size)
+            count = min(end - position, self.chunk_size - begin)
+            yield self._chunks[index], begin, begin + count
+            position += count
+
+    def _slice_columns(self, skip: int, stop: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        논리 구간 [skip, stop) 의 컬럼 딕셔너리
+
+        구간이 한 청크 안에 있으면 복사하지 않고 읽기 전용 뷰를 반환합니다.
+        """
+        if stop is None:
+            stop = self._size
+        pieces = list(self._pieces(skip, max(skip, stop)))
+        columns = {}
+        for name, dtype in _COLUMN_DTYPES:
+            if not pieces:
+                columns[name] = np.empty(0, dtype=dtype)
+            elif len(pieces) == 1:
+                chunk, begin, end = pieces[0]
+                view = chunk[name][begin:end]
+                view.flags.writeable = False
+                columns[name] = view
+            else:
+                columns[name] = np.concatenate([chunk[name][begin:end] for chunk, begin, end in pieces])
+        return columns
+
+    def _search(self, timestamp_ns: int, side: str = 'left') -> int:
+        """
+        타임스탬프의 논리 위치 탐색 (타임스탬프가 오름차순으로 추가된 경우)
+
+        청크별 마지막 값으로 건너뛴 뒤 한 청크 안에서만 이진 탐색하므로 복사하지 않습니다.
+        """
+        position = 0
+        for chunk, begin, end in self._pieces(0, self._size):
+            timestamps = chunk['timestamp'][begin:end]
+            last = timestamps[-1]
+            if last < timestamp_ns or (side == 'right' and last == timestamp_ns):
+                position += end - begin
+                continue
+            return position + int(np.searchsorted(timestamps, timestamp_ns, side))
+        return position
+
+    def to_columns(self, since: Optional[int] = None, until: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        스냅샷 내용을 컬럼 딕셔너리로 반환
+
+        Args:
+            since: 이 순번 이후의 레코드만 반환 (None이면 전체)
+            until: 이 순번 이전의 레코드만 반환, 미포함 (None이면 끝까지)
+
+        Returns:
+            'timestamp'(int64 epoch ns)와 센서 필드별 배열
+        """
+        skip = 0
+        if since is not None:
+            skip = min(max(0, since - self.oldest_sequence), self._size)
+        stop = None
+        if until is not None:
+            stop = min(max(0, until - self.oldest_sequence), self._size)
+        return self._slice_columns(skip, stop)
+
+    def tail(self, limit: int) -> Dict[str, np.ndarray]:
+        """
+        마지막 limit 개 레코드를 컬럼 딕셔너리로 반환 (나머지 청크는 읽지 않음)
+
+        Args:
+            limit: 최대 레코드 수
+
+        Returns:
+            'timestamp'(int64 epoch ns)와 센서 필드별 배열
+        """
+        return self._slice_columns(max(0, self._size - max(0, limit)))
+
+    def time_range(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        시간 구간 [start_ns, end_ns) 의 레코드를 컬럼 딕셔너리로 반환
+
+        Args:
+            start_ns: 시작 epoch 나노초 (None이면 처음부터)
+            end_ns: 종료 epoch 나노초, 미포함 (None이면 끝까지)
+
+        Returns:
+            'timestamp'(int64 epoch ns)와 센서 필드별 배열
+        """
+        skip = 0 if start_ns is None else self._search(start_ns, 'left')
+        stop = self._size if end_ns is None else self._search(end_ns, 'left')
+        return self._slice_columns(skip, stop)
+
+    def to_records(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        스냅샷 내용을 레코드 딕셔너리 리스트로 반환
+
+        Args:
+            limit: 마지막 limit 개만 반환 (None이면 전체)
+
+        Returns:
+            오래된 순서의 레코드 리스트
+        """
+        columns = self.to_columns() if limit is None else self.tail(limit)
+        return columns_to_records(columns, self.aircraft_id)
+
+
+class FlightDataBuffer:
+    """
+    고정 용량 청크형 컬럼 버퍼 (가장 오래된 데이터부터 제거)
+
+    레코드는 고정 크기 청크에 기록되고, 한 번 기록된 위치는 다시 쓰지 않습니다.
+    쓰기는 버퍼 잠금으로 직렬화하고, 쓰기마다 새 스냅샷을 게시하므로 읽기는 잠금 없이 O(1)입니다.
+    """
+
+    def __init__(self, aircraft_id: str, capacity: int = DEFAULT_BUFFER_CAPACITY,
+                 chunk_size: Optional[int] = None):
+        """
+        Args:
+            aircraft_id: 항공기 식별자
+            capacity: 최대 보관 레코드 수
+            chunk_size: 청크당 레코드 수 (None이면 용량에 맞춰 자동 결정)
+        """
+        if capacity <= 0:
+            raise ValueError(f"Buffer capacity must be positive: {capacity}")
+        if chunk_size is None:
+            chunk_size = min(MAX_CHUNK_SIZE, max(MIN_CHUNK_SIZE, capacity // 16))
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive: {chunk_size}")
+
+        self.aircraft_id = aircraft_id
+        self.capacity = capacity
+        self.chunk_size = chunk_size
+        # 쓰기 잠금 (읽기는 게시된 스냅샷을 사용하므로 잠그지 않음)
+        self._write_lock = threading.Lock()
+        self._snapshot = BufferSnapshot(aircraft_id, chunk_size)
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    @property
+    def total_appended(self) -> int:
+        """누적 추가 레코드 수"""
+        return self._snapshot.total_appended
+
+    @property
+    def oldest_sequence(self) -> int:
+        """버퍼에 남아 있는 가장 오래된 레코드의 순번 (0부터 시작하는 누적 번호)"""
+        return self._snapshot.oldest_sequence
+
+    @property
+    def nbytes(self) -> int:
+        """버퍼가 점유하는 메모리 크기 (바이트, 최대 capacity + 2 * chunk_size 레코드)"""
+        return sum(array.nbytes for chunk in self._snapshot._chunks for array in chunk.values())
+
+    def snapshot(self) -> BufferSnapshot:
+        """
+        현재 내용의 불변 스냅샷 반환 (복사 없음)
+
+        Returns:
+            버퍼 스냅샷
+        """
+        return self._snapshot
+
+    def _new_chunk(self) -> Dict[str, np.ndarray]:
+        """빈 청크 할당"""
+        return {name: np.empty(self.chunk_size, dtype=dtype) for name, dtype in _COLUMN_DTYPES}
+
+    def _publish(self, chunks: tuple, offset: int, size: int, appended: int):
+        """
+        기록 후 새 스냅샷 게시 (쓰기 잠금 안에서 호출)
+
+        용량을 넘는 오래된 레코드를 제거하고, 모두 제거된 청크는 목록에서 뺍니다.
+        """
+        previous = self._snapshot
+        overflow = max(0, size - self.capacity)
+        offset += overflow
+        size -= overflow
+        dropped, offset = divmod(offset, self.chunk_size)
+        if dropped:
+            chunks = chunks[dropped:]
+        self._snapshot = BufferSnapshot(
+            self.aircraft_id, self.chunk_size, chunks, offset, size,
+            previous.total_appended + appended
+        )
+
+    def append(self, timestamp_ns: int, values: Dict[str, float]):
+        """
+        레코드 하나 추가
+
+        Args:
+            timestamp_ns: epoch 나노초 타임스탬프
+            values: 센서 필드 값 딕셔너리
+        """
+        with self._write_lock:
+            current = self._snapshot
+            chunks = current._chunks
+            index, pos = divmod(current._offset + current._size, self.chunk_size)
+            if index == len(chunks):
+                chunks = chunks + (self._new_chunk(),)
+            chunk = chunks[index]
+            chunk['timestamp'][pos] = timestamp_ns
+            for field in SENSOR_FIELDS:
+                chunk[field][pos] = values[field]
+            self._publish(chunks, current._offset, current._size + 1, 1)
+
+    def extend(self, timestamps: np.ndarray, columns: Dict[str, np.ndarray]):
+        """
+        여러 레코드를 컬럼 단위로 추가
+
+        Args:
+            timestamps: epoch 나노초 타임스탬프 배열
+            columns: 센서 필드별 값 배열
+        """
+        n = len(timestamps)
+        if n == 0:
+            return
+
+        sources = {'timestamp': np.asarray(timestamps, dtype=np.int64)}
+        for field in SENSOR_FIELDS:
+            sources[field] = np.asarray(columns[field], dtype=np.float64)
+
+        # 용량보다 많으면 마지막 capacity 개만 남음
+        skip = max(0, n - self.capacity)
+
+        with self._write_lock:
+            current = self._snapshot
+            offset, size = current._offset, current._size
+            chunks = current._chunks
+            if skip:
+                # 기존 레코드는 모두 밀려나므로 새 청크부터 기록
+                chunks, offset, size = (), 0, 0
+
+            written = skip
+            while written < n:
+                index, pos = divmod(offset + size + written - skip, self.chunk_size)
+                if index == len(chunks):
+                    chunks = chunks + (self._new_chunk(),)
+                count = min(n - written, self.chunk_size - pos)
+                chunk = chunks[index]
+                for name, source in sources.items():
+                    chunk[name][pos:pos + count] = source[written:written + count]
+                written += count
+
+            self._publish(chunks, offset, size + n - skip, n)
+
+    def to_columns(self, since: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        버퍼 내용을 컬럼 딕셔너리로 반환
+
+        Args:
+            since: 이 순번 이후의 레코드만 반환 (None이면 전체)
+
+        Returns:
+            'timestamp'(int64 epoch ns)와 센서 필드별 배열
+        """
+        return self._snapshot.to_columns(since)
+
+    def tail(self, limit: int) -> Dict[str, np.ndarray]:
+        """
+        마지막 limit 개 레코드를 컬럼 딕셔너리로 반환
+
+        Args:
+            limit: 최대 레코드 수
+
+        Returns:
+            'timestamp'(int64 epoch ns)와 센서 필드별 배열
+        """
+        return self._snapshot.tail(limit)
+
+    def time_range(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        시간 구간 [start_ns, end_ns) 의 레코드를 컬럼 딕셔너리로 반환
+
+        Args:
+            start_ns: 시작 epoch 나노초 (None이면 처음부터)
+            end_ns: 종료 epoch 나노초, 미포함 (None이면 끝까지)
+
+        Returns:
+            'timestamp'(int64 epoch ns)와 센서 필드별 배열
+        """
+        return self._snapshot.time_range(start_ns, end_ns)
+
+    def to_records(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        버퍼 내용을 레코드 딕셔너리 리스트로 반환
+
+        Args:
+            limit: 마지막 limit 개만 반환 (None이면 전체)
+
+        Returns:
+            오래된 순서의 레코드 리스트
+        """
+        return self._snapshot.to_records(limit)
+
+    def clear(self):
+        """버퍼 초기화 (기존 스냅샷은 그대로 유지)"""
+        with self._write_lock:
+            current = self._snapshot
+            self._snapshot = BufferSnapshot(
+                self.aircraft_id, self.chunk_size, total_appended=current.total_appended
+            )
+
+
+def columns_to_records(columns: Dict[str, np.ndarray], aircraft_id: Union[str, Sequence[str]],
+                       limit: Optional[int] = None, iso_timestamps: bool = False) -> List[Dict]:
+    """
+    컬럼 딕셔너리를 레코드 딕셔너리 리스트로 변환
+
+    Args:
+        columns: 'timestamp'와 센서 필드별 배열
+        aircraft_id: 전체 레코드의 항공기 식별자 또는 레코드별 식별자 시퀀스
+        limit: 마지막 limit 개만 변환 (None이면 전체)
+        iso_timestamps: 타임스탬프를 ISO 문자열로 변환할지 여부 (직렬화용)
+
+    Returns:
+        레코드 리스트 (기본적으로 타임스탬프는 int epoch ns)
+    """
+    start = 0
+    if limit is not None:
+        start = max(0, len(columns['timestamp']) - limit)
+
+    timestamps = columns['timestamp'][start:].tolist()
+    if iso_timestamps:
+        timestamps = [ns_to_iso(timestamp_ns) for timestamp_ns in timestamps]
+    values = [columns[field][start:].tolist() for field in SENSOR_FIELDS]
+    if isinstance(aircraft_id, str):
+        aircraft_ids = [aircraft_id] * len(timestamps)
+    else:
+        aircraft_ids = list(aircraft_id)[start:]
+
+    records = []
+    for i, timestamp in enumerate(timestamps):
+        record = {'timestamp': timestamp, 'aircraft_id': aircraft_ids[i]}
+        for field, column in zip(SENSOR_FIELDS, values):
+            record[field] = column[i]
+        records.append(record)
+    return records
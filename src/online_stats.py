@@ -0,0 +1,306 @@
+"""
+온라인 통계 모듈
+Online Statistics Module
+
+한 번에 메모리에 올릴 수 없는 데이터의 통계를 레코드 또는 청크 단위로 누적하고,
+샤드/프로세스별 누적기를 병합합니다.
+"""
+
+import logging
+import math
+import random
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# 분위수 스케치 기본 크기 (클수록 정확, 순위 오차는 대략 1/k)
+DEFAULT_SKETCH_SIZE = 200
+
+
+class QuantileSketch:
+    """
+    병합 가능한 스트리밍 분위수 스케치 (KLL 방식)
+
+    레벨 h 의 값은 가중치 2^h 를 가지며, 레벨이 용량을 넘으면 정렬 후 하나 건너 하나씩
+    다음 레벨로 올립니다. 메모리는 O(k log(n / k)) 이고, 압축이 일어나지 않은 동안(n <= k)은 정확합니다.
+    """
+
+    def __init__(self, k: int = DEFAULT_SKETCH_SIZE, seed: int = 0):
+        """
+        Args:
+            k: 최상위 레벨 용량
+            seed: 압축 시 선택 오프셋 난수 시드
+        """
+        if k < 2:
+            raise ValueError(f"Sketch size must be at least 2: {k}")
+
+        self.k = k
+        self.count = 0
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._pending: List[float] = []
+        self._random = random.Random(seed)
+
+    @property
+    def is_exact(self) -> bool:
+        """압축 없이 모든 값을 보관 중인지 여부"""
+        return len(self._levels) == 1
+
+    @property
+    def retained(self) -> int:
+        """보관 중인 값 수"""
+        return sum(len(level) for level in self._levels) + len(self._pending)
+
+    def update(self, value: float):
+        """
+        값 하나 추가
+
+        Args:
+            value: 추가할 값
+        """
+        self._pending.append(value)
+        self.count += 1
+        if len(self._pending) >= self.k:
+            self._flush()
+
+    def update_many(self, values: Iterable[float]):
+        """
+        여러 값 추가
+
+        Args:
+            values: 추가할 값 배열
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if not len(values):
+            return
+        self._flush()
+        self._levels[0] = np.concatenate((self._levels[0], values))
+        self.count += len(values)
+        self._compress()
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        다른 스케치를 병합 (자기 자신을 갱신)
+
+        Args:
+            other: 병합할 스케치
+
+        Returns:
+            자기 자신
+        """
+        self._flush()
+        other._flush()
+        for height, level in enumerate(other._levels):
+            if height == len(self._levels):
+                self._levels.append(np.empty(0))
+            self._levels[height] = np.concatenate((self._levels[height], level))
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _flush(self):
+        """개별 추가된 값을 레벨 0 으로 이동"""
+        if self._pending:
+            self._levels[0] = np.concatenate((self._levels[0], self._pending))
+            self._pending = []
+            self._compress()
+
+    def _capacity(self, height: int) -> int:
+        """레벨별 용량 (위 레벨일수록 큼)"""
+        depth = len(self._levels) - height - 1
+        return max(2, int(math.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self):
+        """용량을 넘는 레벨을 압축"""
+        height = 0
+        while height < len(self._levels):
+            level = self._levels[height]
+            if len(level) > self._capacity(height):
+                if height + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                level = np.sort(level)
+                # 홀수 개면 마지막 값은 현재 레벨에 남김
+                keep = level[-1:] if len(level) % 2 else level[:0]
+                paired = level[:len(level) - len(keep)]
+                promoted = paired[self._random.randint(0, 1)::2]
+                self._levels[height] = keep
+                self._levels[height + 1] = np.concatenate((self._levels[height + 1], promoted))
+            height += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        분위수 추정
+
+        스케치가 정확한 동안에는 선형 보간 분위수(중앙값은 statistics.median 과 같음)를 반환합니다.
+
+        Args:
+            q: 0 ~ 1 사이 분위
+
+        Returns:
+            분위수 (값이 없으면 NaN)
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"Quantile must be between 0 and 1: {q}")
+        self._flush()
+        if self.count == 0:
+            return float('nan')
+        if self.is_exact:
+            return float(np.quantile(self._levels[0], q))
+
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(len(level), 2 ** height, dtype=np.int64) for height, level in enumerate(self._levels)
+        ])
+        order = np.argsort(values, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        index = int(np.searchsorted(cumulative, q * cumulative[-1], side='left'))
+        return float(values[order[min(index, len(order) - 1)]])
+
+
+class OnlineStats:
+    """
+    병합 가능한 온라인 통계 누적기
+
+    평균/분산은 Welford 방식으로 누적하고 청크와 누적기 병합은 Chan 의 병합식을 사용하므로,
+    어떤 순서로 나누어 누적해도 같은 결과(부동소수점 오차 범위)를 얻습니다.
+    """
+
+    def __init__(self, sketch_size: int = DEFAULT_SKETCH_SIZE, seed: int = 0):
+        """
+        Args:
+            sketch_size: 분위수 스케치 크기 (값 개수 이상이면 중앙값이 정확)
+            seed: 분위수 스케치 난수 시드
+        """
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.sketch = QuantileSketch(sketch_size, seed)
+
+    def update(self, value: float):
+        """
+        값 하나 누적 (O(1))
+
+        Args:
+            value: 누적할 값
+        """
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.sketch.update(value)
+
+    def update_many(self, values: Iterable[float]):
+        """
+        청크 누적 (청크 통계를 NumPy 로 계산한 뒤 병합)
+
+        Args:
+            values: 누적할 값 배열
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        n = len(values)
+        if not n:
+            return
+        mean = float(values.mean())
+        m2 = float(np.square(values - mean).sum())
+        self._combine(n, mean, m2, float(values.min()), float(values.max()))
+        self.sketch.update_many(values)
+
+    def merge(self, other: 'OnlineStats') -> 'OnlineStats':
+        """
+        다른 누적기를 병합 (자기 자신을 갱신)
+
+        Args:
+            other: 병합할 누적기
+
+        Returns:
+            자기 자신
+        """
+        if other.count:
+            self._combine(other.count, other.mean, other._m2, other.min, other.max)
+            self.sketch.merge(other.sketch)
+        return self
+
+    def _combine(self, n: int, mean: float, m2: float, minimum: float, maximum: float):
+        """(개수, 평균, 편차 제곱합, 최소, 최대) 요약을 병합"""
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, minimum)
+        self.max = max(self.max, maximum)
+
+    @property
+    def variance(self) -> float:
+        """표본 분산 (값이 2개 미만이면 NaN)"""
+        return self._m2 / (self.count - 1) if self.count > 1 else float('nan')
+
+    @property
+    def stdev(self) -> float:
+        """표본 표준편차 (값이 2개 미만이면 NaN)"""
+        return math.sqrt(self.variance) if self.count > 1 else float('nan')
+
+    def quantile(self, q: float) -> float:
+        """
+        분위수 추정
+
+        Args:
+            q: 0 ~ 1 사이 분위
+
+        Returns:
+            분위수
+        """
+        return self.sketch.quantile(q)
+
+    @property
+    def median(self) -> float:
+        """중앙값 (스케치가 정확하면 정확한 값)"""
+        return self.quantile(0.5)
+
+    def to_dict(self) -> Dict:
+        """
+        통계 딕셔너리 반환 (DataProcessor.calculate_statistics 와 같은 형태)
+
+        Returns:
+            count/mean/median/min/max 와 값이 2개 이상이면 stdev (값이 없으면 빈 딕셔너리)
+        """
+        if not self.count:
+            return {}
+        stats = {
+            'count': self.count,
+            'mean': self.mean,
+            'median': self.median,
+            'min': self.min,
+            'max': self.max
+        }
+        if self.count > 1:
+            stats['stdev'] = self.stdev
+        return stats
+
+
+def merge_all(accumulators: Iterable[OnlineStats], sketch_size: Optional[int] = None) -> OnlineStats:
+    """
+    여러 누적기를 새 누적기 하나로 병합
+
+    Args:
+        accumulators: 병합할 누적기들
+        sketch_size: 결과 스케치 크기 (None이면 기본값)
+
+    Returns:
+        병합된 누적기
+    """
+    merged = OnlineStats(sketch_size or DEFAULT_SKETCH_SIZE)
+    for accumulator in accumulators:
+        merged.merge(accumulator)
+    return merged
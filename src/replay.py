@@ -0,0 +1,329 @@
+"""
+비행 로그 재생 모듈
+Flight Log Replay Module
+
+기록된 비행 로그를 DataProcessor → FlightAnalyzer 파이프라인에 재생합니다.
+부하 시험, 운영 장애 재현, 하드웨어 산정에 사용합니다.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import re
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    from .flight_buffer import SENSOR_FIELDS, to_epoch_ns
+    from .storage import COLUMNAR_EXTENSION, iter_json_lines, open_columnar
+    from .data_processor import DataProcessor
+    from .analyzer import FlightAnalyzer
+except ImportError:  # src/ 에서 직접 실행하는 경우 (api_server.py)
+    from flight_buffer import SENSOR_FIELDS, to_epoch_ns
+    from storage import COLUMNAR_EXTENSION, iter_json_lines, open_columnar
+    from data_processor import DataProcessor
+    from analyzer import FlightAnalyzer
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# 재생 단계 (처리 순서)
+REPLAY_STAGES = ('ingest', 'process', 'analyze')
+
+# JSON 배열 원소 사이의 공백과 쉼표
+_JSON_SEPARATOR = re.compile(r'[\s,]*')
+
+
+def iter_json_array(path: str, read_size: int = 1 << 16) -> Iterator[Dict]:
+    """
+    JSON 배열 파일을 전체를 읽지 않고 원소 단위로 생성
+
+    Args:
+        path: JSON 배열 파일 경로 (save_to_file 형식)
+        read_size: 한 번에 읽을 문자 수
+
+    Yields:
+        레코드 딕셔너리
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = f.read(read_size).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f"Expected a JSON array: {path}")
+        position = 1
+
+        while True:
+            position = _JSON_SEPARATOR.match(buffer, position).end()
+            if position < len(buffer) and buffer[position] == ']':
+                return
+            try:
+                if position >= len(buffer):
+                    raise json.JSONDecodeError("Need more data", buffer, position)
+                record, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # 원소가 청크 경계에 걸친 경우 남은 부분에 이어서 더 읽기
+                chunk = f.read(read_size)
+                if not chunk:
+                    raise ValueError(f"Invalid or truncated JSON array: {path}") from None
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            yield record
+
+
+def iter_csv(path: str) -> Iterator[Dict]:
+    """
+    CSV 로그를 한 줄씩 읽어 레코드 생성
+
+    Args:
+        path: 헤더 행이 있는 CSV 파일 경로
+
+    Yields:
+        센서 필드가 float 로 변환된 레코드 딕셔너리
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            record: Dict = dict(row)
+            timestamp = record.get('timestamp', '')
+            if timestamp.isdigit():
+                record['timestamp'] = int(timestamp)
+            for field in SENSOR_FIELDS:
+                if record.get(field) not in (None, ''):
+                    record[field] = float(record[field])
+            yield record
+
+
+def iter_flight_log(path: str) -> Iterator[Dict]:
+    """
+    확장자에 따라 비행 로그를 스트리밍으로 읽기
+
+    Args:
+        path: .json, .jsonl/.ndjson, .csv 또는 .fdcol 파일 경로
+
+    Returns:
+        레코드 딕셔너리 이터레이터
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.jsonl', '.ndjson'):
+        return iter_json_lines(path)
+    if extension == '.json':
+        return iter_json_array(path)
+    if extension == '.csv':
+        return iter_csv(path)
+    if extension == COLUMNAR_EXTENSION:
+        return open_columnar(path).iter_records()
+    raise ValueError(f"Unsupported flight log format: {path}")
+
+
+class ReplayStats:
+    """재생 결과 통계"""
+
+    def __init__(self):
+        self.records_read = 0
+        self.records_processed = 0
+        self.anomaly_count = 0
+        self.elapsed_seconds = 0.0
+        # 단계별 소요 시간
+        self.stage_seconds = {stage: 0.0 for stage in REPLAY_STAGES}
+        # 단계별 지연: 레코드의 예정 시각(가능한 빨리 모드에서는 읽은 시각) 대비 단계 완료 시각
+        self._lag_total = {stage: 0.0 for stage in REPLAY_STAGES}
+        self._lag_max = {stage: 0.0 for stage in REPLAY_STAGES}
+        self._lag_count = {stage: 0 for stage in REPLAY_STAGES}
+
+    @property
+    def records_per_second(self) -> float:
+        """달성 처리량 (레코드/초)"""
+        return self.records_read / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def record_lag(self, stage: str, completed_at: float, due_times: List[float]):
+        """
+        단계 지연 기록
+
+        Args:
+            stage: 단계 이름
+            completed_at: 단계 완료 시각
+            due_times: 해당 레코드들의 예정 시각
+        """
+        if not due_times:
+            return
+        self._lag_total[stage] += completed_at * len(due_times) - sum(due_times)
+        self._lag_max[stage] = max(self._lag_max[stage], completed_at - min(due_times))
+        self._lag_count[stage] += len(due_times)
+
+    def lag(self, stage: str) -> Dict[str, float]:
+        """
+        단계 지연 요약
+
+        Args:
+            stage: 단계 이름
+
+        Returns:
+            평균/최대 지연 (초)
+        """
+        count = self._lag_count[stage]
+        return {
+            'mean': self._lag_total[stage] / count if count else 0.0,
+            'max': self._lag_max[stage]
+        }
+
+    def to_dict(self) -> Dict:
+        """통계 딕셔너리 반환"""
+        return {
+            'records_read': self.records_read,
+            'records_processed': self.records_processed,
+            'records_rejected': self.records_read - self.records_processed,
+            'anomaly_count': self.anomaly_count,
+            'elapsed_seconds': round(self.elapsed_seconds, 6),
+            'records_per_second': round(self.records_per_second, 2),
+            'stage_seconds': {stage: round(v, 6) for stage, v in self.stage_seconds.items()},
+            'stage_lag_seconds': {
+                stage: {k: round(v, 6) for k, v in self.lag(stage).items()}
+                for stage in REPLAY_STAGES
+            }
+        }
+
+
+class FlightLogReplayer:
+    """기록된 비행 로그 재생 엔진"""
+
+    def __init__(
+        self,
+        processor: Optional[DataProcessor] = None,
+        analyzer: Optional[FlightAnalyzer] = None,
+        speed: Optional[float] = 1.0,
+        chunk_size: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            processor: 데이터 처리기 (None이면 새로 생성)
+            analyzer: 분석기 (None이면 새로 생성)
+            speed: 재생 배속 (1.0 = 실시간, N = N배속, None 또는 0 = 가능한 빨리)
+            chunk_size: 한 번에 처리할 최대 레코드 수 (메모리 상한)
+            clock: 시계 함수 (초)
+            sleep: 대기 함수
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive: {chunk_size}")
+        if speed is not None and speed < 0:
+            raise ValueError(f"Replay speed must be non-negative: {speed}")
+
+        self.processor = processor or DataProcessor()
+        self.analyzer = analyzer or FlightAnalyzer()
+        self.speed = speed or None
+        self.chunk_size = chunk_size
+        self._clock = clock
+        self._sleep = sleep
+
+    def replay(
+        self,
+        source: Union[str, Iterable[Dict]],
+        on_chunk: Optional[Callable[[List[Dict]], None]] = None
+    ) -> ReplayStats:
+        """
+        비행 로그 재생
+
+        Args:
+            source: 로그 파일 경로 또는 레코드 이터러블
+            on_chunk: 처리된 청크를 받을 콜백 (선택)
+
+        Returns:
+            재생 통계
+        """
+        records = iter_flight_log(source) if isinstance(source, str) else iter(source)
+        stats = ReplayStats()
+
+        start_wall = self._clock()
+        first_event_ns: Optional[int] = None
+        pending: List[Dict] = []
+        due_times: List[float] = []
+
+        while True:
+            read_start = self._clock()
+            record = next(records, None)
+            read_end = self._clock()
+            stats.stage_seconds['ingest'] += read_end - read_start
+            if record is None:
+                break
+            stats.records_read += 1
+
+            due = read_end
+            event_ns = None
+            if self.speed is not None:
+                try:
+                    event_ns = to_epoch_ns(record['timestamp'])
+                except (KeyError, TypeError, ValueError):
+                    # 시각이 없거나 잘못된 레코드는 대기 없이 넘겨 처리 단계에서 거부 집계
+                    pass
+            if event_ns is not None:
+                if first_event_ns is None:
+                    first_event_ns = event_ns
+                due = start_wall + (event_ns - first_event_ns) / 1e9 / self.speed
+
+                if due > read_end:
+                    # 아직 예정 시각 전이면 밀린 레코드를 먼저 처리한 뒤 대기
+                    self._flush(pending, due_times, stats, on_chunk)
+                    pending, due_times = [], []
+                    wait = due - self._clock()
+                    if wait > 0:
+                        self._sleep(wait)
+
+            stats.record_lag('ingest', max(self._clock(), due), [due])
+            pending.append(record)
+            due_times.append(due)
+
+            if len(pending) >= self.chunk_size:
+                self._flush(pending, due_times, stats, on_chunk)
+                pending, due_times = [], []
+
+        self._flush(pending, due_times, stats, on_chunk)
+        stats.elapsed_seconds = self._clock() - start_wall
+
+        logger.info(f"Replay finished: {stats.to_dict()}")
+        return stats
+
+    def _flush(self, pending: List[Dict], due_times: List[float], stats: ReplayStats,
+               on_chunk: Optional[Callable[[List[Dict]], None]]):
+        """대기 중인 청크를 처리 및 분석"""
+        if not pending:
+            return
+
+        started = self._clock()
+        processed = self.processor.process_batch(pending)
+        finished = self._clock()
+        stats.stage_seconds['process'] += finished - started
+        stats.record_lag('process', finished, due_times)
+        stats.records_processed += len(processed)
+
+        started = finished
+        if processed:
+            stats.anomaly_count += self.analyzer.detect_anomalies_batch(processed).record_count
+        finished = self._clock()
+        stats.stage_seconds['analyze'] += finished - started
+        stats.record_lag('analyze', finished, due_times)
+
+        if on_chunk is not None:
+            on_chunk(processed)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="Replay a recorded flight log")
+    parser.add_argument('path', help="flight log (.json, .jsonl, .csv, .fdcol)")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="replay speed multiplier (0 = as fast as possible)")
+    parser.add_argument('--chunk-size', type=int, default=1000, help="records per processing chunk")
+    args = parser.parse_args()
+
+    replayer = FlightLogReplayer(speed=args.speed, chunk_size=args.chunk_size)
+    stats = replayer.replay(args.path)
+    print(json.dumps(stats.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
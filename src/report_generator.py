@@ -10,6 +10,11 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    from .flight_buffer import serialize_record, serialize_records
+except ImportError:  # src/ 에서 직접 실행하는 경우 (api_server.py)
+    from flight_buffer import serialize_record, serialize_records
+
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -188,7 +193,7 @@ class ReportGenerator:
         
         html = f'<p>총 {len(anomalies)}개의 이상 패턴이 탐지되었습니다.</p>'
         
-        for anomaly in anomalies:
+        for anomaly in map(serialize_record, anomalies):
             html += f'''
             <div class="anomaly">
                 <strong>시각:</strong> {anomaly.get('timestamp', 'N/A')}<br>
@@ -260,7 +265,7 @@ class ReportGenerator:
             'generated_at': datetime.now().isoformat(),
             'analysis': analysis,
             'risk_assessment': risk_assessment,
-            'anomalies': anomalies
+            'anomalies': serialize_records(anomalies)
         }
         
         try:
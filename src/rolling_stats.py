@@ -0,0 +1,313 @@
+"""
+이동 윈도우 통계 모듈
+Rolling Window Statistics Module
+
+항공기별, 필드별로 이벤트 시각 기준 이동 윈도우(1분, 5분, 1시간 등)의 평균/최소/최대/표준편차를
+윈도우를 다시 훑지 않고 유지합니다.
+"""
+
+import heapq
+import logging
+import math
+from collections import deque
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from .flight_buffer import SENSOR_FIELDS, to_epoch_ns
+except ImportError:  # src/ 에서 직접 실행하는 경우 (api_server.py)
+    from flight_buffer import SENSOR_FIELDS, to_epoch_ns
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# 기본 윈도우 (이름 → 초)
+DEFAULT_WINDOWS = {'1m': 60.0, '5m': 300.0, '1h': 3600.0}
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+class SlidingWindow:
+    """
+    한 항공기의 이벤트 시각 이동 윈도우 (여러 필드)
+
+    샘플은 시각 순서로 추가되어야 합니다 (순서 보정은 RollingStats 가 담당).
+    평균/분산은 추가와 제거를 모두 Welford 방식으로 갱신하고, 최소/최대는 단조 덱으로 유지하므로
+    추가와 만료는 분할 상환 O(1), 조회는 O(1) 입니다.
+    """
+
+    def __init__(self, window_ns: int, fields: Tuple[str, ...]):
+        """
+        Args:
+            window_ns: 윈도우 길이 (나노초)
+            fields: 집계할 필드명
+        """
+        self.window_ns = window_ns
+        self.fields = fields
+        self._entries: deque = deque()
+        self._mean = [0.0] * len(fields)
+        self._m2 = [0.0] * len(fields)
+        self._minimums = [deque() for _ in fields]
+        self._maximums = [deque() for _ in fields]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, timestamp_ns: int, values: Tuple[float, ...]):
+        """
+        샘플 추가 후 윈도우 밖으로 나간 샘플 만료
+
+        Args:
+            timestamp_ns: 이벤트 시각 (이전 샘플 이상)
+            values: fields 순서의 값
+        """
+        self._entries.append((timestamp_ns, values))
+        n = len(self._entries)
+        for i, value in enumerate(values):
+            delta = value - self._mean[i]
+            self._mean[i] += delta / n
+            self._m2[i] += delta * (value - self._mean[i])
+
+            minimums = self._minimums[i]
+            while minimums and minimums[-1][1] >= value:
+                minimums.pop()
+            minimums.append((timestamp_ns, value))
+            maximums = self._maximums[i]
+            while maximums and maximums[-1][1] <= value:
+                maximums.pop()
+            maximums.append((timestamp_ns, value))
+        self.expire(timestamp_ns)
+
+    def expire(self, now_ns: int):
+        """
+        (now_ns - 윈도우 길이) 이하 시각의 샘플 제거
+
+        Args:
+            now_ns: 윈도우 끝 시각
+        """
+        cutoff = now_ns - self.window_ns
+        entries = self._entries
+        while entries and entries[0][0] <= cutoff:
+            _, values = entries.popleft()
+            n = len(entries)
+            for i, value in enumerate(values):
+                if n == 0:
+                    self._mean[i] = 0.0
+                    self._m2[i] = 0.0
+                    continue
+                delta = value - self._mean[i]
+                self._mean[i] -= delta / n
+                self._m2[i] = max(0.0, self._m2[i] - delta * (value - self._mean[i]))
+        for extremes in (self._minimums, self._maximums):
+            for monotonic in extremes:
+                while monotonic and monotonic[0][0] <= cutoff:
+                    monotonic.popleft()
+
+    def stats(self, field: str) -> Dict:
+        """
+        필드 통계 (DataProcessor.calculate_statistics 와 같은 키, 중앙값 제외)
+
+        Args:
+            field: 필드명
+
+        Returns:
+            count/mean/min/max 와 값이 2개 이상이면 stdev (샘플이 없으면 빈 딕셔너리)
+        """
+        n = len(self._entries)
+        if not n:
+            return {}
+        i = self.fields.index(field)
+        stats = {
+            'count': n,
+            'mean': self._mean[i],
+            'min': self._minimums[i][0][1],
+            'max': self._maximums[i][0][1]
+        }
+        if n > 1:
+            stats['stdev'] = math.sqrt(self._m2[i] / (n - 1))
+        return stats
+
+
+class _AircraftWindows:
+    """항공기 하나의 순서 보정 버퍼와 윈도우들"""
+
+    def __init__(self, windows: Dict[str, int], fields: Tuple[str, ...]):
+        self.windows = {name: SlidingWindow(window_ns, fields) for name, window_ns in windows.items()}
+        self.pending: List[Tuple[int, int, Tuple[float, ...]]] = []
+        self.max_seen = None
+        self.watermark = None
+
+
+class RollingStats:
+    """
+    항공기별, 필드별 이벤트 시각 이동 윈도우 통계
+
+    샘플은 항공기별 순서 보정 버퍼(힙)에 들어갔다가, 항공기의 최신 이벤트 시각에서 허용 지연을 뺀
+    워터마크를 지나면 시각 순서대로 윈도우에 반영됩니다. 워터마크보다 늦게 도착한 샘플은 버리고 집계합니다.
+    허용 지연이 0 이면 도착 즉시 반영되고, 0 보다 크면 조회 결과는 워터마크 시점까지의 윈도우입니다.
+    """
+
+    def __init__(
+        self,
+        windows: Optional[Dict[str, float]] = None,
+        fields: Iterable[str] = SENSOR_FIELDS,
+        allowed_lateness_s: float = 0.0
+    ):
+        """
+        Args:
+            windows: 윈도우 이름별 길이 (초, None이면 DEFAULT_WINDOWS)
+            fields: 집계할 필드명
+            allowed_lateness_s: 순서가 뒤바뀐 샘플을 기다리는 허용 지연 (초)
+        """
+        windows = DEFAULT_WINDOWS if windows is None else windows
+        if not windows:
+            raise ValueError("At least one window is required")
+        for name, seconds in windows.items():
+            if seconds <= 0:
+                raise ValueError(f"Window length must be positive: {name}={seconds}")
+        if allowed_lateness_s < 0:
+            raise ValueError(f"Allowed lateness must not be negative: {allowed_lateness_s}")
+
+        self.windows = {name: int(round(seconds * _NS_PER_SECOND)) for name, seconds in windows.items()}
+        self.fields = tuple(fields)
+        self.lateness_ns = int(round(allowed_lateness_s * _NS_PER_SECOND))
+        self.late_dropped = 0
+        self._aircraft: Dict[str, _AircraftWindows] = {}
+        self._sequence = count()
+
+    def _state(self, aircraft_id: str) -> _AircraftWindows:
+        """항공기 상태 반환 (없으면 생성)"""
+        state = self._aircraft.get(aircraft_id)
+        if state is None:
+            state = self._aircraft[aircraft_id] = _AircraftWindows(self.windows, self.fields)
+        return state
+
+    def update(self, aircraft_id: str, timestamp: Union[int, str], values: Dict[str, float]) -> bool:
+        """
+        샘플 하나 반영 (분할 상환 O(1))
+
+        Args:
+            aircraft_id: 항공기 식별자
+            timestamp: 이벤트 시각 (epoch ns 또는 ISO 문자열)
+            values: 필드별 값 (집계 필드를 모두 포함)
+
+        Returns:
+            반영 여부 (허용 지연보다 늦게 도착해 버린 경우 False)
+        """
+        timestamp_ns = to_epoch_ns(timestamp)
+        state = self._state(aircraft_id)
+        if state.watermark is not None and timestamp_ns < state.watermark:
+            self.late_dropped += 1
+            return False
+
+        sample = tuple(float(values[field]) for field in self.fields)
+        if self.lateness_ns == 0 and (state.max_seen is None or timestamp_ns >= state.max_seen):
+            # 순서대로 도착한 샘플은 버퍼를 거치지 않음
+            state.max_seen = state.watermark = timestamp_ns
+            for window in state.windows.values():
+                window.add(timestamp_ns, sample)
+            return True
+
+        heapq.heappush(state.pending, (timestamp_ns, next(self._sequence), sample))
+        if state.max_seen is None or timestamp_ns > state.max_seen:
+            state.max_seen = timestamp_ns
+        self._release(state, state.max_seen - self.lateness_ns)
+        return True
+
+    def update_record(self, record: Dict) -> bool:
+        """
+        레코드 딕셔너리 하나 반영
+
+        Args:
+            record: 'aircraft_id', 'timestamp'와 집계 필드를 가진 레코드
+
+        Returns:
+            반영 여부
+        """
+        return self.update(record['aircraft_id'], record['timestamp'], record)
+
+    def update_columns(self, aircraft_id: str, columns: Dict[str, np.ndarray]) -> int:
+        """
+        한 항공기의 컬럼 배치 반영 (FlightDataBuffer.to_columns 결과 등)
+
+        Args:
+            aircraft_id: 항공기 식별자
+            columns: 'timestamp'(int64 epoch ns)와 집계 필드별 배열
+
+        Returns:
+            반영된 샘플 수
+        """
+        timestamps = columns['timestamp'].tolist()
+        values = [columns[field].tolist() for field in self.fields]
+        accepted = 0
+        for i, timestamp_ns in enumerate(timestamps):
+            sample = {field: column[i] for field, column in zip(self.fields, values)}
+            accepted += self.update(aircraft_id, timestamp_ns, sample)
+        return accepted
+
+    def _release(self, state: _AircraftWindows, watermark: int):
+        """워터마크 이하 시각의 버퍼 샘플을 시각 순서대로 윈도우에 반영"""
+        pending = state.pending
+        while pending and pending[0][0] <= watermark:
+            timestamp_ns, _, sample = heapq.heappop(pending)
+            for window in state.windows.values():
+                window.add(timestamp_ns, sample)
+        if state.watermark is None or watermark > state.watermark:
+            state.watermark = watermark
+
+    def advance(self, now: Union[int, str]):
+        """
+        모든 항공기의 윈도우를 현재 시각까지 진행 (샘플이 끊긴 항공기의 만료용)
+
+        Args:
+            now: 현재 이벤트 시각 (epoch ns 또는 ISO 문자열)
+        """
+        now_ns = to_epoch_ns(now)
+        for state in self._aircraft.values():
+            self._release(state, now_ns - self.lateness_ns)
+            for window in state.windows.values():
+                window.expire(state.watermark)
+
+    def get(self, aircraft_id: str, window: str, field: str) -> Dict:
+        """
+        윈도우 통계 조회 (O(1))
+
+        Args:
+            aircraft_id: 항공기 식별자
+            window: 윈도우 이름 (예: '1m')
+            field: 필드명
+
+        Returns:
+            count/mean/min/max/stdev 딕셔너리 (샘플이 없으면 빈 딕셔너리)
+        """
+        if window not in self.windows:
+            raise KeyError(f"Unknown window: {window}")
+        if field not in self.fields:
+            raise KeyError(f"Unknown field: {field}")
+        state = self._aircraft.get(aircraft_id)
+        if state is None:
+            return {}
+        return state.windows[window].stats(field)
+
+    def summary(self, aircraft_id: str) -> Dict[str, Dict[str, Dict]]:
+        """
+        항공기의 모든 윈도우, 필드 통계
+
+        Args:
+            aircraft_id: 항공기 식별자
+
+        Returns:
+            {윈도우 이름: {필드명: 통계}}
+        """
+        return {
+            window: {field: self.get(aircraft_id, window, field) for field in self.fields}
+            for window in self.windows
+        }
+
+    def get_aircraft_ids(self) -> List[str]:
+        """추적 중인 항공기 식별자 목록"""
+        return list(self._aircraft)
@@ -0,0 +1,137 @@
+"""
+센서 드라이버 모듈
+Sensor Driver Module
+
+비동기(asyncio) 센서 드라이버와 동시 읽기 기능을 제공합니다.
+"""
+
+import abc
+import asyncio
+import logging
+import math
+import random
+from typing import Awaitable, Callable, Dict, Optional, Union
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SensorDriver(abc.ABC):
+    """센서 드라이버 기본 클래스 (read 코루틴 구현 필요)"""
+
+    @abc.abstractmethod
+    async def read(self) -> float:
+        """
+        센서 값 읽기
+
+        Returns:
+            센서 측정값
+        """
+
+
+class SimulatedSensorDriver(SensorDriver):
+    """하드웨어 대신 사용하는 시뮬레이션 센서 드라이버"""
+
+    def __init__(self, low: float, high: float, latency: float = 0.0, seed: Optional[int] = None):
+        """
+        Args:
+            low: 측정값 최소
+            high: 측정값 최대
+            latency: 읽기 지연 시간 (초, 버스 I/O 대기 모사)
+            seed: 난수 시드
+        """
+        self.low = low
+        self.high = high
+        self.latency = latency
+        self._random = random.Random(seed)
+
+    async def read(self) -> float:
+        """범위 내 난수 값 읽기"""
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return self._random.uniform(self.low, self.high)
+
+
+# 드라이버 객체 또는 인자 없는 코루틴 함수
+DriverLike = Union[SensorDriver, Callable[[], Awaitable[float]]]
+
+
+class AsyncSensorReader:
+    """여러 센서를 동시에 읽는 클래스 (샘플 지연 = 가장 느린 센서의 지연)"""
+
+    def __init__(
+        self,
+        drivers: Dict[str, DriverLike],
+        timeout: float = 1.0,
+        timeouts: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            drivers: 필드명별 센서 드라이버
+            timeout: 센서별 기본 읽기 제한 시간 (초)
+            timeouts: 필드명별 읽기 제한 시간 (지정하지 않은 센서는 timeout 사용)
+        """
+        self._reads = {
+            field: driver.read if isinstance(driver, SensorDriver) else driver
+            for field, driver in drivers.items()
+        }
+        self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        self.timeout_counts: Dict[str, int] = {field: 0 for field in drivers}
+        self.error_counts: Dict[str, int] = {field: 0 for field in drivers}
+
+    @property
+    def fields(self):
+        """읽는 필드명 목록"""
+        return list(self._reads)
+
+    async def _read_one(self, field: str) -> float:
+        """센서 하나 읽기 (제한 시간 초과나 오류 시 NaN)"""
+        try:
+            value = await asyncio.wait_for(self._reads[field](), self.timeouts.get(field, self.timeout))
+            return float(value)
+        except asyncio.TimeoutError:
+            self.timeout_counts[field] += 1
+            logger.warning(f"Sensor read timed out: {field}")
+        except Exception as e:
+            self.error_counts[field] += 1
+            logger.error(f"Sensor read failed: {field}: {e}")
+        return math.nan
+
+    async def read_all(self) -> Dict[str, float]:
+        """
+        모든 센서를 동시에 읽기
+
+        Returns:
+            필드명별 측정값 (읽지 못한 센서는 NaN)
+        """
+        fields = list(self._reads)
+        values = await asyncio.gather(*(self._read_one(field) for field in fields))
+        return dict(zip(fields, values))
+
+    def read_all_sync(self) -> Dict[str, float]:
+        """
+        이벤트 루프 밖에서 모든 센서를 동시에 읽기
+
+        Returns:
+            필드명별 측정값
+        """
+        return asyncio.run(self.read_all())
+
+
+def create_simulated_drivers(ranges: Dict[str, tuple], latency: float = 0.0) -> Dict[str, SensorDriver]:
+    """
+    센서 범위로부터 시뮬레이션 드라이버 생성
+
+    Args:
+        ranges: 필드명별 (최소, 최대)
+        latency: 드라이버별 읽기 지연 시간 (초)
+
+    Returns:
+        필드명별 시뮬레이션 드라이버
+    """
+    return {
+        field: SimulatedSensorDriver(low, high, latency)
+        for field, (low, high) in ranges.items()
+    }
@@ -0,0 +1,258 @@
+"""
+비행 궤적 시뮬레이터 모듈
+Flight Trajectory Simulator Module
+
+벤치마크용으로 재현 가능하고 물리적으로 그럴듯한 다수 항공기의 연속 궤적을 생성합니다.
+"""
+
+import logging
+import time
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+try:
+    from .analyzer import EARTH_RADIUS_KM
+    from .flight_buffer import SENSOR_FIELDS, columns_to_records
+except ImportError:  # src/ 에서 직접 실행하는 경우 (api_server.py)
+    from analyzer import EARTH_RADIUS_KM
+    from flight_buffer import SENSOR_FIELDS, columns_to_records
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# 비행 단계 코드
+PHASE_CLIMB = 0
+PHASE_CRUISE = 1
+PHASE_DESCENT = 2
+PHASE_NAMES = ('CLIMB', 'CRUISE', 'DESCENT')
+
+
+class TrajectorySimulator:
+    """시드 고정 다수 항공기 궤적 시뮬레이터 (모든 항공기를 벡터 연산으로 한 번에 갱신)"""
+
+    # 단계별 연료 소모율 (%/h, 항공기별 계수를 곱함)
+    FUEL_BURN_RATES = np.array([14.0, 7.0, 3.0])
+    # 단계별 기준 엔진 온도 (°C)
+    ENGINE_TEMPS = np.array([690.0, 580.0, 430.0])
+    # 이륙/착륙 속도 (km/h)
+    GROUND_SPEED = 280.0
+
+    def __init__(
+        self,
+        n_aircraft: int,
+        seed: int = 0,
+        sample_interval_s: float = 1.0,
+        start_ns: Optional[int] = None,
+        aircraft_prefix: str = "SIM"
+    ):
+        """
+        Args:
+            n_aircraft: 항공기 수
+            seed: 난수 시드 (같은 시드는 같은 궤적을 생성)
+            sample_interval_s: 샘플 간격 (초)
+            start_ns: 시작 시각 epoch 나노초 (None이면 현재 시각)
+            aircraft_prefix: 항공기 식별자 접두사
+        """
+        if n_aircraft <= 0:
+            raise ValueError(f"Aircraft count must be positive: {n_aircraft}")
+        if sample_interval_s <= 0:
+            raise ValueError(f"Sample interval must be positive: {sample_interval_s}")
+
+        self.n_aircraft = n_aircraft
+        self.sample_interval_s = sample_interval_s
+        self.aircraft_ids: List[str] = [f"{aircraft_prefix}-{i:05d}" for i in range(n_aircraft)]
+        self._interval_ns = int(round(sample_interval_s * 1e9))
+        self._next_ns = time.time_ns() if start_ns is None else int(start_ns)
+        self._rng = np.random.default_rng(seed)
+
+        rng = self._rng
+        n = n_aircraft
+
+        # 항공기별 고정 성능
+        self.cruise_altitude = rng.uniform(9000.0, 12000.0, n)
+        self.cruise_speed = rng.uniform(750.0, 900.0, n)
+        self.climb_rate = rng.uniform(8.0, 15.0, n)        # m/s
+        self.descent_rate = rng.uniform(5.0, 10.0, n)      # m/s
+        self.burn_factor = rng.uniform(0.8, 1.2, n)
+
+        # 항공기별 상태 (시작 단계를 섞어 다양한 상황을 포함)
+        self.phase = rng.integers(0, 3, n).astype(np.int8)
+        self.altitude = np.where(
+            self.phase == PHASE_CRUISE,
+            self.cruise_altitude,
+            rng.uniform(0.0, 1.0, n) * self.cruise_altitude
+        )
+        self.cruise_remaining_s = rng.uniform(3600.0, 6 * 3600.0, n)
+        self.fuel_level = rng.uniform(60.0, 100.0, n)
+        self.latitude = rng.uniform(-60.0, 60.0, n)
+        self.longitude = rng.uniform(-180.0, 180.0, n)
+        self.heading = rng.uniform(0.0, 360.0, n)
+        self.speed = self._target_speed()
+        self.engine_temp = self.ENGINE_TEMPS[self.phase].copy()
+
+    def _target_speed(self) -> np.ndarray:
+        """단계와 고도에 따른 목표 속도 (km/h)"""
+        ratio = np.clip(self.altitude / self.cruise_altitude, 0.0, 1.0)
+        transition = self.GROUND_SPEED + (self.cruise_speed - self.GROUND_SPEED) * ratio
+        return np.where(self.phase == PHASE_CRUISE, self.cruise_speed, transition)
+
+    def _advance(self):
+        """모든 항공기 상태를 샘플 간격만큼 진행"""
+        dt = self.sample_interval_s
+        rng = self._rng
+        n = self.n_aircraft
+
+        climbing = self.phase == PHASE_CLIMB
+        cruising = self.phase == PHASE_CRUISE
+        descending = self.phase == PHASE_DESCENT
+
+        # 고도 및 단계 전환
+        self.altitude = np.where(climbing, self.altitude + self.climb_rate * dt, self.altitude)
+        self.altitude = np.where(descending, self.altitude - self.descent_rate * dt, self.altitude)
+        self.cruise_remaining_s = np.where(cruising, self.cruise_remaining_s - dt, self.cruise_remaining_s)
+
+        reached_cruise = climbing & (self.altitude >= self.cruise_altitude)
+        self.altitude = np.where(reached_cruise, self.cruise_altitude, self.altitude)
+        self.phase[reached_cruise] = PHASE_CRUISE
+
+        start_descent = cruising & (self.cruise_remaining_s <= 0)
+        self.phase[start_descent] = PHASE_DESCENT
+
+        # 착륙 후 재급유하고 새 구간 시작 (연료는 구간 내에서 단조 감소)
+        landed = descending & (self.altitude <= 0)
+        if landed.any():
+            count = int(landed.sum())
+            self.altitude[landed] = 0.0
+            self.phase[landed] = PHASE_CLIMB
+            self.fuel_level[landed] = rng.uniform(80.0, 100.0, count)
+            self.cruise_remaining_s[landed] = rng.uniform(3600.0, 6 * 3600.0, count)
+            self.heading[landed] = rng.uniform(0.0, 360.0, count)
+
+        # 속도, 엔진 온도, 방향 잡음을 한 번에 생성
+        noise = rng.standard_normal((3, n))
+
+        # 속도와 연료
+        self.speed = np.clip(self._target_speed() + 2.0 * noise[0], 0.0, 990.0)
+        burn = self.FUEL_BURN_RATES[self.phase] * self.burn_factor * (dt / 3600.0)
+        self.fuel_level = np.maximum(self.fuel_level - burn, 0.0)
+        self.engine_temp = self.ENGINE_TEMPS[self.phase] + 5.0 * noise[1]
+
+        # 방향은 완만하게 변하고, 위치는 방향과 속도를 따라 대권 항로로 이동
+        self.heading = np.mod(self.heading + 0.2 * dt * noise[2], 360.0)
+        self.latitude, self.longitude = destination_point(
+            self.latitude, self.longitude, self.heading, self.speed * (dt / 3600.0)
+        )
+
+    def step(self) -> Dict[str, np.ndarray]:
+        """
+        한 샘플 간격 진행 후 모든 항공기의 샘플 반환
+
+        Returns:
+            'timestamp', 'aircraft_index', 'phase'와 센서 필드별 배열 (길이 n_aircraft)
+        """
+        self._advance()
+        columns = {
+            'timestamp': np.full(self.n_aircraft, self._next_ns, dtype=np.int64),
+            'aircraft_index': np.arange(self.n_aircraft, dtype=np.int32),
+            'phase': self.phase.copy(),
+        }
+        for field in SENSOR_FIELDS:
+            columns[field] = getattr(self, field).copy()
+        self._next_ns += self._interval_ns
+        return columns
+
+    def generate(self, n_steps: int) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        n_steps 간격 동안의 샘플을 간격 단위로 생성
+
+        Args:
+            n_steps: 진행할 샘플 간격 수
+
+        Yields:
+            간격별 컬럼 딕셔너리
+        """
+        for _ in range(n_steps):
+            yield self.step()
+
+    def generate_batch(self, n_steps: int) -> Dict[str, np.ndarray]:
+        """
+        n_steps 간격의 샘플을 시간 순(간격 → 항공기)으로 이어 붙인 컬럼 반환
+
+        Args:
+            n_steps: 진행할 샘플 간격 수
+
+        Returns:
+            길이 n_steps * n_aircraft 의 컬럼 딕셔너리
+        """
+        steps = list(self.generate(n_steps))
+        if not steps:
+            return {
+                'timestamp': np.empty(0, dtype=np.int64),
+                'aircraft_index': np.empty(0, dtype=np.int32),
+                'phase': np.empty(0, dtype=np.int8),
+                **{field: np.empty(0) for field in SENSOR_FIELDS}
+            }
+        return {name: np.concatenate([step[name] for step in steps]) for name in steps[0]}
+
+    def to_records(self, columns: Dict[str, np.ndarray]) -> List[Dict]:
+        """
+        시뮬레이터 컬럼을 레코드 딕셔너리 리스트로 변환
+
+        Args:
+            columns: step/generate_batch 결과
+
+        Returns:
+            레코드 리스트
+        """
+        ids = np.asarray(self.aircraft_ids, dtype=object)[columns['aircraft_index']].tolist()
+        return columns_to_records(columns, ids)
+
+
+def destination_point(latitude: np.ndarray, longitude: np.ndarray,
+                      bearing: np.ndarray, distance_km: np.ndarray):
+    """
+    시작점에서 방위각과 거리만큼 이동한 대권 항로상의 위치 계산
+
+    Args:
+        latitude: 시작 위도 (도)
+        longitude: 시작 경도 (도)
+        bearing: 방위각 (도)
+        distance_km: 이동 거리 (km)
+
+    Returns:
+        (위도, 경도) 배열 튜플, 경도는 [-180, 180) 범위
+    """
+    lat1 = np.radians(latitude)
+    lon1 = np.radians(longitude)
+    theta = np.radians(bearing)
+    delta = np.asarray(distance_km) / EARTH_RADIUS_KM
+
+    sin_lat2 = np.sin(lat1) * np.cos(delta) + np.cos(lat1) * np.sin(delta) * np.cos(theta)
+    lat2 = np.arcsin(np.clip(sin_lat2, -1.0, 1.0))
+    lon2 = lon1 + np.arctan2(
+        np.sin(theta) * np.sin(delta) * np.cos(lat1),
+        np.cos(delta) - np.sin(lat1) * sin_lat2
+    )
+
+    longitude2 = np.mod(np.degrees(lon2) + 180.0, 360.0) - 180.0
+    return np.degrees(lat2), longitude2
+
+
+def main():
+    """메인 함수"""
+    simulator = TrajectorySimulator(n_aircraft=1000, seed=42)
+
+    start = time.perf_counter()
+    columns = simulator.generate_batch(1000)
+    elapsed = time.perf_counter() - start
+
+    samples = len(columns['timestamp'])
+    print(f"Generated {samples} samples in {elapsed:.3f}s ({samples / elapsed:,.0f} samples/s)")
+    print(f"Sample: {simulator.to_records({k: v[:1] for k, v in columns.items()})[0]}")
+
+
+if __name__ == "__main__":
+    main()
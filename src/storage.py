@@ -0,0 +1,430 @@
+"""
+데이터 저장 모듈
+Data Storage Module
+
+수집된 비행 데이터를 파일로 저장하고 다시 읽어옵니다.
+"""
+
+import json
+import logging
+import os
+import struct
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+try:
+    from .flight_buffer import SENSOR_FIELDS, columns_to_records, to_epoch_ns
+except ImportError:  # src/ 에서 직접 실행하는 경우 (api_server.py)
+    from flight_buffer import SENSOR_FIELDS, columns_to_records, to_epoch_ns
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class JsonLinesWriter:
+    """추가 전용 JSON Lines 기록기 (fsync 배치 및 크기 기반 파일 회전 지원)"""
+
+    def __init__(self, path: str, fsync_every: int = 0, max_bytes: int = 0, backup_count: int = 5):
+        """
+        Args:
+            path: 기록할 파일 경로
+            fsync_every: fsync 간격 (레코드 수, 0이면 fsync 하지 않음)
+            max_bytes: 파일 회전 기준 크기 (바이트, 0이면 회전하지 않음)
+            backup_count: 보관할 회전 파일 수 (path.1 ~ path.N)
+        """
+        self.path = path
+        self.fsync_every = fsync_every
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._file = None
+        self._size = 0
+        self._unsynced = 0
+
+    def _open(self):
+        """파일을 추가 모드로 열기"""
+        self._file = open(self.path, 'ab')
+        self._size = self._file.seek(0, os.SEEK_END)
+
+    def write_records(self, records: Iterable[Dict]) -> int:
+        """
+        레코드를 파일 끝에 추가
+
+        Args:
+            records: 기록할 레코드
+
+        Returns:
+            기록된 레코드 수
+        """
+        if self._file is None:
+            self._open()
+
+        written = 0
+        for record in records:
+            line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+            if self.max_bytes and self._size and self._size + len(line) > self.max_bytes:
+                self.rotate()
+
+            self._file.write(line)
+            self._size += len(line)
+            self._unsynced += 1
+            written += 1
+
+            if self.fsync_every and self._unsynced >= self.fsync_every:
+                self._sync()
+
+        # tail 등 다른 프로세스가 바로 읽을 수 있도록 버퍼 비우기
+        self._file.flush()
+        return written
+
+    def _sync(self):
+        """OS 버퍼를 디스크에 기록"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def rotate(self):
+        """현재 파일을 path.1 로 옮기고 새 파일 시작"""
+        if self._file is not None:
+            if self.fsync_every:
+                self._sync()
+            self._file.close()
+            self._file = None
+
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{i}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{i + 1}")
+            if os.path.exists(self.path):
+                os.replace(self.path, f"{self.path}.1")
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+
+        logger.info(f"Rotated data file: {self.path}")
+        self._open()
+
+    def close(self):
+        """파일 닫기"""
+        if self._file is None:
+            return
+        if self.fsync_every and self._unsynced:
+            self._sync()
+        self._file.close()
+        self._file = None
+
+
+def rotated_files(path: str) -> List[str]:
+    """
+    회전된 파일을 포함한 파일 목록 반환
+
+    Args:
+        path: 기준 파일 경로
+
+    Returns:
+        오래된 순서의 파일 경로 리스트 (path.N, ..., path.1, path)
+    """
+    backups = []
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        backups.append(f"{path}.{index}")
+        index += 1
+
+    files = list(reversed(backups))
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def iter_json_lines(path: str, include_rotated: bool = False) -> Iterator[Dict]:
+    """
+    JSON Lines 파일을 한 줄씩 읽어 레코드 생성
+
+    Args:
+        path: 읽을 파일 경로
+        include_rotated: 회전된 파일(path.N ... path.1)을 먼저 읽을지 여부
+
+    Yields:
+        레코드 딕셔너리
+    """
+    files = rotated_files(path) if include_rotated else [path]
+
+    for file_path in files:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    # 마지막 줄이 기록 도중 잘린 경우 등
+                    logger.error(f"Invalid JSON at {file_path}:{line_number}: {e}")
+                    raise
+
+
+def load_json_lines(path: str, include_rotated: bool = False, limit: Optional[int] = None) -> List[Dict]:
+    """
+    JSON Lines 파일에서 레코드 리스트 읽기
+
+    Args:
+        path: 읽을 파일 경로
+        include_rotated: 회전된 파일 포함 여부
+        limit: 최대 레코드 수 (None이면 전체)
+
+    Returns:
+        레코드 리스트
+    """
+    records = []
+    for record in iter_json_lines(path, include_rotated):
+        if limit is not None and len(records) >= limit:
+            break
+        records.append(record)
+    return records
+
+
+# 컬럼형 바이너리 형식
+# [매직 8바이트][헤더 길이 uint32 LE][헤더 JSON][패딩][컬럼 배열 ...]
+# 각 컬럼은 64바이트 경계에 정렬된 연속 배열이며, aircraft_id 는 헤더의 사전에 대한 int32 코드입니다.
+COLUMNAR_EXTENSION = '.fdcol'
+COLUMNAR_MAGIC = b'FDCOL\x00\x01\n'
+_COLUMNAR_ALIGNMENT = 64
+_COLUMNAR_WRITE_CHUNK = 1 << 20
+_COLUMNAR_DTYPES = [('timestamp', '<i8'), ('aircraft_id', '<i4')] + [(f, '<f8') for f in SENSOR_FIELDS]
+
+
+def _align(offset: int) -> int:
+    """정렬 경계로 올림"""
+    return -(-offset // _COLUMNAR_ALIGNMENT) * _COLUMNAR_ALIGNMENT
+
+
+def _columnar_layout(rows: int, aircraft_ids: List[str]):
+    """헤더 바이트와 데이터 시작 위치, 컬럼별 (dtype, 절대 오프셋) 계산"""
+    descriptors = []
+    offset = 0
+    for name, dtype in _COLUMNAR_DTYPES:
+        descriptors.append({'name': name, 'dtype': dtype, 'offset': offset})
+        offset = _align(offset + rows * np.dtype(dtype).itemsize)
+
+    header = json.dumps({
+        'version': 1,
+        'rows': rows,
+        'columns': descriptors,
+        'aircraft_ids': aircraft_ids
+    }, ensure_ascii=False).encode('utf-8')
+
+    data_start = _align(len(COLUMNAR_MAGIC) + 4 + len(header))
+    layout = {d['name']: (np.dtype(d['dtype']), data_start + d['offset']) for d in descriptors}
+    return header, data_start, layout, data_start + offset
+
+
+def _write_columnar_header(f, header: bytes, data_start: int):
+    """매직, 헤더, 패딩 기록"""
+    f.write(COLUMNAR_MAGIC)
+    f.write(struct.pack('<I', len(header)))
+    f.write(header)
+    f.write(b'\x00' * (data_start - len(COLUMNAR_MAGIC) - 4 - len(header)))
+
+
+def write_columnar(path: str, columns: Dict[str, np.ndarray], aircraft_id: Union[str, Sequence[str]]):
+    """
+    컬럼 데이터를 바이너리 컬럼형 파일로 저장
+
+    Args:
+        path: 저장할 파일 경로
+        columns: 'timestamp'(int64 epoch ns)와 센서 필드별 배열
+        aircraft_id: 전체 레코드의 항공기 식별자 또는 레코드별 식별자 시퀀스
+    """
+    rows = len(columns['timestamp'])
+
+    if isinstance(aircraft_id, str):
+        aircraft_ids = [aircraft_id]
+        codes = np.zeros(rows, dtype='<i4')
+    else:
+        unique, inverse = np.unique(np.asarray(aircraft_id, dtype=object).astype(str), return_inverse=True)
+        aircraft_ids = unique.tolist()
+        codes = inverse.astype('<i4')
+
+    header, data_start, layout, total_size = _columnar_layout(rows, aircraft_ids)
+
+    try:
+        with open(path, 'wb') as f:
+            _write_columnar_header(f, header, data_start)
+            for name, (dtype, offset) in layout.items():
+                array = codes if name == 'aircraft_id' else columns[name]
+                f.seek(offset)
+                # memmap 입력도 전체를 메모리에 올리지 않도록 구간별로 기록
+                for start in range(0, rows, _COLUMNAR_WRITE_CHUNK):
+                    chunk = array[start:start + _COLUMNAR_WRITE_CHUNK]
+                    f.write(np.ascontiguousarray(chunk, dtype=dtype).tobytes())
+            f.truncate(total_size)
+        logger.info(f"Columnar data saved to {path} ({rows} records)")
+    except Exception as e:
+        logger.error(f"Error saving columnar data: {e}")
+        raise
+
+
+def convert_json_lines_to_columnar(source: str, path: str, chunk_size: int = 100_000,
+                                   include_rotated: bool = False) -> int:
+    """
+    JSON Lines 파일을 메모리에 모두 올리지 않고 컬럼형 파일로 변환
+
+    첫 번째 패스에서 레코드 수와 항공기 사전을 구하고,
+    두 번째 패스에서 memmap 으로 매핑한 출력 파일에 청크 단위로 기록합니다.
+
+    Args:
+        source: JSON Lines 파일 경로
+        path: 저장할 컬럼형 파일 경로
+        chunk_size: 두 번째 패스의 청크 크기
+        include_rotated: 회전된 파일 포함 여부
+
+    Returns:
+        변환된 레코드 수
+    """
+    rows = 0
+    id_codes: Dict[str, int] = {}
+    for record in iter_json_lines(source, include_rotated):
+        id_codes.setdefault(record['aircraft_id'], len(id_codes))
+        rows += 1
+
+    header, data_start, layout, total_size = _columnar_layout(rows, list(id_codes))
+    with open(path, 'wb') as f:
+        _write_columnar_header(f, header, data_start)
+        f.truncate(total_size)
+
+    if rows == 0:
+        return 0
+
+    targets = {
+        name: np.memmap(path, dtype=dtype, mode='r+', offset=offset, shape=(rows,))
+        for name, (dtype, offset) in layout.items()
+    }
+
+    position = 0
+    chunk: List[Dict] = []
+
+    def flush():
+        end = position + len(chunk)
+        targets['timestamp'][position:end] = [to_epoch_ns(r['timestamp']) for r in chunk]
+        targets['aircraft_id'][position:end] = [id_codes[r['aircraft_id']] for r in chunk]
+        for field in SENSOR_FIELDS:
+            targets[field][position:end] = [r.get(field, np.nan) for r in chunk]
+        return end
+
+    for record in iter_json_lines(source, include_rotated):
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            position = flush()
+            chunk = []
+    if chunk:
+        position = flush()
+
+    for target in targets.values():
+        target.flush()
+
+    logger.info(f"Converted {rows} records from {source} to {path}")
+    return rows
+
+
+class ColumnarFile:
+    """메모리 매핑으로 연 컬럼형 파일 (데이터는 접근할 때 페이지 단위로 읽힘)"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 컬럼형 파일 경로
+        """
+        self.path = path
+
+        with open(path, 'rb') as f:
+            magic = f.read(len(COLUMNAR_MAGIC))
+            if magic != COLUMNAR_MAGIC:
+                raise ValueError(f"Not a columnar flight data file: {path}")
+            (header_length,) = struct.unpack('<I', f.read(4))
+            header = json.loads(f.read(header_length).decode('utf-8'))
+
+        if header.get('version') != 1:
+            raise ValueError(f"Unsupported columnar file version: {header.get('version')}")
+
+        self.rows: int = header['rows']
+        self.aircraft_ids: List[str] = header['aircraft_ids']
+        data_start = _align(len(COLUMNAR_MAGIC) + 4 + header_length)
+
+        self.columns: Dict[str, np.ndarray] = {}
+        for descriptor in header['columns']:
+            dtype = np.dtype(descriptor['dtype'])
+            if self.rows == 0:
+                self.columns[descriptor['name']] = np.empty(0, dtype=dtype)
+            else:
+                self.columns[descriptor['name']] = np.memmap(
+                    path, dtype=dtype, mode='r', offset=data_start + descriptor['offset'], shape=(self.rows,)
+                )
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def decode_aircraft_ids(self, codes: np.ndarray) -> List[str]:
+        """
+        aircraft_id 코드를 문자열로 변환
+
+        Args:
+            codes: int32 코드 배열
+
+        Returns:
+            항공기 식별자 리스트
+        """
+        return np.asarray(self.aircraft_ids, dtype=object)[codes].tolist()
+
+    def iter_chunks(self, chunk_size: int = 100_000) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        청크 단위 컬럼 뷰 생성 (복사 없음)
+
+        Args:
+            chunk_size: 청크당 레코드 수
+
+        Yields:
+            'timestamp', 'aircraft_id'(코드), 센서 필드별 배열 뷰
+        """
+        for start in range(0, self.rows, chunk_size):
+            yield {name: column[start:start + chunk_size] for name, column in self.columns.items()}
+
+    def iter_record_batches(self, chunk_size: int = 10_000) -> Iterator[List[Dict]]:
+        """
+        청크 단위 레코드 리스트 생성 (DataProcessor.process_batch 입력용)
+
+        Args:
+            chunk_size: 배치당 레코드 수
+
+        Yields:
+            레코드 딕셔너리 리스트
+        """
+        for chunk in self.iter_chunks(chunk_size):
+            yield columns_to_records(chunk, self.decode_aircraft_ids(chunk['aircraft_id']))
+
+    def iter_records(self, chunk_size: int = 10_000) -> Iterator[Dict]:
+        """
+        레코드를 하나씩 생성
+
+        Args:
+            chunk_size: 내부 변환 청크 크기
+
+        Yields:
+            레코드 딕셔너리
+        """
+        for batch in self.iter_record_batches(chunk_size):
+            yield from batch
+
+
+def open_columnar(path: str) -> ColumnarFile:
+    """
+    컬럼형 파일을 메모리 매핑으로 열기
+
+    Args:
+        path: 컬럼형 파일 경로
+
+    Returns:
+        ColumnarFile 객체
+    """
+    return ColumnarFile(path)
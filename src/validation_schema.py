@@ -0,0 +1,376 @@
+"""
+검증 스키마 모듈
+Validation Schema Module
+
+필드별 타입, 범위, 필수 여부를 선언하고, 한 번 컴파일해 레코드 단위와 컬럼 단위 검증기로 사용합니다.
+"""
+
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from .flight_buffer import EPOCH_NS_MAX, EPOCH_NS_MIN, to_epoch_ns
+except ImportError:  # src/ 에서 직접 실행하는 경우 (api_server.py)
+    from flight_buffer import EPOCH_NS_MAX, EPOCH_NS_MIN, to_epoch_ns
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# 필드 타입
+TYPE_ANY = 'any'
+TYPE_NUMBER = 'number'
+TYPE_TIMESTAMP = 'timestamp'
+TYPE_STRING = 'str'
+FIELD_TYPES = (TYPE_ANY, TYPE_NUMBER, TYPE_TIMESTAMP, TYPE_STRING)
+
+# 필수 필드 누락 거부 사유
+MISSING_FIELD = 'missing_field'
+
+_NUMBER_TYPES = (int, float, np.integer, np.floating, np.bool_)
+
+
+class FieldSpec:
+    """필드 검증 규칙 선언"""
+
+    def __init__(
+        self,
+        name: str,
+        type: str = TYPE_NUMBER,
+        minimum: Optional[float] = None,
+        maximum: Optional[float] = None,
+        required: bool = True
+    ):
+        """
+        Args:
+            name: 필드명
+            type: 필드 타입 ('any', 'number', 'timestamp', 'str')
+            minimum: 허용 최소값, 포함 (number 타입만, None이면 제한 없음)
+            maximum: 허용 최대값, 포함 (number 타입만, None이면 제한 없음)
+            required: 필수 여부 (선택 필드는 없으면 검증하지 않음)
+        """
+        if type not in FIELD_TYPES:
+            raise ValueError(f"Unknown field type: {type}")
+        if type != TYPE_NUMBER and (minimum is not None or maximum is not None):
+            raise ValueError(f"Range is only supported for number fields: {name}")
+
+        self.name = name
+        self.type = type
+        self.minimum = minimum
+        self.maximum = maximum
+        self.required = required
+
+    def __repr__(self) -> str:
+        return (f"FieldSpec({self.name!r}, type={self.type!r}, minimum={self.minimum!r}, "
+                f"maximum={self.maximum!r}, required={self.required!r})")
+
+
+class ValidationSchema:
+    """
+    컴파일된 검증 스키마
+
+    check(data) 는 선언으로부터 만든 레코드 단위 검증 함수로, 처음 실패한 규칙(유효하면 None)을 반환합니다.
+    필드 선언 순서대로 검증하며, 거부된 레코드는 처음 실패한 규칙으로 집계됩니다.
+    모든 필수 필드의 존재 여부를 먼저 확인하고('missing_field'), 이후 필드별 타입과 범위를 확인합니다.
+    숫자 필드의 범위는 필드 수와 무관하게 2차원 배열 비교 한 번으로 검증합니다.
+    """
+
+    def __init__(self, fields: Iterable[FieldSpec]):
+        """
+        Args:
+            fields: 검증 순서의 필드 선언
+        """
+        self.fields: Tuple[FieldSpec, ...] = tuple(fields)
+        names = [spec.name for spec in self.fields]
+        if len(set(names)) != len(names):
+            raise ValueError("Duplicate field in validation schema")
+
+        # 컴파일: 필드 분류와 범위 벡터
+        self.required_fields = tuple(spec.name for spec in self.fields if spec.required)
+        self.number_fields = tuple(spec.name for spec in self.fields if spec.type == TYPE_NUMBER)
+        self._checked = tuple(spec for spec in self.fields if spec.type != TYPE_ANY)
+        self._presence_only = tuple(spec.name for spec in self.fields if spec.type == TYPE_ANY and spec.required)
+        self._lows = np.array([
+            -np.inf if spec.minimum is None else spec.minimum
+            for spec in self.fields if spec.type == TYPE_NUMBER
+        ], dtype=np.float64)
+        self._highs = np.array([
+            np.inf if spec.maximum is None else spec.maximum
+            for spec in self.fields if spec.type == TYPE_NUMBER
+        ], dtype=np.float64)
+        # 거부 사유 (검증 순서)
+        self.rules: Tuple[str, ...] = (MISSING_FIELD,) + tuple(spec.name for spec in self._checked)
+        self._rows = {rule: row for row, rule in enumerate(self.rules)}
+        self.check = self._compile_check()
+
+    def __reduce__(self):
+        """생성된 검증 함수 대신 필드 선언으로 피클 (프로세스 풀 전달용)"""
+        return ValidationSchema, (self.fields,)
+
+    def empty_counts(self) -> Dict[str, int]:
+        """규칙별 0 으로 채운 거부 수 딕셔너리"""
+        return {rule: 0 for rule in self.rules}
+
+    def _compile_check(self) -> Callable[[Dict], Optional[str]]:
+        """
+        레코드 단위 검증 함수 생성
+
+        필드 선언을 (필드명, 필수 여부, 타입, 최소, 최대) 표로 한 번 변환해 클로저에 묶습니다.
+        범위는 컬럼 단위 검증과 같은 경계 벡터를 사용하므로 무한대나 NaN 경계도 두 검증기에서 같게 판정됩니다.
+        생성된 함수는 레코드를 받아 처음 실패한 규칙(유효하면 None)을 반환합니다.
+        """
+        required = frozenset(self.required_fields)
+        bounds = dict(zip(self.number_fields, zip(self._lows.tolist(), self._highs.tolist())))
+        checks = tuple(
+            (spec.name, spec.required, spec.type) + bounds.get(spec.name, (None, None))
+            for spec in self._checked
+        )
+        number_types = _NUMBER_TYPES
+
+        def check(data: Dict) -> Optional[str]:
+            if not data.keys() >= required:
+                return MISSING_FIELD
+            for name, is_required, field_type, low, high in checks:
+                if is_required or name in data:
+                    value = data[name]
+                else:
+                    continue
+
+                if field_type == TYPE_NUMBER:
+                    if not (value.__class__ is float or isinstance(value, number_types)) \
+                            or not (value >= low) or not (value <= high):
+                        return name
+                elif field_type == TYPE_TIMESTAMP:
+                    if value.__class__ is int:
+                        if not EPOCH_NS_MIN <= value <= EPOCH_NS_MAX:
+                            return name
+                    else:
+                        try:
+                            to_epoch_ns(value)
+                        except (TypeError, ValueError):
+                            return name
+                elif not isinstance(value, str):
+                    return name
+            return None
+
+        return check
+
+    def missing_field(self, data: Dict) -> Optional[str]:
+        """레코드에 없는 첫 번째 필수 필드 (모두 있으면 None)"""
+        for name in self.required_fields:
+            if name not in data:
+                return name
+        return None
+
+    def check_columns(
+        self,
+        columns: Dict[str, np.ndarray],
+        present: Optional[np.ndarray] = None,
+        field_valid: Optional[Dict[str, np.ndarray]] = None,
+        absent: Optional[Dict[str, np.ndarray]] = None
+    ) -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        컬럼 단위 검증
+
+        Args:
+            columns: 숫자 필드별 배열 (없는 필드는 검증하지 않음)
+            present: 필수 필드를 모두 가진 레코드 마스크 (None이면 모두 가짐)
+            field_valid: 숫자 외 필드의 통과 마스크 (없는 필드는 통과)
+            absent: 선택 필드별 해당 필드가 없는 레코드 마스크 (검증 없이 통과)
+
+        Returns:
+            (유효 레코드 마스크, 규칙별 거부 수)
+        """
+        field_valid = field_valid or {}
+        absent = absent or {}
+        if present is not None:
+            n = len(present)
+        else:
+            n = next((len(columns[name]) for name in self.number_fields if name in columns), 0)
+
+        # 규칙별 통과 행렬 (행 = 검증 순서의 규칙)
+        passed = np.ones((len(self.rules), n), dtype=bool)
+        if present is not None:
+            passed[0] = present
+
+        numbers = [i for i, name in enumerate(self.number_fields) if name in columns]
+        if numbers:
+            rows = [self._rows[self.number_fields[i]] for i in numbers]
+            values = np.stack([np.asarray(columns[self.number_fields[i]], dtype=np.float64) for i in numbers])
+            passed[rows] = (values >= self._lows[numbers, None]) & (values <= self._highs[numbers, None])
+
+        for name, mask in field_valid.items():
+            passed[self._rows[name]] = mask
+        for name, mask in absent.items():
+            passed[self._rows[name]] |= mask
+
+        valid = passed.all(axis=0)
+        counts = self.empty_counts()
+        rejected = ~valid
+        if rejected.any():
+            first_failed = np.argmin(passed[:, rejected], axis=0)
+            for rule, count in zip(self.rules, np.bincount(first_failed, minlength=len(self.rules))):
+                counts[rule] = int(count)
+        return valid, counts
+
+    def check_records(self, data_list: List[Dict]) -> Tuple[List[Dict], Dict[str, int]]:
+        """
+        레코드 리스트를 컬럼으로 모아 검증 (결과는 레코드마다 check 를 호출한 것과 같음)
+
+        Args:
+            data_list: 검증할 레코드 리스트
+
+        Returns:
+            (유효한 레코드 리스트, 규칙별 거부 수)
+        """
+        valid, counts = self.check_records_mask(data_list)
+        if any(counts.values()):
+            return [data_list[i] for i in np.flatnonzero(valid)], counts
+        return list(data_list), counts
+
+    def check_records_mask(self, data_list: List[Dict]) -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        레코드 리스트를 컬럼으로 모아 검증하고 유효 마스크 반환
+
+        Args:
+            data_list: 검증할 레코드 리스트
+
+        Returns:
+            (유효 레코드 마스크, 규칙별 거부 수)
+        """
+        gathered = self.gather_records(data_list)
+        if gathered is None:
+            # 숫자 배열로 모을 수 없으면 레코드 단위로 검증
+            return self._check_each(data_list)
+        return self.check_gathered(*gathered)
+
+    def gather_records(
+        self,
+        data_list: List[Dict]
+    ) -> Optional[Tuple[Dict[str, object], Optional[np.ndarray], Dict[str, np.ndarray]]]:
+        """
+        레코드 리스트를 검증할 필드별 컬럼으로 모음
+
+        숫자 필드는 숫자 배열로, 그 외 필드는 값 리스트로 모읍니다.
+        결과는 피클 비용이 작아 다른 프로세스에서 check_gathered 로 검증할 수 있습니다.
+
+        Args:
+            data_list: 레코드 리스트
+
+        Returns:
+            (필드별 컬럼, 필수 필드 존재 마스크 (모두 있으면 None), 선택 필드별 부재 마스크),
+            숫자 필드를 숫자 배열로 모을 수 없으면 None
+        """
+        n = len(data_list)
+        present = None
+        absent: Dict[str, np.ndarray] = {}
+        try:
+            raw = {spec.name: [d[spec.name] for d in data_list] for spec in self._checked}
+            for name in self._presence_only:
+                if not all(name in d for d in data_list):
+                    raise KeyError(name)
+        except KeyError:
+            # 누락 필드가 있으면 존재 마스크를 만들고 검증에 영향 없는 기본값으로 채움
+            present = np.fromiter(
+                (all(name in d for name in self.required_fields) for d in data_list), dtype=bool, count=n
+            )
+            raw = {}
+            for spec in self._checked:
+                raw[spec.name] = [d.get(spec.name, 0) for d in data_list]
+                if not spec.required:
+                    absent[spec.name] = np.fromiter(
+                        (spec.name not in d for d in data_list), dtype=bool, count=n
+                    )
+
+        for spec in self._checked:
+            if spec.type == TYPE_NUMBER:
+                array = np.array(raw[spec.name])
+                if array.dtype.kind not in 'biuf' or array.shape != (n,):
+                    return None
+                raw[spec.name] = array
+        return raw, present, absent
+
+    def check_gathered(
+        self,
+        raw: Dict[str, object],
+        present: Optional[np.ndarray] = None,
+        absent: Optional[Dict[str, np.ndarray]] = None
+    ) -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        gather_records 결과 검증
+
+        Args:
+            raw: 필드별 컬럼
+            present: 필수 필드 존재 마스크 (None이면 모두 있음)
+            absent: 선택 필드별 부재 마스크
+
+        Returns:
+            (유효 레코드 마스크, 규칙별 거부 수)
+        """
+        columns = {}
+        field_valid: Dict[str, np.ndarray] = {}
+        for spec in self._checked:
+            values = raw[spec.name]
+            if spec.type == TYPE_NUMBER:
+                columns[spec.name] = values
+            elif spec.type == TYPE_TIMESTAMP:
+                field_valid[spec.name] = _timestamp_valid(values)
+            else:
+                field_valid[spec.name] = np.fromiter(
+                    (isinstance(v, str) for v in values), dtype=bool, count=len(values)
+                )
+
+        return self.check_columns(columns, present, field_valid, absent)
+
+    def _check_each(self, data_list: List[Dict]) -> Tuple[np.ndarray, Dict[str, int]]:
+        """레코드 단위 검증"""
+        valid = np.ones(len(data_list), dtype=bool)
+        counts = self.empty_counts()
+        for i, data in enumerate(data_list):
+            rule = self.check(data)
+            if rule is not None:
+                valid[i] = False
+                counts[rule] += 1
+        return valid, counts
+
+
+def _timestamp_valid(values: list) -> np.ndarray:
+    """
+    타임스탬프 값들의 변환 가능 마스크
+
+    모두 정수이면 한 번에 판정하고 (int64 범위를 넘는 값은 거부), 그 외에는 값마다 to_epoch_ns 로 확인합니다.
+    """
+    n = len(values)
+    try:
+        array = np.array(values)
+        if array.dtype.kind == 'i' and array.shape == (n,):
+            return np.ones(n, dtype=bool)
+        if array.dtype.kind == 'u' and array.shape == (n,):
+            return array <= EPOCH_NS_MAX
+    except (OverflowError, ValueError):
+        pass
+
+    valid = np.ones(n, dtype=bool)
+    for i, value in enumerate(values):
+        try:
+            to_epoch_ns(value)
+        except (TypeError, ValueError):
+            valid[i] = False
+    return valid
+
+
+# 기본 비행 데이터 스키마 (DataProcessor 기본값)
+FLIGHT_DATA_SCHEMA = ValidationSchema([
+    FieldSpec('timestamp', TYPE_TIMESTAMP),
+    FieldSpec('aircraft_id', TYPE_ANY),
+    FieldSpec('altitude', minimum=0, maximum=15000),
+    FieldSpec('speed', minimum=0, maximum=1000),
+    FieldSpec('heading', minimum=0, maximum=360),
+    FieldSpec('latitude', minimum=-90, maximum=90),
+    FieldSpec('longitude', minimum=-180, maximum=180),
+    FieldSpec('fuel_level', minimum=0, maximum=100),
+    FieldSpec('engine_temp', minimum=0, maximum=1000),
+])
@@ -7,9 +7,15 @@ import sys
 import os
 from datetime import datetime
 
+import numpy as np
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.analyzer import FlightAnalyzer
+from src.analyzer import (
+    FlightAnalyzer, IncrementalFlightAnalyzer, TrackDistance, distance_matrix, haversine_km, leg_distances
+)
+from src.anomaly_rules import AnomalyRule, AnomalyRuleSet
+from src.flight_buffer import SENSOR_FIELDS, FlightDataBuffer
 
 
 class TestFlightAnalyzer:
@@ -34,6 +40,16 @@ class TestFlightAnalyzer:
         """초기화 테스트"""
         assert len(self.analyzer.anomalies) == 0
     
+    def test_threshold_constants(self):
+        """기존 임계값 상수가 기본 규칙 임계값과 같은지 테스트"""
+        assert FlightAnalyzer.CRITICAL_FUEL_LEVEL == 20.0
+        assert FlightAnalyzer.HIGH_ENGINE_TEMP == 700.0
+        assert FlightAnalyzer.MAX_SAFE_ALTITUDE == 12000.0
+        
+        data = self.normal_data.copy()
+        data['fuel_level'] = self.analyzer.CRITICAL_FUEL_LEVEL
+        assert self.analyzer.detect_anomalies(data) == []  # 임계값 자체는 정상
+    
     def test_detect_no_anomalies(self):
         """정상 데이터 이상 탐지 테스트"""
         anomalies = self.analyzer.detect_anomalies(self.normal_data)
@@ -112,6 +128,99 @@ class TestFlightAnalyzer:
         
         assert analysis['total_samples'] == 5
     
+    def test_incremental_analysis_matches_full_analysis(self):
+        """증분 분석과 전체 재계산 결과 일치 테스트"""
+        rng = np.random.default_rng(14)
+        incremental = IncrementalFlightAnalyzer(self.analyzer)
+        history = {'TEST-001': [], 'TEST-002': []}
+        for i in range(200):
+            aircraft_id = 'TEST-001' if i % 3 else 'TEST-002'
+            data = self.normal_data.copy()
+            data.update({
+                'aircraft_id': aircraft_id,
+                'timestamp': 1_768_816_800_000_000_000 + i * 10**9,
+                'altitude': float(rng.uniform(8000, 11000)),
+                'speed': float(rng.uniform(500, 900)),
+                'fuel_level': 90.0 - i * 0.01
+            })
+            history[aircraft_id].append(data)
+            incremental.update(data)
+        
+        for aircraft_id, data_list in history.items():
+            assert incremental.analysis(aircraft_id) == self.analyzer.analyze_flight_pattern(data_list)
+        assert incremental.analysis('TEST-003') == {}
+        
+        incremental.reset('TEST-002')
+        assert incremental.get_aircraft_ids() == ['TEST-001']
+    
+    def test_incremental_analysis_columns(self):
+        """컬럼 배치 증분 반영 테스트"""
+        incremental = IncrementalFlightAnalyzer(self.analyzer)
+        columns = {
+            'timestamp': np.array([0, 1800, 3600], dtype=np.int64) * 10**9,
+            'altitude': np.array([9000.0, 9500.0, 10000.0]),
+            'speed': np.array([800.0, 820.0, 840.0]),
+            'fuel_level': np.array([80.0, 77.0, 74.0])
+        }
+        
+        incremental.update_columns('TEST-001', columns)
+        incremental.update_columns('TEST-001', {name: values[:0] for name, values in columns.items()})
+        analysis = incremental.analysis('TEST-001')
+        
+        assert analysis['total_samples'] == 3
+        assert analysis['avg_altitude'] == 9500.0
+        assert analysis['fuel_consumption_rate'] == 6.0
+    
+    def test_incremental_sync_tracks_buffer_window(self):
+        """버퍼 스냅샷 동기화 시 밀려난 샘플 제외 테스트"""
+        buffer = FlightDataBuffer('TEST-001', capacity=50, chunk_size=16)
+        incremental = IncrementalFlightAnalyzer(self.analyzer)
+        rng = np.random.default_rng(15)
+        
+        def collect(n, start):
+            columns = {field: rng.uniform(10, 90, n) for field in SENSOR_FIELDS}
+            columns['altitude'] = rng.uniform(8000, 11000, n)
+            buffer.extend(np.arange(start, start + n, dtype=np.int64) * 10**9, columns)
+        
+        def expected(row_filter=None):
+            records = buffer.to_records()
+            if row_filter is not None:
+                records = [r for r in records if row_filter({k: np.array([v]) for k, v in r.items()})[0]]
+            return self.analyzer.analyze_flight_pattern(records)
+        
+        start = 0
+        for n in (30, 15, 20, 3, 70, 1):
+            collect(n, start)
+            start += n
+            added = incremental.sync('TEST-001', buffer.snapshot())
+            assert len(added['timestamp']) == min(n, 50)
+            assert incremental.analysis('TEST-001') == expected()
+        
+        # 이미 동기화한 것보다 오래된 스냅샷은 무시
+        stale = buffer.snapshot()
+        collect(5, start)
+        incremental.sync('TEST-001', buffer.snapshot())
+        assert len(incremental.sync('TEST-001', stale)['timestamp']) == 0
+        assert incremental.analysis('TEST-001') == expected()
+        
+        # 필터를 통과한 샘플만 분석 (밀려난 샘플에도 같은 필터 적용)
+        low_fuel = lambda columns: columns['fuel_level'] >= 30.0  # noqa: E731
+        filtered = IncrementalFlightAnalyzer(self.analyzer)
+        for n in (40, 25, 12):
+            collect(n, start)
+            start += n
+            filtered.sync('TEST-001', buffer.snapshot(), low_fuel)
+            assert filtered.analysis('TEST-001') == expected(low_fuel)
+        
+        risk = filtered.risk_assessment('TEST-001')
+        records = [r for r in buffer.to_records() if r['fuel_level'] >= 30.0]
+        assert risk == self.analyzer.generate_risk_assessment(records)
+        
+        buffer.clear()
+        incremental.sync('TEST-001', buffer.snapshot())
+        assert incremental.analysis('TEST-001') == {}
+        assert incremental.risk_assessment('TEST-001')['risk_score'] == 0
+    
     def test_analyze_empty_list(self):
         """빈 리스트 분석 테스트"""
         analysis = self.analyzer.analyze_flight_pattern([])
@@ -170,6 +279,72 @@ class TestFlightAnalyzer:
         distance = self.analyzer.calculate_distance(point, point)
         assert distance == 0
     
+    def test_haversine_matches_scalar_distance(self):
+        """벡터 거리와 단일 지점 거리 일치 테스트"""
+        track = [
+            {'latitude': 37.5, 'longitude': 127.0},
+            {'latitude': 37.6, 'longitude': 127.1},
+            {'latitude': 35.1, 'longitude': 129.0},
+            {'latitude': -33.9, 'longitude': 151.2}
+        ]
+        latitudes = np.array([p['latitude'] for p in track])
+        longitudes = np.array([p['longitude'] for p in track])
+        
+        legs = leg_distances(latitudes, longitudes)
+        expected = [self.analyzer.calculate_distance(a, b) for a, b in zip(track, track[1:])]
+        np.testing.assert_allclose(legs, expected, rtol=1e-12)
+        assert float(haversine_km(37.5, 127.0, 37.6, 127.1)) == pytest.approx(expected[0])
+    
+    def test_distance_matrix(self):
+        """거리 행렬 테스트"""
+        lat_a = np.array([37.5, 35.1])
+        lon_a = np.array([127.0, 129.0])
+        lat_b = np.array([37.5, 37.6, 33.5])
+        lon_b = np.array([127.0, 127.1, 126.5])
+        
+        matrix = distance_matrix(lat_a, lon_a, lat_b, lon_b)
+        
+        assert matrix.shape == (2, 3)
+        assert matrix[0, 0] == 0
+        for i in range(2):
+            for j in range(3):
+                expected = self.analyzer.calculate_distance(
+                    {'latitude': lat_a[i], 'longitude': lon_a[i]},
+                    {'latitude': lat_b[j], 'longitude': lon_b[j]}
+                )
+                assert matrix[i, j] == pytest.approx(expected, rel=1e-12)
+    
+    def test_track_distance_prefix_sum(self):
+        """항적 누적 거리 구간 조회 테스트"""
+        rng = np.random.default_rng(7)
+        latitudes = 37.0 + np.cumsum(rng.normal(0, 0.01, 50))
+        longitudes = 127.0 + np.cumsum(rng.normal(0, 0.01, 50))
+        
+        track = TrackDistance(latitudes, longitudes)
+        legs = leg_distances(latitudes, longitudes)
+        
+        assert len(track) == 50
+        assert track.total == pytest.approx(legs.sum())
+        assert track.between(10, 30) == pytest.approx(legs[10:30].sum())
+        assert track.between(30, 10) == track.between(10, 30)
+        assert track.between(5, 5) == 0
+    
+    def test_calculate_track_distance(self):
+        """레코드 리스트 항적 거리 테스트"""
+        data_list = [
+            {'latitude': 37.5, 'longitude': 127.0},
+            {'latitude': 37.6, 'longitude': 127.1},
+            {'latitude': 37.7, 'longitude': 127.1}
+        ]
+        
+        track = self.analyzer.calculate_track_distance(data_list)
+        expected = (self.analyzer.calculate_distance(data_list[0], data_list[1])
+                    + self.analyzer.calculate_distance(data_list[1], data_list[2]))
+        
+        assert track.total == pytest.approx(expected)
+        assert self.analyzer.calculate_track_distance([data_list[0]]).total == 0
+        assert self.analyzer.calculate_track_distance([]).total == 0
+    
     def test_generate_risk_assessment_low(self):
         """낮은 위험도 평가 테스트"""
         data_list = [self.normal_data.copy() for _ in range(5)]
@@ -213,10 +388,81 @@ class TestFlightAnalyzer:
         data['fuel_level'] = 15.0
         
         self.analyzer.detect_anomalies(data)
-        self.analyzer.detect_anomalies(data)
+        self.analyzer.detect_anomalies(data)  # 같은 레코드 재분석은 중복 저장하지 않음
         
         anomalies = self.analyzer.get_all_anomalies()
-        assert len(anomalies) == 2
+        assert len(anomalies) == 1
+        
+        other = data.copy()
+        other['aircraft_id'] = 'TEST-002'
+        self.analyzer.detect_anomalies(other)
+        assert len(self.analyzer.get_anomalies('TEST-002')) == 1
+        assert self.analyzer.anomaly_count == 2
+    
+    def test_detect_anomalies_batch_matches_per_record(self):
+        """배치 이상 탐지와 레코드별 탐지 결과 일치 테스트"""
+        rng = np.random.default_rng(12)
+        data_list = []
+        for i in range(300):
+            data = self.normal_data.copy()
+            data['timestamp'] = i
+            data['fuel_level'] = float(rng.uniform(0, 100))
+            data['engine_temp'] = float(rng.uniform(400, 800))
+            data['altitude'] = float(rng.uniform(0, 14000))
+            data['speed'] = float(rng.uniform(100, 900))
+            data_list.append(data)
+        del data_list[5]['fuel_level']
+        
+        batch = self.analyzer.detect_anomalies_batch(data_list)
+        
+        expected = FlightAnalyzer()
+        for data in data_list:
+            expected.detect_anomalies(data)
+        assert self.analyzer.anomaly_count == len(expected.anomalies)
+        assert self.analyzer.get_all_anomalies() == expected.get_all_anomalies()
+        assert sum(batch.counts().values()) == len(batch)
+        assert batch.codes.dtype == np.int8
+    
+    def test_detect_anomalies_batch_columns(self):
+        """컬럼 입력 배치 이상 탐지 테스트"""
+        columns = {
+            'timestamp': np.array([10, 20, 30], dtype=np.int64),
+            'fuel_level': np.array([50.0, 10.0, 50.0]),
+            'altitude': np.array([9000.0, 5000.0, 13000.0]),
+            'speed': np.array([250.0, 600.0, 700.0])
+        }
+        
+        batch = self.analyzer.detect_anomalies_batch(columns, aircraft_id='TEST-002')
+        
+        assert batch.rows.tolist() == [0, 1, 2]
+        assert [self.analyzer.rules.codes[code] for code in batch.codes] == [
+            'LOW_SPEED_HIGH_ALTITUDE', 'LOW_FUEL', 'ALTITUDE_LIMIT'
+        ]
+        records = batch.to_records()
+        assert records[1] == {
+            'timestamp': 20,
+            'aircraft_id': 'TEST-002',
+            'anomalies': ['CRITICAL: Low fuel level (10.00%)']
+        }
+        
+        # 위험도와 패턴의 이상 수는 평가하는 데이터의 항공기 것만 집계
+        other = dict(self.normal_data, aircraft_id='TEST-002')
+        assert self.analyzer.generate_risk_assessment([other])['risk_score'] == 30
+        assert self.analyzer.generate_risk_assessment([self.normal_data])['risk_score'] == 0
+        assert self.analyzer.analyze_flight_pattern([other])['anomaly_count'] == 3
+        assert self.analyzer.analyze_flight_pattern([self.normal_data, other])['anomaly_count'] == 3
+        assert self.analyzer.analyze_flight_pattern([self.normal_data])['anomaly_count'] == 0
+        assert self.analyzer.anomaly_count == 3
+    
+    def test_custom_rules(self):
+        """사용자 정의 규칙 집합 테스트"""
+        rules = AnomalyRuleSet([
+            AnomalyRule('FAST', [('speed', '>=', 600.0)], message="Fast ({value:.0f}km/h)"),
+        ])
+        analyzer = FlightAnalyzer(rules)
+        
+        assert analyzer.detect_anomalies(self.normal_data) == ["WARNING: Fast (650km/h)"]
+        assert len(analyzer.detect_anomalies_batch([self.normal_data])) == 1
     
     def test_predict_remaining_flight_time_normal(self):
         """정상 연료 잔여 시간 예측 테스트"""
@@ -252,6 +498,15 @@ class TestFlightAnalyzer:
         assert prediction['fuel_exhaustion_warning'] is True
         assert 'Critical' in prediction['message']
     
+    def test_fuel_consumption_with_epoch_timestamps(self):
+        """정수 epoch ns 타임스탬프 연료 소비율 테스트"""
+        start_ns = 1768816800 * 10**9
+        first = dict(self.normal_data, timestamp=start_ns, fuel_level=80.0)
+        last = dict(self.normal_data, timestamp=start_ns + 1800 * 10**9, fuel_level=75.0)
+        
+        rate = self.analyzer._calculate_fuel_consumption([first, last])
+        assert rate == pytest.approx(10.0)
+    
     def test_predict_remaining_flight_time_insufficient_data(self):
         """데이터 부족 시 예측 테스트"""
         data_list = [self.normal_data.copy()]
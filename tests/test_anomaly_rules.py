@@ -0,0 +1,123 @@
+"""
+anomaly_rules 모듈 테스트
+"""
+
+import pytest
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.anomaly_rules import (
+    DEFAULT_ANOMALY_RULES,
+    SEVERITY_CRITICAL,
+    AnomalyRule,
+    AnomalyRuleSet,
+    Condition,
+)
+
+FIELDS = ('altitude', 'speed', 'fuel_level', 'engine_temp')
+
+
+def random_rules(rng, count):
+    """임의의 단일/복합 조건 규칙"""
+    rules = []
+    for i in range(count):
+        conditions = [
+            (str(rng.choice(FIELDS)), str(rng.choice(['<', '<=', '>', '>=', '=='])), float(rng.integers(0, 100)))
+            for _ in range(int(rng.integers(1, 4)))
+        ]
+        rules.append(AnomalyRule(f'RULE_{i}', conditions, message="value {value}"))
+    return rules
+
+
+class TestAnomalyRuleSet:
+    """AnomalyRuleSet 테스트 클래스"""
+    
+    def test_default_rules(self):
+        """기본 규칙 테스트"""
+        data = {'altitude': 9000.0, 'speed': 250.0, 'fuel_level': 15.0}
+        
+        hits = DEFAULT_ANOMALY_RULES.evaluate(data)
+        
+        assert [DEFAULT_ANOMALY_RULES.codes[i] for i in hits] == ['LOW_FUEL', 'LOW_SPEED_HIGH_ALTITUDE']
+        assert DEFAULT_ANOMALY_RULES.render(hits[0], data) == "CRITICAL: Low fuel level (15.00%)"
+        assert DEFAULT_ANOMALY_RULES.evaluate({}) == []  # 없는 필드는 기본값
+        assert DEFAULT_ANOMALY_RULES.threshold('LOW_SPEED_HIGH_ALTITUDE', 'speed') == 300.0
+        with pytest.raises(KeyError):
+            DEFAULT_ANOMALY_RULES.threshold('LOW_FUEL', 'speed')
+    
+    def test_scalar_and_vector_agree_with_many_rules(self):
+        """규칙 200개에서 레코드 단위와 컬럼 단위 평가 일치 테스트"""
+        rng = np.random.default_rng(13)
+        rules = AnomalyRuleSet(random_rules(rng, 250))
+        data_list = [
+            {field: float(rng.integers(0, 100)) for field in FIELDS if rng.random() > 0.05}
+            for _ in range(400)
+        ]
+        
+        rows, indices, shown = rules.evaluate_values(rules.gather(data_list))
+        
+        expected = [(row, index) for row, data in enumerate(data_list) for index in rules.evaluate(data)]
+        assert list(zip(rows.tolist(), indices.tolist())) == expected
+        for row, index, value in zip(rows.tolist(), indices.tolist(), shown.tolist()):
+            assert data_list[row][rules.rules[index].value_field] == value
+    
+    def test_stack_columns_and_blocks(self, monkeypatch):
+        """컬럼 입력과 블록 단위 평가 테스트"""
+        monkeypatch.setattr('src.anomaly_rules._BLOCK_ROWS', 3)
+        rules = AnomalyRuleSet([
+            AnomalyRule('HOT', [Condition('engine_temp', '>', 700.0)], SEVERITY_CRITICAL),
+            AnomalyRule('HOT_AND_HIGH', [('engine_temp', '>', 700.0), ('altitude', '>=', 10000.0)]),
+        ])
+        columns = {
+            'engine_temp': np.array([800.0, 500.0, 710.0, 720.0, 400.0, 900.0, 650.0]),
+            'altitude': np.array([9000.0, 0.0, 10000.0, 0.0, 0.0, 11000.0, 0.0])
+        }
+        
+        rows, indices, _ = rules.evaluate_values(rules.stack_columns(columns, 7))
+        
+        assert rows.tolist() == [0, 2, 2, 3, 5, 5]
+        assert indices.tolist() == [0, 0, 1, 0, 0, 1]
+        assert rules.rules[0].render(800.0) == "CRITICAL: HOT"
+    
+    def test_missing_field_without_default(self):
+        """기본값 없는 필드는 조건 거짓 테스트"""
+        rules = AnomalyRuleSet([AnomalyRule('LOW', [('speed', '<', 100.0)])])
+        
+        assert rules.evaluate({}) == []
+        rows, _, _ = rules.evaluate_values(rules.stack_columns({}, 2))
+        assert len(rows) == 0
+    
+    def test_non_finite_thresholds_and_defaults(self):
+        """무한대, NaN 임계값과 기본값 테스트 (레코드 단위와 컬럼 단위 일치)"""
+        rules = AnomalyRuleSet(
+            [
+                AnomalyRule('FINITE_SPEED', [('speed', '<', float('inf'))]),
+                AnomalyRule('NEVER', [('speed', '>', float('nan'))]),
+                AnomalyRule('ANY_ALTITUDE', [('altitude', '>', float('-inf'))]),
+            ],
+            defaults={'altitude': float('inf')}
+        )
+        data_list = [{'speed': 100.0}, {'speed': float('inf'), 'altitude': 0.0}, {}]
+        
+        assert [rules.evaluate(data) for data in data_list] == [[0, 2], [2], [2]]
+        rows, indices, _ = rules.evaluate_values(rules.gather(data_list))
+        assert list(zip(rows.tolist(), indices.tolist())) == [(0, 0), (0, 2), (1, 2), (2, 2)]
+    
+    def test_invalid_declarations(self):
+        """잘못된 규칙 선언 테스트"""
+        with pytest.raises(ValueError):
+            Condition('speed', '!~', 1.0)
+        with pytest.raises(ValueError):
+            AnomalyRule('EMPTY', [])
+        with pytest.raises(ValueError):
+            AnomalyRule('BAD', [('speed', '<', 1.0)], severity='INFO')
+        with pytest.raises(ValueError):
+            AnomalyRuleSet([AnomalyRule('A', [('speed', '<', 1.0)]), AnomalyRule('A', [('speed', '>', 1.0)])])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,164 @@
+"""
+anomaly_store 모듈 테스트
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.anomaly_rules import DEFAULT_ANOMALY_RULES
+from src.anomaly_store import AnomalyStore
+
+LOW_FUEL, HIGH_TEMP = DEFAULT_ANOMALY_RULES.rules[0], DEFAULT_ANOMALY_RULES.rules[1]
+SECOND = 1_000_000_000
+
+
+class TestAnomalyStore:
+    """AnomalyStore 테스트 클래스"""
+    
+    def test_deduplicates(self):
+        """(항공기, 시각, 규칙) 중복 제거 테스트"""
+        store = AnomalyStore()
+        
+        assert store.add('A', 10, LOW_FUEL, 15.0)
+        assert not store.add('A', 10, LOW_FUEL, 15.0)
+        assert store.add('A', 10, HIGH_TEMP, 750.0)
+        assert store.add('B', 10, LOW_FUEL, 12.0)
+        
+        assert len(store) == 3
+        assert store.record_count == 2
+        assert store.duplicates == 1
+        assert store.query('A') == [{
+            'timestamp': 10,
+            'aircraft_id': 'A',
+            'anomalies': ['CRITICAL: Low fuel level (15.00%)', 'WARNING: High engine temperature (750.00°C)']
+        }]
+    
+    def test_capacity_evicts_oldest(self):
+        """용량 초과 시 가장 오래된 이상 제거 테스트"""
+        store = AnomalyStore(capacity=3)
+        for second in (5, 1, 4, 2, 3):
+            store.add('A', second * SECOND, LOW_FUEL, 10.0)
+        
+        assert len(store) == 3
+        assert store.evicted == 2
+        assert [r['timestamp'] for r in store.query()] == [3 * SECOND, 4 * SECOND, 5 * SECOND]
+        assert [r['timestamp'] for r in store.query('A')] == [3 * SECOND, 4 * SECOND, 5 * SECOND]
+    
+    def test_retention(self):
+        """보존 기간 테스트"""
+        store = AnomalyStore(retention_s=60)
+        store.add('A', 0, LOW_FUEL, 10.0)
+        store.add('B', 30 * SECOND, LOW_FUEL, 10.0)
+        store.add('A', 90 * SECOND, LOW_FUEL, 10.0)
+        
+        assert [r['timestamp'] for r in store.query()] == [30 * SECOND, 90 * SECOND]
+        assert not store.add('A', 10 * SECOND, LOW_FUEL, 10.0)  # 보존 기간이 지난 이상
+        assert sorted(store.get_aircraft_ids()) == ['A', 'B']
+    
+    def test_time_range_queries(self):
+        """항공기별, 시각 범위 조회 테스트"""
+        store = AnomalyStore()
+        for second in range(100):
+            store.add('A' if second % 2 else 'B', second * SECOND, LOW_FUEL, 10.0)
+            store.add('A' if second % 2 else 'B', second * SECOND, HIGH_TEMP, 800.0)
+        
+        records = store.query(start=10 * SECOND, end=19 * SECOND)
+        assert [r['timestamp'] // SECOND for r in records] == list(range(10, 20))
+        assert all(len(r['anomalies']) == 2 for r in records)
+        
+        records = store.query('A', start=10 * SECOND, end=19 * SECOND)
+        assert [r['timestamp'] // SECOND for r in records] == [11, 13, 15, 17, 19]
+        assert [r['timestamp'] // SECOND for r in store.query('B', limit=2)] == [96, 98]
+        assert store.query('C') == []
+        assert store.query(start='1970-01-01T00:01:39') == store.query(limit=1)
+    
+    def test_limit_keeps_whole_records(self):
+        """limit 가 최근 레코드 단위로 적용되는지 테스트"""
+        store = AnomalyStore()
+        for second in range(10):
+            store.add('A', second * SECOND, LOW_FUEL, 10.0)
+            store.add('A', second * SECOND, HIGH_TEMP, 800.0)
+            store.add('B', second * SECOND, LOW_FUEL, 10.0)
+        
+        records = store.query(limit=3)
+        assert [(r['timestamp'] // SECOND, r['aircraft_id']) for r in records] == [(8, 'B'), (9, 'A'), (9, 'B')]
+        assert len(records[1]['anomalies']) == 2
+        assert store.query(limit=3) == store.query()[-3:]
+        assert store.query('A', end=4 * SECOND, limit=2) == store.query('A', start=3 * SECOND, end=4 * SECOND)
+        assert store.query('A', limit=100) == store.query('A')
+        assert store.query(limit=0) == []
+    
+    def test_clear(self):
+        """항공기별, 전체 삭제 테스트"""
+        store = AnomalyStore()
+        store.add('A', 1, LOW_FUEL, 10.0)
+        store.add('B', 1, LOW_FUEL, 10.0)
+        
+        store.clear('A')
+        assert [r['aircraft_id'] for r in store.query()] == ['B']
+        assert store.record_count == 1
+        store.clear()
+        assert len(store) == 0
+    
+    def test_aircraft_record_count(self):
+        """항공기별 레코드 수 테스트 (추가, 제거, 삭제 반영)"""
+        store = AnomalyStore(capacity=4)
+        store.add('A', 1, LOW_FUEL, 10.0)
+        store.add('A', 1, HIGH_TEMP, 800.0)
+        store.add('B', 2, LOW_FUEL, 10.0)
+        store.add(None, 3, LOW_FUEL, 10.0)
+        
+        assert store.aircraft_record_count('A') == 1
+        assert store.aircraft_record_count('B') == 1
+        assert store.aircraft_record_count(None) == 1
+        assert store.aircraft_record_count('C') == 0
+        
+        store.add('B', 4, LOW_FUEL, 10.0)  # 용량 초과로 가장 오래된 A 이상 제거
+        assert store.aircraft_record_count('A') == 1
+        store.add('B', 5, LOW_FUEL, 10.0)
+        assert store.aircraft_record_count('A') == 0
+        assert store.aircraft_record_count('B') == 3
+        
+        store.clear('B')
+        assert store.aircraft_record_count('B') == 0
+        assert store.record_count == store.aircraft_record_count(None) == 1
+    
+    def test_out_of_order_and_concurrent_adds(self):
+        """순서가 어긋난 추가와 여러 스레드의 동시 추가 테스트"""
+        import threading
+        
+        store = AnomalyStore(capacity=2000)
+        
+        def add_many(aircraft_id, offset):
+            for second in range(500):
+                store.add(aircraft_id, (second * 7 + offset) % 500 * SECOND, LOW_FUEL, 10.0)
+        
+        threads = [threading.Thread(target=add_many, args=(f'T{i}', i)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        records = store.query()
+        assert len(records) == store.record_count == 2000
+        assert [(r['timestamp'], r['aircraft_id']) for r in records] == sorted(
+            (r['timestamp'], r['aircraft_id']) for r in records
+        )
+        for i in range(4):
+            timestamps = [r['timestamp'] for r in store.query(f'T{i}')]
+            assert timestamps == [second * SECOND for second in range(500)]
+            assert store.aircraft_record_count(f'T{i}') == 500
+    
+    def test_invalid_arguments(self):
+        """잘못된 인자 테스트"""
+        with pytest.raises(ValueError):
+            AnomalyStore(capacity=0)
+        with pytest.raises(ValueError):
+            AnomalyStore(retention_s=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,136 @@
+"""
+api_server 모듈 테스트
+"""
+
+import sys
+import os
+
+# api_server 는 src/ 에서 직접 실행하는 형태로 모듈을 가져옴
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import api_server
+from data_collector import FleetCollector
+
+
+class TestApiServer:
+    """API 엔드포인트 테스트 클래스"""
+    
+    def setup_method(self):
+        """각 테스트 전에 전역 상태 초기화"""
+        api_server.fleet.clear()
+        api_server.patterns.reset()
+        api_server.analyzer.store.clear()
+        for aircraft_id in api_server.fleet.aircraft_ids:
+            if aircraft_id != api_server.DEFAULT_AIRCRAFT_ID:
+                api_server.fleet.remove_aircraft(aircraft_id)
+        self.client = api_server.app.test_client()
+        self.record = {
+            "timestamp": "2026-01-19T10:00:00",
+            "aircraft_id": "TAIL-7",
+            "altitude": 5000.0,
+            "speed": 650.0,
+            "heading": 180.0,
+            "latitude": 37.5,
+            "longitude": 127.0,
+            "fuel_level": 15.0,  # 임계값 이하
+            "engine_temp": 450.0
+        }
+    
+    def test_analyze_posted_data_returns_its_anomalies(self):
+        """전달한 데이터 분석 시 그 데이터의 이상 반환 테스트"""
+        response = self.client.post('/api/analyze', json={'data': [self.record]})
+        analysis = response.get_json()['analysis']
+        
+        assert response.status_code == 200
+        assert len(analysis['anomalies']) == 1
+        assert analysis['anomalies'][0]['aircraft_id'] == "TAIL-7"
+        assert "1 anomalies detected" in analysis['risk_assessment']['risk_factors']
+        assert analysis['pattern']['anomaly_count'] == 1
+        
+        limited = self.client.post('/api/analyze', json={'data': [self.record], 'anomaly_limit': 0})
+        assert limited.get_json()['analysis']['anomalies'] == []
+    
+    def test_analyze_buffer_ignores_other_aircraft(self):
+        """다른 항공기의 이상이 버퍼 분석 결과에 섞이지 않는지 테스트"""
+        records = [dict(self.record, timestamp=f"2026-01-19T10:00:0{i}") for i in range(5)]
+        self.client.post('/api/analyze', json={'data': records})
+        self.client.post('/api/collect', json={'samples': 10})
+        
+        analysis = self.client.post('/api/analyze', json={}).get_json()['analysis']
+        
+        assert all(a['aircraft_id'] == api_server.DEFAULT_AIRCRAFT_ID for a in analysis['anomalies'])
+        count = len(analysis['anomalies'])
+        assert analysis['pattern']['anomaly_count'] == count
+        factors = [f for f in analysis['risk_assessment']['risk_factors'] if f.endswith("anomalies detected")]
+        assert factors == ([f"{count} anomalies detected"] if count else [])
+    
+    def test_collect_from_two_aircraft(self):
+        """등록한 두 항공기 동시 수집 테스트"""
+        assert self.client.post('/api/collect', json={'aircraft_id': 'TAIL-7'}).status_code == 404
+        
+        response = self.client.post('/api/fleet', json={'aircraft_id': 'TAIL-7'})
+        assert response.status_code == 201
+        assert response.get_json()['aircraft_count'] == 2
+        assert self.client.post('/api/fleet', json={'aircraft_id': 'TAIL-7'}).status_code == 200
+        
+        response = self.client.post(
+            '/api/collect', json={'samples': 3, 'aircraft_ids': [api_server.DEFAULT_AIRCRAFT_ID, 'TAIL-7']}
+        )
+        assert response.status_code == 200
+        assert response.get_json()['collected'] == 6
+        
+        fleet = self.client.get('/api/fleet').get_json()['aircraft']
+        assert fleet['TAIL-7']['buffered'] == 3
+        assert fleet[api_server.DEFAULT_AIRCRAFT_ID]['buffered'] == 3
+    
+    def test_register_aircraft_validation(self, monkeypatch):
+        """항공기 등록 요청 검증과 최대 항공기 수 테스트"""
+        assert self.client.post('/api/fleet', json={}).status_code == 400
+        assert self.client.post('/api/fleet', json={'aircraft_id': ' '}).status_code == 400
+        assert self.client.post('/api/fleet', json={'aircraft_id': 7}).status_code == 400
+        
+        monkeypatch.setattr(api_server, 'MAX_FLEET_SIZE', 2)
+        assert self.client.post('/api/fleet', json={'aircraft_id': 'TAIL-7'}).status_code == 201
+        assert self.client.post('/api/fleet', json={'aircraft_id': 'TAIL-8'}).status_code == 409
+        assert 'TAIL-8' not in api_server.fleet
+    
+    def test_initial_aircraft_from_environment(self, monkeypatch):
+        """환경 변수로 시작 항공기 목록 설정 테스트"""
+        monkeypatch.setenv(api_server.FLEET_AIRCRAFT_ENV, 'TAIL-1, TAIL-2,,TAIL-1')
+        assert api_server._initial_aircraft_ids() == ['TAIL-1', 'TAIL-2']
+        
+        monkeypatch.delenv(api_server.FLEET_AIRCRAFT_ENV)
+        assert api_server._initial_aircraft_ids() == [api_server.DEFAULT_AIRCRAFT_ID]
+    
+    def test_collect_rejects_invalid_samples(self):
+        """잘못된 샘플 수 요청 테스트"""
+        for samples in (True, False, -1, 1.5, '3', api_server.fleet.buffer_capacity + 1):
+            response = self.client.post('/api/collect', json={'samples': samples})
+            assert response.status_code == 400, samples
+        
+        assert self.client.post('/api/collect', json={'samples': 0}).status_code == 200
+    
+    def test_buffer_analysis_matches_full_analysis(self, monkeypatch, tmp_path):
+        """버퍼 증분 분석과 버퍼 전체 분석 결과 일치 테스트 (버퍼에서 밀려난 뒤 포함)"""
+        fleet = FleetCollector([api_server.DEFAULT_AIRCRAFT_ID], buffer_capacity=50)
+        monkeypatch.setattr(api_server, 'fleet', fleet)
+        monkeypatch.chdir(tmp_path)
+        reference = api_server.FlightAnalyzer(store=api_server.analyzer.store)
+        
+        for samples in (20, 25, 40, 7, 50):
+            self.client.post('/api/collect', json={'samples': samples})
+            analysis = self.client.post('/api/analyze', json={}).get_json()['analysis']
+            records = fleet.get_aircraft_data(api_server.DEFAULT_AIRCRAFT_ID)
+            
+            assert len(records) == min(50, fleet.get_fleet_summary()[api_server.DEFAULT_AIRCRAFT_ID]['total_collected'])
+            assert analysis['pattern'] == reference.analyze_flight_pattern(records)
+            assert analysis['risk_assessment'] == reference.generate_risk_assessment(records)
+            assert analysis['processed_count'] == len(records)
+            assert analysis['invalid_count'] == 0
+        
+        report = self.client.get('/api/report').get_json()['report']
+        assert report['analysis'] == reference.analyze_flight_pattern(records)
+        assert report['risk_assessment'] == reference.generate_risk_assessment(records)
+        
+        self.client.post('/api/clear', json={})
+        assert self.client.post('/api/analyze', json={}).status_code == 400
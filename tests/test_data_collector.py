@@ -5,11 +5,15 @@ data_collector 모듈 테스트
 import pytest
 import sys
 import os
+import json
+
+import numpy as np
 
 # 상위 디렉토리를 경로에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.data_collector import FlightDataCollector
+from src.data_collector import FleetCollector, FlightDataCollector
+from src.flight_buffer import iso_to_ns, serialize_records
 
 
 class TestFlightDataCollector:
@@ -40,6 +44,9 @@ class TestFlightDataCollector:
         # 항공기 ID 확인
         assert data['aircraft_id'] == "TEST-001"
         
+        # 타임스탬프는 int epoch ns
+        assert isinstance(data['timestamp'], int)
+        
         # 버퍼 확인
         assert len(collector.data_buffer) == 1
     
@@ -111,6 +118,24 @@ class TestFlightDataCollector:
         assert len(buffer) == 2
         assert isinstance(buffer, list)
     
+    def test_get_buffer_data_limit(self):
+        """버퍼 끝부분 조회 테스트"""
+        collector = FlightDataCollector("TEST-001")
+        collector.collect_batch(10)
+        
+        buffer = collector.get_buffer_data()
+        assert collector.get_buffer_data(limit=3) == buffer[-3:]
+    
+    def test_snapshot_unaffected_by_collection(self):
+        """스냅샷이 이후 수집의 영향을 받지 않는지 테스트"""
+        collector = FlightDataCollector("TEST-001")
+        collector.collect_batch(5)
+        snapshot = collector.snapshot()
+        
+        collector.collect_batch(5)
+        collector.clear_buffer()
+        assert len(snapshot.to_records()) == 5
+    
     def test_clear_buffer(self):
         """버퍼 초기화 테스트"""
         collector = FlightDataCollector("TEST-001")
@@ -142,6 +167,220 @@ class TestFlightDataCollector:
         
         assert len(data) == 1
         assert data[0]['aircraft_id'] == "TEST-001"
+        # ISO 문자열은 마이크로초 정밀도
+        assert iso_to_ns(data[0]['timestamp']) == collector.get_buffer_data()[0]['timestamp'] // 1000 * 1000
+    
+    def test_save_to_jsonl_appends_new_records(self, tmp_path):
+        """JSON Lines 저장 시 새 레코드만 추가 테스트"""
+        collector = FlightDataCollector("TEST-001")
+        file_path = str(tmp_path / "test_data.jsonl")
+        
+        collector.collect_sensor_data()
+        collector.collect_sensor_data()
+        collector.save_to_file(file_path)
+        
+        collector.collect_sensor_data()
+        collector.save_to_file(file_path)
+        collector.save_to_file(file_path)
+        collector.close()
+        
+        with open(file_path, 'r') as f:
+            lines = f.readlines()
+        
+        assert len(lines) == 3
+        assert [json.loads(line) for line in lines] == serialize_records(collector.get_buffer_data())
+    
+    def test_append_to_file_rotation(self, tmp_path):
+        """크기 기반 파일 회전 테스트"""
+        collector = FlightDataCollector("TEST-001")
+        file_path = str(tmp_path / "test_data.jsonl")
+        
+        collector.collect_batch(10)
+        written = collector.append_to_file(file_path, fsync_every=4, max_bytes=1000)
+        collector.close()
+        
+        assert written == 10
+        assert os.path.exists(file_path + ".1")
+        assert os.path.getsize(file_path) <= 1000
+    
+    def test_save_to_columnar_file(self, tmp_path):
+        """컬럼형 파일 저장 테스트"""
+        from src.storage import open_columnar
+        
+        collector = FlightDataCollector("TEST-001")
+        collector.collect_batch(10)
+        
+        file_path = str(tmp_path / "test_data.fdcol")
+        collector.save_to_file(file_path)
+        
+        assert list(open_columnar(file_path).iter_records()) == collector.get_buffer_data()
+    
+    def test_buffer_capacity(self):
+        """버퍼 용량 제한 테스트"""
+        collector = FlightDataCollector("TEST-001", buffer_capacity=3)
+        
+        samples = [collector.collect_sensor_data() for _ in range(5)]
+        buffer = collector.get_buffer_data()
+        
+        assert len(buffer) == 3
+        assert [d['altitude'] for d in buffer] == [d['altitude'] for d in samples[2:]]
+
+    def test_collect_sensor_data_async(self):
+        """비동기 센서 데이터 수집 테스트"""
+        import asyncio
+        
+        collector = FlightDataCollector("TEST-001")
+        data = asyncio.run(collector.collect_sensor_data_async())
+        
+        for field, (low, high) in FlightDataCollector.SENSOR_RANGES.items():
+            assert low <= data[field] <= high
+        assert data['aircraft_id'] == "TEST-001"
+        assert collector.get_buffer_data() == [data]
+    
+    def test_collect_sensor_data_async_custom_drivers(self):
+        """사용자 정의 센서 드라이버 테스트"""
+        import asyncio
+        import math
+        from src.sensor_drivers import SimulatedSensorDriver
+        
+        drivers = {field: SimulatedSensorDriver(1.0, 1.0) for field in FlightDataCollector.SENSOR_RANGES}
+        drivers['engine_temp'] = SimulatedSensorDriver(500.0, 500.0, latency=1.0)
+        collector = FlightDataCollector("TEST-001", sensor_drivers=drivers, sensor_timeout=0.05)
+        
+        data = asyncio.run(collector.collect_sensor_data_async())
+        assert data['altitude'] == 1.0
+        assert math.isnan(data['engine_temp'])
+    
+    def test_collect_batch(self):
+        """배치 수집 테스트"""
+        collector = FlightDataCollector("TEST-001")
+        columns = collector.collect_batch(1000)
+        
+        assert len(columns['timestamp']) == 1000
+        assert columns['timestamp'].dtype == np.int64
+        assert np.all(np.diff(columns['timestamp']) > 0)
+        for field, (low, high) in FlightDataCollector.SENSOR_RANGES.items():
+            assert len(columns[field]) == 1000
+            assert np.all((columns[field] >= low) & (columns[field] <= high))
+        
+        assert len(collector.data_buffer) == 1000
+    
+    def test_collect_batch_records(self):
+        """배치 수집 후 버퍼 조회 테스트"""
+        collector = FlightDataCollector("TEST-001")
+        collector.collect_batch(3)
+        
+        buffer = collector.get_buffer_data()
+        assert len(buffer) == 3
+        assert buffer[0]['aircraft_id'] == "TEST-001"
+        assert len({d['timestamp'] for d in buffer}) == 3
+    
+    def test_collect_batch_negative(self):
+        """음수 샘플 수 테스트"""
+        collector = FlightDataCollector("TEST-001")
+        with pytest.raises(ValueError):
+            collector.collect_batch(-1)
+    
+    def test_collect_batch_back_to_back_monotonic(self):
+        """연속 배치 수집 시 버퍼 타임스탬프 단조 증가 테스트"""
+        collector = FlightDataCollector("TEST-001")
+        collector.collect_batch(50_000)
+        collector.collect_batch(5)
+        collector.collect_sensor_data()
+        collector.collect_batch(0)
+        collector.collect_batch(1000, interval_ns=10)
+        
+        timestamps = collector.data_buffer.to_columns()['timestamp']
+        assert len(timestamps) == 51_006
+        assert np.all(np.diff(timestamps) > 0)
+        
+        # 버퍼가 정렬되어 있어야 시각 범위 조회가 정확함
+        last_batch = collector.snapshot().time_range(int(timestamps[-1000]), int(timestamps[-1]) + 1)
+        assert len(last_batch['timestamp']) == 1000
+
+
+class TestFleetCollector:
+    """FleetCollector 테스트 클래스"""
+    
+    def setup_method(self):
+        """각 테스트 전에 실행"""
+        self.fleet = FleetCollector(["AC-001", "AC-002"], buffer_capacity=100, max_workers=4)
+    
+    def teardown_method(self):
+        """각 테스트 후에 실행"""
+        self.fleet.shutdown()
+    
+    def test_initialization(self):
+        """초기화 테스트"""
+        assert len(self.fleet) == 2
+        assert "AC-001" in self.fleet
+        assert self.fleet.aircraft_ids == ["AC-001", "AC-002"]
+    
+    def test_add_aircraft_is_idempotent(self):
+        """항공기 중복 등록 테스트"""
+        collector = self.fleet.add_aircraft("AC-001")
+        assert self.fleet.add_aircraft("AC-001") is collector
+        assert len(self.fleet) == 2
+    
+    def test_collect_all(self):
+        """전체 항공기 수집 테스트"""
+        result = self.fleet.collect(samples=5)
+        
+        assert set(result) == {"AC-001", "AC-002"}
+        assert all(len(columns['timestamp']) == 5 for columns in result.values())
+        assert len(self.fleet.get_aircraft_data("AC-001")) == 5
+    
+    def test_collect_registers_new_aircraft(self):
+        """미등록 항공기 자동 등록 테스트"""
+        self.fleet.collect(samples=2, aircraft_ids=["AC-003"])
+        
+        assert "AC-003" in self.fleet
+        assert len(self.fleet.get_aircraft_data("AC-003")) == 2
+        assert len(self.fleet.get_aircraft_data("AC-001")) == 0
+    
+    def test_shards_are_isolated(self):
+        """항공기별 버퍼 분리 테스트"""
+        self.fleet.collect(samples=3, aircraft_ids=["AC-001"])
+        
+        fleet_data = self.fleet.get_fleet_data()
+        assert len(fleet_data["AC-001"]) == 3
+        assert len(fleet_data["AC-002"]) == 0
+        assert all(d['aircraft_id'] == "AC-001" for d in fleet_data["AC-001"])
+    
+    def test_concurrent_collection(self):
+        """동일 항공기 동시 수집 테스트"""
+        import threading
+        
+        threads = [
+            threading.Thread(target=self.fleet.collect, kwargs={'samples': 10})
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        summary = self.fleet.get_fleet_summary()
+        assert summary["AC-001"] == {'buffered': 80, 'total_collected': 80}
+    
+    def test_unknown_aircraft(self):
+        """미등록 항공기 조회 테스트"""
+        with pytest.raises(KeyError):
+            self.fleet.get_aircraft_data("UNKNOWN")
+    
+    def test_clear_and_remove(self):
+        """버퍼 초기화 및 항공기 해제 테스트"""
+        self.fleet.collect(samples=3)
+        self.fleet.clear("AC-001")
+        
+        assert len(self.fleet.get_aircraft_data("AC-001")) == 0
+        assert len(self.fleet.get_aircraft_data("AC-002")) == 3
+        
+        self.fleet.clear()
+        assert len(self.fleet.get_aircraft_data("AC-002")) == 0
+        
+        self.fleet.remove_aircraft("AC-002")
+        assert "AC-002" not in self.fleet
 
 
 if __name__ == "__main__":
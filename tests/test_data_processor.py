@@ -8,7 +8,11 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.data_processor import DataProcessor
+import numpy as np
+
+from src.data_processor import DataProcessor, _epoch_ns_column, iqr_bounds
+from src.flight_buffer import FlightDataBuffer
+from src.validation_schema import FLIGHT_DATA_SCHEMA
 
 
 class TestDataProcessor:
@@ -102,6 +106,21 @@ class TestDataProcessor:
         result = self.processor.validate_data(invalid_data)
         assert result is False
     
+    def test_validate_invalid_timestamp(self):
+        """유효하지 않은 타임스탬프 테스트"""
+        invalid_data = self.valid_data.copy()
+        invalid_data['timestamp'] = "not-a-timestamp"
+        
+        result = self.processor.validate_data(invalid_data)
+        assert result is False
+    
+    def test_normalize_converts_timestamp(self):
+        """정규화 시 타임스탬프 정수 변환 테스트"""
+        normalized = self.processor.normalize_data(self.valid_data)
+        
+        assert normalized['timestamp'] == 1768816800 * 10**9
+        assert self.processor.normalize_data(normalized)['timestamp'] == normalized['timestamp']
+    
     def test_normalize_data(self):
         """데이터 정규화 테스트"""
         data = {
@@ -165,6 +184,65 @@ class TestDataProcessor:
         assert stats['mean'] == 1000.0
         assert 'stdev' not in stats  # 단일 값은 표준편차 없음
     
+    def test_calculate_all_statistics(self):
+        """여러 필드 통계 한 번에 계산 테스트"""
+        rng = np.random.default_rng(3)
+        data_list = [
+            {"altitude": float(a), "speed": float(v), "heading": 90.0}
+            for a, v in zip(rng.uniform(0, 15000, 101), rng.uniform(0, 1000, 101))
+        ]
+        del data_list[4]["speed"]
+        
+        all_stats = self.processor.calculate_all_statistics(data_list, ['altitude', 'speed', 'heading', 'fuel_level'])
+        
+        assert list(all_stats) == ['altitude', 'speed', 'heading', 'fuel_level']
+        for field in ['altitude', 'speed', 'heading']:
+            expected = self.processor.calculate_statistics(data_list, field)
+            assert all_stats[field].keys() == expected.keys()
+            for key, value in expected.items():
+                assert all_stats[field][key] == pytest.approx(value, rel=1e-9, abs=1e-9)
+        assert all_stats['speed']['count'] == 100
+        assert all_stats['fuel_level'] == {}
+    
+    def test_calculate_all_statistics_even_count_and_single_value(self):
+        """짝수 개 중앙값과 단일 값 테스트"""
+        data_list = [{"altitude": 1.0, "speed": 5.0}, {"altitude": 4.0}, {"altitude": 2.0}, {"altitude": 3.0}]
+        
+        all_stats = self.processor.calculate_all_statistics(data_list, ['altitude', 'speed'])
+        
+        assert all_stats['altitude']['median'] == 2.5
+        assert all_stats['speed'] == {'count': 1, 'mean': 5.0, 'median': 5.0, 'min': 5.0, 'max': 5.0}
+    
+    def test_calculate_all_statistics_complete_records(self):
+        """모든 레코드가 모든 필드를 가진 경우 (한 번에 모으는 경로) 테스트"""
+        data_list = [{"altitude": float(i), "speed": 10 * i, "heading": 1.5} for i in range(9)]
+        
+        all_stats = self.processor.calculate_all_statistics(data_list, ['altitude', 'speed', 'heading'])
+        
+        for field in ['altitude', 'speed', 'heading']:
+            expected = self.processor.calculate_statistics(data_list, field)
+            for key, value in expected.items():
+                assert all_stats[field][key] == pytest.approx(value)
+        assert self.processor.calculate_all_statistics(data_list, ['speed'])['speed']['median'] == 40
+        assert self.processor.calculate_all_statistics([], ['speed']) == {'speed': {}}
+
+    def test_update_statistics_by_chunk(self):
+        """청크 단위 온라인 통계 누적 테스트"""
+        rng = np.random.default_rng(8)
+        data_list = [{"altitude": float(a), "speed": 500.0} for a in rng.uniform(0, 15000, 90)]
+
+        accumulators = None
+        for start in range(0, len(data_list), 25):
+            accumulators = self.processor.update_statistics(
+                data_list[start:start + 25], accumulators, ['altitude', 'speed'], sketch_size=100
+            )
+
+        expected = self.processor.calculate_statistics(data_list, 'altitude')
+        actual = accumulators['altitude'].to_dict()
+        for key, value in expected.items():
+            assert actual[key] == pytest.approx(value, rel=1e-9)
+        assert accumulators['speed'].count == 90
+
     def test_filter_outliers(self):
         """이상치 필터링 테스트"""
         data_list = [
@@ -181,6 +259,39 @@ class TestDataProcessor:
         # 이상치가 제거되었는지 확인
         assert len(filtered) < len(data_list)
     
+    def test_filter_outliers_multi(self):
+        """여러 필드 동시 이상치 필터링 테스트"""
+        data_list = [
+            {"altitude": 5000.0 + 100 * i, "speed": 600.0 + i} for i in range(8)
+        ]
+        data_list[2]["altitude"] = 50000.0
+        data_list[5]["speed"] = 5000.0
+        del data_list[7]["speed"]  # 필드가 없는 레코드는 제거
+        
+        indices, removed = self.processor.filter_outliers_multi(data_list, ['altitude', 'speed'])
+        
+        assert indices.tolist() == [0, 1, 3, 4, 6]
+        assert removed == {'altitude': 1, 'speed': 2}
+    
+    def test_filter_outliers_multi_matches_single_field(self):
+        """단일 필드일 때 기존 필터링과 결과 일치 테스트"""
+        rng = np.random.default_rng(2)
+        data_list = [{"altitude": float(v)} for v in rng.normal(5000, 1000, 501)]
+        data_list += [{"altitude": 1e6}, {"altitude": -1e6}]
+        
+        indices, removed = self.processor.filter_outliers_multi(data_list, ['altitude'])
+        expected = self.processor.filter_outliers(data_list, 'altitude')
+        
+        assert [data_list[i] for i in indices] == expected
+        assert removed['altitude'] == len(data_list) - len(expected)
+    
+    def test_iqr_bounds(self):
+        """선택 알고리즘 사분위수 테스트"""
+        values = np.array([7.0, 1.0, 5.0, 3.0, 2.0, 8.0, 4.0, 6.0])
+        sorted_values = sorted(values)
+        q1, q3 = sorted_values[2], sorted_values[6]
+        assert iqr_bounds(values) == (q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1))
+    
     def test_filter_outliers_small_list(self):
         """작은 리스트 필터링 테스트"""
         data_list = [
@@ -222,6 +333,331 @@ class TestDataProcessor:
         # 유효한 데이터만 처리됨
         assert len(processed) == 2
     
+    def test_validate_batch_matches_per_record(self):
+        """배치 검증과 레코드별 검증 결과 일치 테스트"""
+        rng = np.random.default_rng(0)
+        data_list = []
+        for i in range(2000):
+            data = self.valid_data.copy()
+            data['timestamp'] = 1768816800 * 10**9 + i if i % 2 else "2026-01-19T10:00:00"
+            for spec in FLIGHT_DATA_SCHEMA.fields:
+                if spec.type == 'number':
+                    span = spec.maximum - spec.minimum
+                    data[spec.name] = float(rng.uniform(spec.minimum - 0.1 * span, spec.maximum + 0.1 * span))
+            if i % 97 == 0:
+                del data['speed']
+            if i % 89 == 0:
+                data['timestamp'] = "bad"
+            if i % 83 == 0:
+                data['altitude'] = float('nan')
+            data_list.append(data)
+        
+        valid_records, counts = self.processor.validate_batch(data_list)
+        expected = [d for d in data_list if self.processor.validate_data(d)]
+        
+        assert valid_records == expected
+        assert sum(counts.values()) == len(data_list) - len(expected)
+        assert counts['missing_field'] == len([d for d in data_list if 'speed' not in d])
+        assert set(counts) == set(FLIGHT_DATA_SCHEMA.rules)
+    
+    def test_validate_batch_counts_first_failed_rule(self):
+        """거부 사유가 처음 실패한 규칙으로 집계되는지 테스트"""
+        both = self.valid_data.copy()
+        both['altitude'] = 20000.0
+        both['speed'] = 2000.0
+        speed_only = self.valid_data.copy()
+        speed_only['speed'] = -1.0
+        
+        valid_records, counts = self.processor.validate_batch([self.valid_data, both, speed_only])
+        
+        assert valid_records == [self.valid_data]
+        assert counts['altitude'] == 1
+        assert counts['speed'] == 1
+        assert counts['heading'] == 0
+    
+    def test_validate_non_numeric_value(self):
+        """숫자가 아닌 값은 타입 검증에서 거부되는지 테스트"""
+        invalid = self.valid_data.copy()
+        invalid['altitude'] = "5000"
+        
+        assert self.processor.validate_data(invalid) is False
+        valid_records, counts = self.processor.validate_batch([self.valid_data, invalid])
+        assert valid_records == [self.valid_data]
+        assert counts['altitude'] == 1
+    
+    def test_validate_columns(self):
+        """컬럼 검증 테스트"""
+        columns = {
+            spec.name: np.full(4, (spec.minimum + spec.maximum) / 2.0)
+            for spec in FLIGHT_DATA_SCHEMA.fields if spec.type == 'number'
+        }
+        columns['fuel_level'][1] = 150.0
+        columns['engine_temp'][3] = np.nan
+        
+        valid, counts = self.processor.validate_columns(columns)
+        
+        assert valid.tolist() == [True, False, True, False]
+        assert counts['fuel_level'] == 1
+        assert counts['engine_temp'] == 1
+    
+    def test_process_batch_empty(self):
+        """빈 배치 처리 테스트"""
+        assert self.processor.process_batch([]) == []
+    
+    def test_rejection_stats_accumulate(self):
+        """배치 간 거부 집계 누적 테스트"""
+        processor = DataProcessor(rejection_sample_size=3)
+        invalid = self.valid_data.copy()
+        invalid['fuel_level'] = 150.0
+        
+        processor.process_batch([self.valid_data] + [invalid] * 5)
+        processor.process_batch([invalid])
+        processor.validate_data(invalid)
+        
+        stats = processor.get_rejection_stats()
+        assert stats['total'] == 7
+        assert stats['by_rule']['fuel_level'] == 7
+        assert len(stats['samples']) == 3
+        assert stats['samples'][-1] == {'rule': 'fuel_level', 'record': invalid}
+        
+        processor.rejections.reset()
+        assert processor.get_rejection_stats()['total'] == 0
+    
+    def test_rejection_log_is_rate_limited(self, caplog):
+        """거부 경고 로그 빈도 제한 테스트"""
+        now = [0.0]
+        processor = DataProcessor(log_interval=10.0, clock=lambda: now[0])
+        invalid = self.valid_data.copy()
+        invalid['speed'] = -5.0
+        
+        with caplog.at_level("WARNING", logger="src.data_processor"):
+            for _ in range(100):
+                processor.process_batch([invalid] * 50)
+            now[0] = 11.0
+            processor.process_batch([invalid])
+        
+        warnings = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+        assert len(warnings) == 2
+        assert "99 similar messages suppressed" in warnings[1]
+        assert processor.get_rejection_stats()['by_rule']['speed'] == 5001
+    
+    def test_process_stream_matches_batch(self):
+        """스트림 처리와 배치 처리 결과 일치 테스트"""
+        invalid = self.valid_data.copy()
+        invalid['heading'] = 400.0
+        data_list = [self.valid_data, invalid, self.valid_data] * 5
+        
+        streamed = list(self.processor.process_stream(iter(data_list), chunk_size=4))
+        assert streamed == DataProcessor().process_batch(data_list)
+        assert self.processor.get_processed_count() == 10
+    
+    def test_process_stream_is_lazy(self):
+        """스트림이 필요한 만큼만 읽는지 테스트"""
+        consumed = []
+        
+        def source():
+            while True:
+                consumed.append(1)
+                yield self.valid_data
+        
+        stream = self.processor.process_stream(source(), chunk_size=3)
+        first = [next(stream) for _ in range(4)]
+        
+        assert len(first) == 4
+        assert len(consumed) == 6  # 청크 두 개만 읽음
+    
+    def test_process_stream_chunks(self):
+        """청크 단위 생성 테스트"""
+        invalid = self.valid_data.copy()
+        invalid['latitude'] = 100.0
+        data_list = [self.valid_data] * 5 + [invalid] * 3
+        
+        chunks = list(self.processor.process_stream(data_list, chunk_size=5, yield_chunks=True))
+        assert [len(chunk) for chunk in chunks] == [5]
+        
+        with pytest.raises(ValueError):
+            list(self.processor.process_stream(data_list, chunk_size=0))
+    
+    def test_process_batch_parallel_matches_serial(self, monkeypatch):
+        """병렬 배치 처리와 직렬 처리 결과 일치 테스트"""
+        monkeypatch.setattr(os, 'cpu_count', lambda: 4)
+        rng = np.random.default_rng(9)
+        data_list = []
+        for i in range(500):
+            data = self.valid_data.copy()
+            data['timestamp'] = 1_768_816_800_000_000_000 + i
+            data['altitude'] = float(rng.uniform(-100, 15100))
+            data['speed'] = float(rng.uniform(0, 1000)) + 0.005
+            data['latitude'] = float(rng.uniform(-90, 90))
+            data_list.append(data)
+        data_list[7] = {k: v for k, v in data_list[7].items() if k != 'fuel_level'}
+        data_list[401]['heading'] = 'north'  # 숫자 배열로 모을 수 없는 청크는 레코드 단위 처리
+
+        serial = DataProcessor()
+        expected = serial.process_batch(data_list)
+        try:
+            actual = self.processor.process_batch(data_list, workers=2, chunk_size=64, min_parallel_batch=0)
+            assert self.processor._executor is not None
+        finally:
+            self.processor.close()
+
+        assert actual == expected
+        assert self.processor.get_processed_count() == serial.get_processed_count() == len(expected)
+        assert self.processor.get_rejection_stats() == serial.get_rejection_stats()
+
+        with pytest.raises(ValueError):
+            self.processor.process_batch(data_list, workers=2, chunk_size=0)
+    
+    def test_process_batch_parallel_falls_back_to_serial(self, monkeypatch):
+        """CPU 가 하나이거나 작은 배치의 직렬 처리 테스트"""
+        data_list = [self.valid_data.copy() for _ in range(10)]
+        
+        monkeypatch.setattr(os, 'cpu_count', lambda: 1)
+        assert len(self.processor.process_batch(data_list, workers=4, chunk_size=2, min_parallel_batch=0)) == 10
+        assert self.processor._executor is None
+        
+        monkeypatch.setattr(os, 'cpu_count', lambda: 4)
+        assert len(self.processor.process_batch(data_list, workers=4, chunk_size=2)) == 10
+        assert self.processor._executor is None
+
+    def test_normalize_columns_in_place(self):
+        """컬럼 단위 제자리 정규화 테스트"""
+        records = [self.valid_data.copy() for _ in range(3)]
+        records[1]['latitude'] = 37.123456789
+        records[2]['speed'] = 650.789
+        columns = {'timestamp': [d['timestamp'] for d in records]}
+        for field in ['altitude', 'speed', 'heading', 'latitude', 'longitude', 'fuel_level', 'engine_temp']:
+            columns[field] = np.array([d[field] for d in records])
+        latitude = columns['latitude']
+
+        normalized = self.processor.normalize_columns(columns, out=columns)
+
+        assert normalized['latitude'] is latitude
+        assert normalized['timestamp'].dtype == np.int64
+        expected = [DataProcessor().normalize_data(d) for d in records]
+        assert normalized['latitude'].tolist() == [d['latitude'] for d in expected]
+        assert normalized['speed'].tolist() == [d['speed'] for d in expected]
+        assert normalized['timestamp'].tolist() == [d['timestamp'] for d in expected]
+        assert self.processor.get_processed_count() == 3
+
+    def test_process_batch_columns_matches_process_batch(self):
+        """검증과 정규화를 합친 컬럼형 처리 결과 테스트"""
+        invalid = self.valid_data.copy()
+        invalid['fuel_level'] = 120.0
+        other = self.valid_data.copy()
+        other['aircraft_id'] = 'TEST-002'
+        other['heading'] = 90.123
+        data_list = [self.valid_data, invalid, other]
+
+        columns = self.processor.process_batch_columns(data_list)
+
+        expected = DataProcessor().process_batch(data_list)
+        assert columns['aircraft_id'].tolist() == ['TEST-001', 'TEST-002']
+        assert columns['heading'].tolist() == [d['heading'] for d in expected]
+        assert columns['timestamp'].tolist() == [d['timestamp'] for d in expected]
+        assert self.processor.get_rejection_stats()['by_rule']['fuel_level'] == 1
+
+        # 숫자 배열로 모을 수 없는 배치는 레코드 단위로 검증
+        invalid['speed'] = 'fast'
+        columns = self.processor.process_batch_columns(data_list)
+        assert len(columns['speed']) == 2
+        assert self.processor.get_rejection_stats()['by_rule']['speed'] == 1
+
+    def test_process_batch_columns_rounds_like_process_batch(self):
+        """.5 경계값에서도 컬럼형 처리와 레코드 처리 결과가 같은지 테스트"""
+        data_list = []
+        for altitude, latitude in [(813.275, 39.2004365), (571.535, 41.7257205), (932.065, 65.1586285)]:
+            data = self.valid_data.copy()
+            data['altitude'] = altitude
+            data['speed'] = altitude
+            data['latitude'] = latitude
+            data_list.append(data)
+
+        columns = self.processor.process_batch_columns(data_list)
+
+        expected = DataProcessor().process_batch(data_list)
+        for field, decimals in (('altitude', 2), ('speed', 2), ('latitude', 6)):
+            assert columns[field].tolist() == [d[field] for d in expected]
+            # np.round 로는 경계값 반올림이 달라지는 입력
+            assert columns[field].tolist() != np.round([d[field] for d in data_list], decimals).tolist()
+
+    def test_process_batch_columns_rejects_out_of_range_timestamp(self):
+        """int64 범위를 넘는 정수 타임스탬프가 감싸지지 않고 거부되는지 테스트"""
+        overflow = self.valid_data.copy()
+        overflow['timestamp'] = 2**63 + 5
+        data_list = [self.valid_data, overflow]
+
+        columns = self.processor.process_batch_columns(data_list)
+
+        assert columns['timestamp'].tolist() == [1768816800 * 10**9]
+        assert self.processor.get_rejection_stats()['by_rule']['timestamp'] == 1
+        assert len(DataProcessor().process_batch(data_list)) == 1
+        with pytest.raises(ValueError):
+            _epoch_ns_column([0, 2**63])
+
+    def test_process_columns(self):
+        """컬럼 입력 검증 및 정규화 테스트"""
+        columns = {
+            'timestamp': np.arange(4, dtype=np.int64),
+            'altitude': np.array([100.004, 20000.0, 300.0, 400.0]),
+            'speed': np.array([500.0, 500.0, -1.0, 500.0]),
+            'heading': np.zeros(4),
+            'latitude': np.full(4, 37.1234567),
+            'longitude': np.zeros(4),
+            'fuel_level': np.full(4, 50.0),
+            'engine_temp': np.full(4, 400.0)
+        }
+
+        normalized, counts = self.processor.process_columns(columns)
+
+        assert normalized['timestamp'].tolist() == [0, 3]
+        assert normalized['altitude'].tolist() == [100.0, 400.0]
+        assert normalized['latitude'].tolist() == [37.123457, 37.123457]
+        assert counts['altitude'] == 1 and counts['speed'] == 1
+        assert self.processor.get_rejection_stats()['total'] == 2
+
+    def test_process_columns_leaves_input_unchanged(self):
+        """모두 유효한 입력 컬럼을 바꾸지 않는지, in_place 선택 시에만 덮어쓰는지 테스트"""
+        columns = {
+            'timestamp': np.arange(3, dtype=np.int64),
+            'altitude': np.array([100.004, 200.0, 300.0]),
+            'speed': np.full(3, 500.0),
+            'heading': np.zeros(3),
+            'latitude': np.full(3, 37.1234567),
+            'longitude': np.zeros(3),
+            'fuel_level': np.full(3, 50.0),
+            'engine_temp': np.full(3, 400.0)
+        }
+        original = {field: values.copy() for field, values in columns.items()}
+
+        normalized, _ = self.processor.process_columns(columns)
+
+        assert normalized['latitude'].tolist() == [37.123457] * 3
+        for field, values in original.items():
+            assert np.array_equal(columns[field], values)
+
+        normalized, _ = self.processor.process_columns(columns, in_place=True)
+        assert normalized['latitude'] is columns['latitude']
+        assert columns['altitude'].tolist() == [100.0, 200.0, 300.0]
+
+    def test_process_columns_read_only_snapshot(self):
+        """BufferSnapshot 읽기 전용 뷰 입력 테스트"""
+        buffer = FlightDataBuffer("TEST-001", capacity=16)
+        for i in range(5):
+            buffer.append(1_768_816_800_000_000_000 + i, {
+                'altitude': 5000.004, 'speed': 650.0, 'heading': 180.0, 'latitude': 37.1234567,
+                'longitude': 127.0, 'fuel_level': 75.0, 'engine_temp': 450.0
+            })
+        columns = buffer.snapshot().to_columns()
+        assert not columns['altitude'].flags.writeable
+
+        normalized, counts = self.processor.process_columns(columns)
+
+        assert normalized['altitude'].tolist() == [5000.0] * 5
+        assert normalized['latitude'].tolist() == [37.123457] * 5
+        assert columns['altitude'].tolist() == [5000.004] * 5
+        assert sum(counts.values()) == 0
+
     def test_get_processed_count(self):
         """처리 카운트 조회 테스트"""
         self.processor.normalize_data(self.valid_data)
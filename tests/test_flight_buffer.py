@@ -0,0 +1,246 @@
+"""
+flight_buffer 모듈 테스트
+"""
+
+import pytest
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.flight_buffer import (
+    SENSOR_FIELDS, FlightDataBuffer, columns_to_records, iso_to_ns, ns_to_iso,
+    serialize_record, to_epoch_ns
+)
+
+
+def make_columns(start, count):
+    """테스트용 컬럼 생성"""
+    values = np.arange(start, start + count, dtype=np.float64)
+    return {field: values.copy() for field in SENSOR_FIELDS}
+
+
+class TestFlightDataBuffer:
+    """FlightDataBuffer 테스트 클래스"""
+    
+    def test_initialization(self):
+        """초기화 테스트"""
+        buffer = FlightDataBuffer("TEST-001", capacity=10)
+        assert len(buffer) == 0
+        assert buffer.capacity == 10
+    
+    def test_invalid_capacity(self):
+        """잘못된 용량 테스트"""
+        with pytest.raises(ValueError):
+            FlightDataBuffer("TEST-001", capacity=0)
+    
+    def test_append_and_evict_oldest(self):
+        """용량 초과 시 오래된 데이터 제거 테스트"""
+        buffer = FlightDataBuffer("TEST-001", capacity=3)
+        for i in range(5):
+            buffer.append(i, {field: float(i) for field in SENSOR_FIELDS})
+        
+        columns = buffer.to_columns()
+        assert len(buffer) == 3
+        assert buffer.total_appended == 5
+        assert columns['timestamp'].tolist() == [2, 3, 4]
+        assert columns['altitude'].tolist() == [2.0, 3.0, 4.0]
+    
+    def test_extend_wraps_around(self):
+        """컬럼 단위 추가 시 순환 테스트"""
+        buffer = FlightDataBuffer("TEST-001", capacity=4)
+        buffer.extend(np.arange(3), make_columns(0, 3))
+        buffer.extend(np.arange(3, 6), make_columns(3, 3))
+        
+        columns = buffer.to_columns()
+        assert columns['timestamp'].tolist() == [2, 3, 4, 5]
+        assert columns['speed'].tolist() == [2.0, 3.0, 4.0, 5.0]
+    
+    def test_extend_larger_than_capacity(self):
+        """용량보다 큰 배치 추가 테스트"""
+        buffer = FlightDataBuffer("TEST-001", capacity=4)
+        buffer.append(100, {field: 100.0 for field in SENSOR_FIELDS})
+        buffer.extend(np.arange(10), make_columns(0, 10))
+        
+        assert len(buffer) == 4
+        assert buffer.to_columns()['timestamp'].tolist() == [6, 7, 8, 9]
+    
+    def test_memory_is_bounded(self):
+        """메모리 사용량 상한 테스트"""
+        buffer = FlightDataBuffer("TEST-001", capacity=100, chunk_size=16)
+        row_bytes = 8 * (len(SENSOR_FIELDS) + 1)
+        for start in range(0, 1000, 7):
+            buffer.extend(np.arange(start, start + 7), make_columns(start, 7))
+            assert buffer.nbytes <= (100 + 2 * 16) * row_bytes
+        assert len(buffer) == 100
+    
+    def test_append_across_chunks(self):
+        """청크 경계를 넘는 추가와 제거 테스트"""
+        buffer = FlightDataBuffer("TEST-001", capacity=10, chunk_size=4)
+        for i in range(23):
+            buffer.append(i, {field: float(i) for field in SENSOR_FIELDS})
+        
+        assert buffer.to_columns()['timestamp'].tolist() == list(range(13, 23))
+        assert buffer.oldest_sequence == 13
+    
+    def test_to_records(self):
+        """레코드 변환 테스트"""
+        buffer = FlightDataBuffer("TEST-001", capacity=10)
+        timestamp_ns = iso_to_ns("2026-01-19T10:00:00+00:00")
+        buffer.append(timestamp_ns, {field: 1.5 for field in SENSOR_FIELDS})
+        
+        records = buffer.to_records()
+        assert records[0]['timestamp'] == timestamp_ns
+        assert records[0]['aircraft_id'] == "TEST-001"
+        assert records[0]['fuel_level'] == 1.5
+    
+    def test_to_columns_since(self):
+        """순번 이후 레코드 조회 테스트"""
+        buffer = FlightDataBuffer("TEST-001", capacity=4)
+        buffer.extend(np.arange(6), make_columns(0, 6))
+        
+        assert buffer.oldest_sequence == 2
+        assert buffer.to_columns(since=4)['timestamp'].tolist() == [4, 5]
+        assert buffer.to_columns(since=0)['timestamp'].tolist() == [2, 3, 4, 5]
+        assert buffer.to_columns(since=6)['timestamp'].tolist() == []
+        
+        snapshot = buffer.snapshot()
+        assert snapshot.to_columns(since=3, until=5)['timestamp'].tolist() == [3, 4]
+        assert snapshot.to_columns(until=3)['timestamp'].tolist() == [2]
+        assert snapshot.to_columns(since=5, until=4)['timestamp'].tolist() == []
+    
+    def test_time_range(self):
+        """시간 구간 조회 테스트 (순환된 버퍼 포함)"""
+        buffer = FlightDataBuffer("TEST-001", capacity=5)
+        buffer.extend(np.arange(0, 80, 10), make_columns(0, 8))  # 30 ~ 70 만 남음
+        
+        assert buffer.time_range(40, 60)['timestamp'].tolist() == [40, 50]
+        assert buffer.time_range(35, None)['timestamp'].tolist() == [40, 50, 60, 70]
+        assert buffer.time_range(None, 45)['altitude'].tolist() == [3.0, 4.0]
+        assert buffer.time_range(100, 200)['timestamp'].tolist() == []
+    
+    def test_snapshot_is_immutable(self):
+        """스냅샷 불변성 테스트 (이후 추가, 제거, 초기화와 무관)"""
+        buffer = FlightDataBuffer("TEST-001", capacity=6, chunk_size=4)
+        buffer.extend(np.arange(5), make_columns(0, 5))
+        snapshot = buffer.snapshot()
+        
+        buffer.extend(np.arange(5, 20), make_columns(5, 15))
+        buffer.clear()
+        
+        assert len(snapshot) == 5
+        assert snapshot.total_appended == 5
+        assert snapshot.to_columns()['timestamp'].tolist() == [0, 1, 2, 3, 4]
+        assert snapshot.to_columns()['altitude'].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    
+    def test_snapshot_is_constant_time(self):
+        """스냅샷이 복사하지 않는지 테스트"""
+        buffer = FlightDataBuffer("TEST-001", capacity=1000)
+        buffer.extend(np.arange(1000), make_columns(0, 1000))
+        
+        assert buffer.snapshot() is buffer.snapshot()
+        buffer.append(1000, {field: 0.0 for field in SENSOR_FIELDS})
+        assert buffer.snapshot().total_appended == 1001
+    
+    def test_tail(self):
+        """끝부분 조회 테스트"""
+        buffer = FlightDataBuffer("TEST-001", capacity=10, chunk_size=4)
+        buffer.extend(np.arange(12), make_columns(0, 12))
+        
+        assert buffer.tail(3)['timestamp'].tolist() == [9, 10, 11]
+        tail = buffer.tail(2)
+        assert tail['timestamp'].tolist() == [10, 11]
+        assert not tail['timestamp'].flags.writeable  # 한 청크 안이면 읽기 전용 뷰
+        assert buffer.tail(0)['timestamp'].tolist() == []
+        assert buffer.tail(100)['timestamp'].tolist() == list(range(2, 12))
+        assert [r['timestamp'] for r in buffer.to_records(limit=2)] == [10, 11]
+    
+    def test_concurrent_writers_and_readers(self):
+        """동시 쓰기와 읽기 테스트"""
+        import threading
+        
+        buffer = FlightDataBuffer("TEST-001", capacity=500, chunk_size=32)
+        errors = []
+        
+        def write(offset):
+            for i in range(200):
+                buffer.append(offset + i, {field: float(offset + i) for field in SENSOR_FIELDS})
+        
+        def read():
+            for _ in range(200):
+                columns = buffer.snapshot().to_columns()
+                if not np.array_equal(columns['timestamp'].astype(np.float64), columns['altitude']):
+                    errors.append(columns)
+        
+        threads = [threading.Thread(target=write, args=(k * 1000,)) for k in range(4)]
+        threads += [threading.Thread(target=read) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert not errors
+        assert buffer.total_appended == 800
+        assert len(buffer) == 500
+    
+    def test_clear(self):
+        """버퍼 초기화 테스트"""
+        buffer = FlightDataBuffer("TEST-001", capacity=10)
+        buffer.extend(np.arange(5), make_columns(0, 5))
+        buffer.clear()
+        assert len(buffer) == 0
+        assert buffer.to_records() == []
+
+
+class TestTimestampConversion:
+    """타임스탬프 변환 테스트 클래스"""
+    
+    def test_round_trip(self):
+        """ISO 문자열 왕복 변환 테스트"""
+        iso = "2026-01-19T10:00:00.123456+00:00"
+        assert ns_to_iso(iso_to_ns(iso)) == iso
+    
+    def test_naive_and_z_suffix_are_utc(self):
+        """시간대 없는 문자열과 Z 접미사 테스트"""
+        assert iso_to_ns("2026-01-19T10:00:00") == iso_to_ns("2026-01-19T10:00:00Z")
+    
+    def test_to_epoch_ns(self):
+        """타임스탬프 정규화 테스트"""
+        from datetime import datetime, timezone
+        
+        expected = iso_to_ns("2026-01-19T10:00:00")
+        assert to_epoch_ns(expected) == expected
+        assert to_epoch_ns(np.int64(expected)) == expected
+        assert to_epoch_ns("2026-01-19T10:00:00") == expected
+        assert to_epoch_ns(datetime(2026, 1, 19, 10, tzinfo=timezone.utc)) == expected
+        with pytest.raises(TypeError):
+            to_epoch_ns(None)
+    
+    def test_serialize_record(self):
+        """직렬화 변환 테스트"""
+        record = {'timestamp': iso_to_ns("2026-01-19T10:00:00"), 'altitude': 1.0}
+        
+        serialized = serialize_record(record)
+        assert serialized['timestamp'] == "2026-01-19T10:00:00+00:00"
+        assert isinstance(record['timestamp'], int)  # 원본은 변경되지 않음
+        assert serialize_record({'timestamp': "x"}) == {'timestamp': "x"}
+    
+    def test_columns_to_records_iso(self):
+        """ISO 타임스탬프 변환 옵션 테스트"""
+        columns = make_columns(0, 1)
+        columns['timestamp'] = np.array([iso_to_ns("2026-01-19T10:00:00")])
+        records = columns_to_records(columns, "TEST-001", iso_timestamps=True)
+        assert records[0]['timestamp'] == "2026-01-19T10:00:00+00:00"
+    
+    def test_columns_to_records_limit(self):
+        """마지막 N개 변환 테스트"""
+        columns = make_columns(0, 5)
+        columns['timestamp'] = np.arange(5, dtype=np.int64)
+        records = columns_to_records(columns, "TEST-001", limit=2)
+        assert [r['altitude'] for r in records] == [3.0, 4.0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
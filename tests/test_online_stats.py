@@ -0,0 +1,129 @@
+"""
+online_stats 모듈 테스트
+"""
+
+import pytest
+import sys
+import os
+import statistics
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.online_stats import OnlineStats, QuantileSketch, merge_all
+
+
+class TestOnlineStats:
+    """OnlineStats 테스트 클래스"""
+    
+    def test_empty(self):
+        """빈 누적기 테스트"""
+        accumulator = OnlineStats()
+        assert accumulator.to_dict() == {}
+        assert np.isnan(accumulator.stdev)
+    
+    def test_per_record_matches_statistics_module(self):
+        """레코드 단위 누적 결과 테스트"""
+        values = [3.5, 1.25, 9.0, 4.75, 2.0, 7.5]
+        accumulator = OnlineStats()
+        for value in values:
+            accumulator.update(value)
+        
+        stats = accumulator.to_dict()
+        assert stats['count'] == 6
+        assert stats['mean'] == pytest.approx(statistics.mean(values))
+        assert stats['median'] == statistics.median(values)
+        assert stats['stdev'] == pytest.approx(statistics.stdev(values))
+        assert stats['min'] == 1.25
+        assert stats['max'] == 9.0
+    
+    def test_chunks_and_records_agree(self):
+        """레코드 단위와 청크 단위 누적 일치 테스트"""
+        values = np.random.default_rng(4).normal(500, 50, 1000)
+        by_record = OnlineStats(sketch_size=1000)
+        for value in values:
+            by_record.update(value)
+        by_chunk = OnlineStats(sketch_size=1000)
+        for chunk in np.array_split(values, 7):
+            by_chunk.update_many(chunk)
+        
+        for key, value in by_record.to_dict().items():
+            assert by_chunk.to_dict()[key] == pytest.approx(value, rel=1e-12)
+    
+    def test_merge_is_exact(self):
+        """샤드별 누적기 병합 테스트"""
+        values = np.random.default_rng(5).uniform(0, 1000, 3000)
+        shards = [OnlineStats(sketch_size=3000) for _ in range(3)]
+        for shard, chunk in zip(shards, np.array_split(values, 3)):
+            shard.update_many(chunk)
+        
+        merged = merge_all(shards, sketch_size=3000)
+        
+        assert merged.count == 3000
+        assert merged.mean == pytest.approx(values.mean(), rel=1e-12)
+        assert merged.stdev == pytest.approx(values.std(ddof=1), rel=1e-12)
+        assert merged.min == values.min()
+        assert merged.max == values.max()
+        assert merged.median == pytest.approx(np.median(values))
+    
+    def test_merge_empty(self):
+        """빈 누적기 병합 테스트"""
+        accumulator = OnlineStats()
+        accumulator.update_many([1.0, 2.0])
+        accumulator.merge(OnlineStats())
+        assert accumulator.count == 2
+        assert accumulator.mean == 1.5
+
+
+class TestQuantileSketch:
+    """QuantileSketch 테스트 클래스"""
+    
+    def test_exact_until_capacity(self):
+        """용량 이하에서 정확한지 테스트"""
+        sketch = QuantileSketch(k=100)
+        sketch.update_many(np.arange(100, dtype=float))
+        assert sketch.is_exact
+        assert sketch.quantile(0.5) == 49.5
+    
+    def test_bounded_memory_and_accuracy(self):
+        """압축 후 메모리 상한과 순위 오차 테스트"""
+        values = np.random.default_rng(6).permutation(200_000).astype(float)
+        sketch = QuantileSketch(k=200)
+        for chunk in np.array_split(values, 50):
+            sketch.update_many(chunk)
+        
+        assert not sketch.is_exact
+        assert sketch.retained < 2000
+        for q in (0.1, 0.5, 0.9, 0.99):
+            assert abs(sketch.quantile(q) / len(values) - q) < 0.02
+    
+    def test_merge_accuracy(self):
+        """병합한 스케치의 순위 오차 테스트"""
+        values = np.random.default_rng(7).permutation(100_000).astype(float)
+        sketches = []
+        for chunk in np.array_split(values, 8):
+            sketch = QuantileSketch(k=200)
+            for value in chunk[:1000]:
+                sketch.update(value)  # 레코드 단위와 청크 단위 혼합
+            sketch.update_many(chunk[1000:])
+            sketches.append(sketch)
+        
+        merged = sketches[0]
+        for sketch in sketches[1:]:
+            merged.merge(sketch)
+        
+        assert merged.count == len(values)
+        assert abs(merged.quantile(0.5) / len(values) - 0.5) < 0.02
+    
+    def test_invalid_arguments(self):
+        """잘못된 인자 테스트"""
+        with pytest.raises(ValueError):
+            QuantileSketch(k=1)
+        with pytest.raises(ValueError):
+            QuantileSketch().quantile(1.5)
+        assert np.isnan(QuantileSketch().quantile(0.5))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
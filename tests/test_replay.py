@@ -0,0 +1,212 @@
+"""
+replay 모듈 테스트
+"""
+
+import pytest
+import sys
+import os
+import csv
+import json
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.flight_buffer import iso_to_ns
+from src.replay import FlightLogReplayer, iter_csv, iter_flight_log, iter_json_array
+from src.storage import JsonLinesWriter
+
+
+START_NS = iso_to_ns("2026-01-19T10:00:00")
+
+
+def make_records(count, interval_s=1.0):
+    """테스트용 레코드 생성 (interval_s 초 간격)"""
+    records = []
+    for i in range(count):
+        record = {
+            'timestamp': START_NS + int(i * interval_s * 1e9),
+            'aircraft_id': 'TEST-001',
+            'altitude': 5000.0,
+            'speed': 650.0,
+            'heading': 180.0,
+            'latitude': 37.5,
+            'longitude': 127.0,
+            'fuel_level': 75.0 - i,
+            'engine_temp': 450.0
+        }
+        records.append(record)
+    return records
+
+
+class FakeClock:
+    """시험용 시계 (sleep 호출 시에만 시간이 흐름)"""
+    
+    def __init__(self):
+        self.now = 100.0
+        self.slept = 0.0
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.now += seconds
+        self.slept += seconds
+
+
+class TestLogReaders:
+    """로그 읽기 테스트 클래스"""
+    
+    def test_iter_json_array_small_reads(self, tmp_path):
+        """작은 읽기 단위로 JSON 배열 읽기 테스트"""
+        path = tmp_path / "log.json"
+        records = make_records(20)
+        path.write_text(json.dumps(records, indent=2))
+        
+        assert list(iter_json_array(str(path), read_size=7)) == records
+    
+    def test_iter_json_array_empty(self, tmp_path):
+        """빈 배열 테스트"""
+        path = tmp_path / "log.json"
+        path.write_text(" [ ] ")
+        assert list(iter_json_array(str(path))) == []
+    
+    def test_iter_json_array_truncated(self, tmp_path):
+        """잘린 JSON 배열 테스트"""
+        path = tmp_path / "log.json"
+        path.write_text('[{"a": 1}, {"a": ')
+        
+        records = iter_json_array(str(path))
+        assert next(records) == {'a': 1}
+        with pytest.raises(ValueError):
+            next(records)
+    
+    def test_iter_json_array_not_array(self, tmp_path):
+        """배열이 아닌 JSON 테스트"""
+        path = tmp_path / "log.json"
+        path.write_text('{"a": 1}')
+        with pytest.raises(ValueError):
+            list(iter_json_array(str(path)))
+    
+    def test_iter_csv(self, tmp_path):
+        """CSV 읽기 테스트"""
+        path = tmp_path / "log.csv"
+        records = make_records(3)
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(records[0]))
+            writer.writeheader()
+            writer.writerows(records)
+        
+        assert list(iter_csv(str(path))) == records
+    
+    def test_iter_flight_log_dispatch(self, tmp_path):
+        """확장자별 읽기 테스트"""
+        records = make_records(3)
+        path = str(tmp_path / "log.jsonl")
+        writer = JsonLinesWriter(path)
+        writer.write_records(records)
+        writer.close()
+        
+        assert list(iter_flight_log(path)) == records
+        with pytest.raises(ValueError):
+            iter_flight_log(str(tmp_path / "log.txt"))
+
+
+class TestFlightLogReplayer:
+    """FlightLogReplayer 테스트 클래스"""
+    
+    def test_replay_as_fast_as_possible(self):
+        """가능한 빨리 재생 테스트"""
+        clock = FakeClock()
+        replayer = FlightLogReplayer(speed=None, chunk_size=4, clock=clock, sleep=clock.sleep)
+        
+        chunks = []
+        stats = replayer.replay(make_records(10), on_chunk=chunks.append)
+        
+        assert stats.records_read == 10
+        assert stats.records_processed == 10
+        assert clock.slept == 0
+        assert [len(c) for c in chunks] == [4, 4, 2]
+    
+    def test_replay_real_time(self):
+        """실시간 재생 테스트"""
+        clock = FakeClock()
+        replayer = FlightLogReplayer(speed=1.0, clock=clock, sleep=clock.sleep)
+        
+        stats = replayer.replay(make_records(5, interval_s=2.0))
+        
+        assert clock.slept == pytest.approx(8.0)
+        assert stats.elapsed_seconds == pytest.approx(8.0)
+        assert stats.records_per_second == pytest.approx(5 / 8.0)
+    
+    def test_replay_speed_multiplier(self):
+        """배속 재생 테스트"""
+        clock = FakeClock()
+        replayer = FlightLogReplayer(speed=4.0, clock=clock, sleep=clock.sleep)
+        
+        replayer.replay(make_records(5, interval_s=2.0))
+        assert clock.slept == pytest.approx(2.0)
+    
+    def test_replay_counts_rejections_and_anomalies(self):
+        """거부 레코드와 이상 탐지 집계 테스트"""
+        records = make_records(3)
+        records[1]['altitude'] = 99999.0
+        records[2]['fuel_level'] = 10.0
+        
+        stats = FlightLogReplayer(speed=None).replay(records)
+        summary = stats.to_dict()
+        
+        assert summary['records_processed'] == 2
+        assert summary['records_rejected'] == 1
+        assert summary['anomaly_count'] == 1
+        assert set(summary['stage_lag_seconds']) == {'ingest', 'process', 'analyze'}
+    
+    def test_replay_paced_rejects_bad_timestamps(self):
+        """배속 재생 중 시각이 없거나 잘못된 레코드 거부 테스트"""
+        clock = FakeClock()
+        records = make_records(4, interval_s=2.0)
+        records[1]['timestamp'] = "not-a-timestamp"
+        del records[2]['timestamp']
+        
+        stats = FlightLogReplayer(speed=1.0, clock=clock, sleep=clock.sleep).replay(records)
+        summary = stats.to_dict()
+        
+        assert summary['records_read'] == 4
+        assert summary['records_processed'] == 2
+        assert summary['records_rejected'] == 2
+        assert clock.slept == pytest.approx(6.0)
+    
+    def test_replay_streams_source(self):
+        """입력을 한 번에 읽지 않는지 테스트"""
+        consumed = []
+        
+        def source():
+            for record in make_records(10):
+                consumed.append(record)
+                yield record
+        
+        def on_chunk(chunk):
+            # 청크 처리 시점에는 아직 다음 청크를 읽지 않음
+            assert len(consumed) <= chunk_count[0] * 3 + 3
+            chunk_count[0] += 1
+        
+        chunk_count = [0]
+        FlightLogReplayer(speed=None, chunk_size=3).replay(source(), on_chunk=on_chunk)
+        assert chunk_count[0] == 4
+    
+    def test_replay_file(self, tmp_path):
+        """파일 재생 테스트"""
+        path = tmp_path / "log.json"
+        path.write_text(json.dumps(make_records(5)))
+        
+        stats = FlightLogReplayer(speed=0).replay(str(path))
+        assert stats.records_processed == 5
+    
+    def test_invalid_arguments(self):
+        """잘못된 인자 테스트"""
+        with pytest.raises(ValueError):
+            FlightLogReplayer(chunk_size=0)
+        with pytest.raises(ValueError):
+            FlightLogReplayer(speed=-1.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
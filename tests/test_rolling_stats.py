@@ -0,0 +1,144 @@
+"""
+rolling_stats 모듈 테스트
+"""
+
+import pytest
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.rolling_stats import RollingStats, SlidingWindow
+
+SECOND = 1_000_000_000
+
+
+def brute_force(samples, end_ns, window_ns, field_index):
+    """윈도우 안의 값으로 직접 계산한 통계"""
+    values = np.array([v[field_index] for t, v in samples if end_ns - window_ns < t <= end_ns])
+    stats = {'count': len(values), 'mean': values.mean(), 'min': values.min(), 'max': values.max()}
+    if len(values) > 1:
+        stats['stdev'] = values.std(ddof=1)
+    return stats
+
+
+class TestSlidingWindow:
+    """SlidingWindow 테스트 클래스"""
+    
+    def test_matches_brute_force(self):
+        """윈도우 통계가 직접 계산과 일치하는지 테스트"""
+        rng = np.random.default_rng(10)
+        window = SlidingWindow(30 * SECOND, ('altitude', 'speed'))
+        samples = []
+        timestamp = 0
+        for _ in range(500):
+            timestamp += int(rng.integers(1, 3)) * SECOND
+            values = (float(rng.normal(9000, 500)), float(rng.uniform(700, 900)))
+            samples.append((timestamp, values))
+            window.add(timestamp, values)
+            
+            for i, field in enumerate(('altitude', 'speed')):
+                expected = brute_force(samples, timestamp, 30 * SECOND, i)
+                actual = window.stats(field)
+                assert actual.keys() == expected.keys()
+                for key, value in expected.items():
+                    assert actual[key] == pytest.approx(value, rel=1e-9)
+    
+    def test_expire_to_empty(self):
+        """모든 샘플 만료 테스트"""
+        window = SlidingWindow(10 * SECOND, ('altitude',))
+        window.add(0, (100.0,))
+        window.add(SECOND, (300.0,))
+        
+        window.expire(11 * SECOND)
+        assert window.stats('altitude') == {}
+        
+        window.add(20 * SECOND, (50.0,))
+        assert window.stats('altitude') == {'count': 1, 'mean': 50.0, 'min': 50.0, 'max': 50.0}
+
+
+class TestRollingStats:
+    """RollingStats 테스트 클래스"""
+    
+    def test_windows_per_aircraft(self):
+        """항공기별, 윈도우별 통계 테스트"""
+        rolling = RollingStats(fields=('altitude',))
+        for second in range(600):
+            rolling.update('A', second * SECOND, {'altitude': float(second)})
+        rolling.update('B', 0, {'altitude': 1.0})
+        
+        assert rolling.get('A', '1m', 'altitude')['count'] == 60
+        assert rolling.get('A', '1m', 'altitude')['min'] == 540.0
+        assert rolling.get('A', '5m', 'altitude')['mean'] == pytest.approx(449.5)
+        assert rolling.get('A', '1h', 'altitude')['count'] == 600
+        assert rolling.get('B', '1h', 'altitude')['count'] == 1
+        assert rolling.get('C', '1m', 'altitude') == {}
+        assert set(rolling.summary('A')) == {'1m', '5m', '1h'}
+        
+        with pytest.raises(KeyError):
+            rolling.get('A', '2m', 'altitude')
+    
+    def test_late_data_within_tolerance(self):
+        """허용 지연 안의 순서 뒤바뀐 샘플 반영 테스트"""
+        rng = np.random.default_rng(11)
+        timestamps = np.arange(300) * SECOND
+        # 최대 4초까지 뒤섞어 도착
+        arrival = np.argsort(timestamps + rng.integers(0, 5, 300) * SECOND, kind='stable')
+        
+        rolling = RollingStats({'1m': 60}, fields=('speed',), allowed_lateness_s=5)
+        samples = []
+        for i in arrival:
+            value = float(i) * 1.5
+            samples.append((int(timestamps[i]), (value,)))
+            assert rolling.update('A', int(timestamps[i]), {'speed': value})
+        rolling.advance(int(timestamps[-1]) + 5 * SECOND)
+        
+        assert rolling.late_dropped == 0
+        expected = brute_force(samples, int(timestamps[-1]), 60 * SECOND, 0)
+        actual = rolling.get('A', '1m', 'speed')
+        for key, value in expected.items():
+            assert actual[key] == pytest.approx(value)
+    
+    def test_too_late_data_dropped(self):
+        """허용 지연보다 늦은 샘플 제외 테스트"""
+        rolling = RollingStats({'1m': 60}, fields=('speed',), allowed_lateness_s=2)
+        rolling.update('A', 10 * SECOND, {'speed': 1.0})
+        
+        assert rolling.update('A', 9 * SECOND, {'speed': 2.0})
+        assert not rolling.update('A', 7 * SECOND, {'speed': 3.0})
+        assert rolling.late_dropped == 1
+    
+    def test_advance_expires_idle_aircraft(self):
+        """샘플이 끊긴 항공기 만료 테스트"""
+        rolling = RollingStats({'1m': 60}, fields=('speed',))
+        rolling.update_record({'aircraft_id': 'A', 'timestamp': '2026-01-19T10:00:00', 'speed': 500.0})
+        
+        rolling.advance('2026-01-19T10:00:30')
+        assert rolling.get('A', '1m', 'speed')['count'] == 1
+        rolling.advance('2026-01-19T10:01:00')
+        assert rolling.get('A', '1m', 'speed') == {}
+    
+    def test_update_columns(self):
+        """컬럼 배치 반영 테스트"""
+        rolling = RollingStats({'1m': 60}, fields=('altitude', 'speed'))
+        columns = {
+            'timestamp': np.arange(5, dtype=np.int64) * SECOND,
+            'altitude': np.array([1.0, 2.0, 3.0, 4.0, 5.0]),
+            'speed': np.full(5, 500.0)
+        }
+        
+        assert rolling.update_columns('A', columns) == 5
+        assert rolling.get('A', '1m', 'altitude')['stdev'] == pytest.approx(np.std([1, 2, 3, 4, 5], ddof=1))
+    
+    def test_invalid_arguments(self):
+        """잘못된 인자 테스트"""
+        with pytest.raises(ValueError):
+            RollingStats({'1m': 0})
+        with pytest.raises(ValueError):
+            RollingStats(allowed_lateness_s=-1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
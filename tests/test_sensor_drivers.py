@@ -0,0 +1,112 @@
+"""
+sensor_drivers 모듈 테스트
+"""
+
+import pytest
+import sys
+import os
+import asyncio
+import math
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.sensor_drivers import (
+    AsyncSensorReader, SensorDriver, SimulatedSensorDriver, create_simulated_drivers
+)
+
+
+class FailingDriver(SensorDriver):
+    """항상 실패하는 드라이버"""
+    
+    async def read(self) -> float:
+        raise IOError("bus error")
+
+
+class InFlightDriver(SensorDriver):
+    """동시에 진행 중인 읽기 수를 기록하는 드라이버"""
+    
+    def __init__(self, tracker: dict):
+        self.tracker = tracker
+    
+    async def read(self) -> float:
+        self.tracker['current'] += 1
+        self.tracker['max'] = max(self.tracker['max'], self.tracker['current'])
+        await asyncio.sleep(0.01)
+        self.tracker['current'] -= 1
+        return 0.0
+
+
+class TestSimulatedSensorDriver:
+    """SimulatedSensorDriver 테스트 클래스"""
+    
+    def test_read_range(self):
+        """측정값 범위 테스트"""
+        driver = SimulatedSensorDriver(10.0, 20.0)
+        values = [asyncio.run(driver.read()) for _ in range(20)]
+        assert all(10.0 <= v <= 20.0 for v in values)
+    
+    def test_seed_is_reproducible(self):
+        """시드 재현성 테스트"""
+        first = SimulatedSensorDriver(0.0, 1.0, seed=42)
+        second = SimulatedSensorDriver(0.0, 1.0, seed=42)
+        assert asyncio.run(first.read()) == asyncio.run(second.read())
+
+
+class TestAsyncSensorReader:
+    """AsyncSensorReader 테스트 클래스"""
+    
+    def test_read_all(self):
+        """전체 센서 읽기 테스트"""
+        reader = AsyncSensorReader(create_simulated_drivers({'altitude': (0, 10), 'speed': (5, 6)}))
+        values = reader.read_all_sync()
+        
+        assert set(values) == {'altitude', 'speed'}
+        assert 5 <= values['speed'] <= 6
+    
+    def test_reads_are_concurrent(self):
+        """동시 읽기 테스트 (모든 센서 읽기가 겹쳐서 진행)"""
+        tracker = {'current': 0, 'max': 0}
+        reader = AsyncSensorReader({f"sensor_{i}": InFlightDriver(tracker) for i in range(7)})
+        
+        reader.read_all_sync()
+        
+        assert tracker['max'] == 7
+        assert tracker['current'] == 0
+    
+    def test_driver_requires_read(self):
+        """read 를 구현하지 않은 드라이버 생성 불가 테스트"""
+        with pytest.raises(TypeError):
+            SensorDriver()
+    
+    def test_coroutine_function_driver(self):
+        """코루틴 함수 드라이버 테스트"""
+        async def read_constant():
+            return 42
+        
+        reader = AsyncSensorReader({'altitude': read_constant})
+        assert reader.read_all_sync() == {'altitude': 42.0}
+    
+    def test_timeout_returns_nan(self):
+        """센서별 제한 시간 초과 테스트"""
+        drivers = {
+            'fast': SimulatedSensorDriver(1, 1),
+            'slow': SimulatedSensorDriver(1, 1, latency=1.0),
+        }
+        reader = AsyncSensorReader(drivers, timeout=1.0, timeouts={'slow': 0.05})
+        
+        values = reader.read_all_sync()
+        assert values['fast'] == 1
+        assert math.isnan(values['slow'])
+        assert reader.timeout_counts == {'fast': 0, 'slow': 1}
+    
+    def test_driver_error_returns_nan(self):
+        """드라이버 오류 테스트"""
+        reader = AsyncSensorReader({'altitude': FailingDriver()})
+        
+        values = reader.read_all_sync()
+        assert math.isnan(values['altitude'])
+        assert reader.error_counts['altitude'] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,142 @@
+"""
+simulator 모듈 테스트
+"""
+
+import pytest
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.analyzer import FlightAnalyzer, haversine_km
+from src.data_processor import DataProcessor
+from src.flight_buffer import SENSOR_FIELDS
+from src.simulator import (
+    PHASE_CLIMB, PHASE_CRUISE, PHASE_DESCENT, TrajectorySimulator, destination_point
+)
+
+
+START_NS = 1768816800 * 10**9
+
+
+class TestTrajectorySimulator:
+    """TrajectorySimulator 테스트 클래스"""
+    
+    def test_initialization(self):
+        """초기화 테스트"""
+        simulator = TrajectorySimulator(10, seed=1, start_ns=START_NS)
+        assert simulator.aircraft_ids[0] == "SIM-00000"
+        assert len(simulator.aircraft_ids) == 10
+    
+    def test_invalid_arguments(self):
+        """잘못된 인자 테스트"""
+        with pytest.raises(ValueError):
+            TrajectorySimulator(0)
+        with pytest.raises(ValueError):
+            TrajectorySimulator(1, sample_interval_s=0)
+    
+    def test_seed_is_reproducible(self):
+        """같은 시드의 재현성 테스트"""
+        first = TrajectorySimulator(50, seed=7, start_ns=START_NS).generate_batch(20)
+        second = TrajectorySimulator(50, seed=7, start_ns=START_NS).generate_batch(20)
+        other = TrajectorySimulator(50, seed=8, start_ns=START_NS).generate_batch(20)
+        
+        for name in first:
+            assert np.array_equal(first[name], second[name])
+        assert not np.array_equal(first['altitude'], other['altitude'])
+    
+    def test_generate_batch_layout(self):
+        """배치 배열 배치 순서 테스트"""
+        simulator = TrajectorySimulator(3, seed=1, sample_interval_s=2.0, start_ns=START_NS)
+        columns = simulator.generate_batch(4)
+        
+        assert len(columns['timestamp']) == 12
+        assert columns['aircraft_index'].tolist() == [0, 1, 2] * 4
+        assert np.all(np.diff(columns['timestamp']) >= 0)
+        assert columns['timestamp'][3] - columns['timestamp'][0] == 2 * 10**9
+    
+    def test_samples_pass_validation(self):
+        """생성된 샘플이 유효성 검증을 통과하는지 테스트"""
+        simulator = TrajectorySimulator(100, seed=3, sample_interval_s=60.0, start_ns=START_NS)
+        records = simulator.to_records(simulator.generate_batch(30))
+        
+        processed = DataProcessor().process_batch(records)
+        assert len(processed) == len(records)
+    
+    def test_fuel_is_monotone_within_leg(self):
+        """구간 내 연료 단조 감소 테스트"""
+        simulator = TrajectorySimulator(200, seed=5, sample_interval_s=30.0, start_ns=START_NS)
+        steps = list(simulator.generate(200))
+        
+        fuel = np.stack([step['fuel_level'] for step in steps])
+        altitude = np.stack([step['altitude'] for step in steps])
+        refueled = np.diff(fuel, axis=0) > 0
+        # 연료 증가는 착륙 직후(고도 0)의 재급유뿐
+        assert np.all(altitude[1:][refueled] == 0)
+    
+    def test_phases_follow_climb_cruise_descent(self):
+        """단계 전환 순서 테스트"""
+        simulator = TrajectorySimulator(200, seed=9, sample_interval_s=60.0, start_ns=START_NS)
+        phases = np.stack([step['phase'] for step in simulator.generate(600)])
+        
+        transitions = set()
+        for before, after in zip(phases[:-1].ravel(), phases[1:].ravel()):
+            if before != after:
+                transitions.add((int(before), int(after)))
+        
+        assert transitions <= {
+            (PHASE_CLIMB, PHASE_CRUISE), (PHASE_CRUISE, PHASE_DESCENT), (PHASE_DESCENT, PHASE_CLIMB)
+        }
+        assert (PHASE_CLIMB, PHASE_CRUISE) in transitions
+    
+    def test_position_follows_heading_and_speed(self):
+        """위치 이동 거리 테스트"""
+        simulator = TrajectorySimulator(20, seed=11, sample_interval_s=10.0, start_ns=START_NS)
+        before = simulator.step()
+        after = simulator.step()
+        
+        analyzer = FlightAnalyzer()
+        for i in range(20):
+            start = {'latitude': before['latitude'][i], 'longitude': before['longitude'][i]}
+            end = {'latitude': after['latitude'][i], 'longitude': after['longitude'][i]}
+            expected = after['speed'][i] * 10.0 / 3600.0
+            assert analyzer.calculate_distance(start, end) == pytest.approx(expected, rel=1e-6)
+    
+    def test_to_records(self):
+        """레코드 변환 테스트"""
+        simulator = TrajectorySimulator(2, seed=1, start_ns=START_NS, aircraft_prefix="AC")
+        records = simulator.to_records(simulator.step())
+        
+        assert [r['aircraft_id'] for r in records] == ["AC-00000", "AC-00001"]
+        assert all(field in records[0] for field in SENSOR_FIELDS)
+        assert records[0]['timestamp'] == START_NS
+
+
+class TestDestinationPoint:
+    """destination_point 테스트 클래스"""
+    
+    def test_due_north(self):
+        """정북 이동 테스트"""
+        lat, lon = destination_point(np.array([0.0]), np.array([10.0]), np.array([0.0]), np.array([111.195]))
+        assert lat[0] == pytest.approx(1.0, abs=1e-4)
+        assert lon[0] == pytest.approx(10.0)
+    
+    def test_longitude_wraps(self):
+        """날짜 변경선 통과 테스트"""
+        lat, lon = destination_point(np.array([0.0]), np.array([179.9]), np.array([90.0]), np.array([50.0]))
+        assert -180.0 <= lon[0] < -179.0
+    
+    def test_round_trip_with_haversine(self):
+        """이동 거리와 haversine_km 거리가 같은지 테스트 (같은 지구 반지름 사용)"""
+        lat, lon = np.array([37.5, -10.0]), np.array([127.0, 179.5])
+        distance = np.array([850.0, 120.0])
+        
+        end_lat, end_lon = destination_point(lat, lon, np.array([45.0, 100.0]), distance)
+        
+        assert haversine_km(lat, lon, end_lat, end_lon) == pytest.approx(distance)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,211 @@
+"""
+storage 모듈 테스트
+"""
+
+import pytest
+import sys
+import os
+import json
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.flight_buffer import SENSOR_FIELDS, iso_to_ns
+from src.storage import (
+    ColumnarFile, JsonLinesWriter, convert_json_lines_to_columnar, iter_json_lines,
+    load_json_lines, open_columnar, rotated_files, write_columnar
+)
+
+
+def make_records(count, start=0):
+    """테스트용 레코드 생성"""
+    return [{'seq': i, 'aircraft_id': 'TEST-001'} for i in range(start, start + count)]
+
+
+class TestJsonLinesWriter:
+    """JsonLinesWriter 테스트 클래스"""
+    
+    def test_write_and_read(self, tmp_path):
+        """기록 및 읽기 테스트"""
+        path = str(tmp_path / "data.jsonl")
+        writer = JsonLinesWriter(path)
+        
+        assert writer.write_records(make_records(3)) == 3
+        assert writer.write_records(make_records(2, start=3)) == 2
+        writer.close()
+        
+        assert [r['seq'] for r in iter_json_lines(path)] == [0, 1, 2, 3, 4]
+    
+    def test_readable_before_close(self, tmp_path):
+        """닫기 전에도 기록 내용을 읽을 수 있는지 테스트"""
+        path = str(tmp_path / "data.jsonl")
+        writer = JsonLinesWriter(path)
+        writer.write_records(make_records(2))
+        
+        assert len(load_json_lines(path)) == 2
+        writer.close()
+    
+    def test_appends_to_existing_file(self, tmp_path):
+        """기존 파일에 이어쓰기 테스트"""
+        path = str(tmp_path / "data.jsonl")
+        for start in (0, 2):
+            writer = JsonLinesWriter(path)
+            writer.write_records(make_records(2, start=start))
+            writer.close()
+        
+        assert [r['seq'] for r in load_json_lines(path)] == [0, 1, 2, 3]
+    
+    def test_fsync_batching(self, tmp_path, monkeypatch):
+        """fsync 배치 간격 테스트"""
+        calls = []
+        monkeypatch.setattr(os, 'fsync', lambda fd: calls.append(fd))
+        
+        writer = JsonLinesWriter(str(tmp_path / "data.jsonl"), fsync_every=4)
+        writer.write_records(make_records(10))
+        assert len(calls) == 2
+        
+        writer.close()
+        assert len(calls) == 3
+    
+    def test_rotation(self, tmp_path):
+        """크기 기반 회전 테스트"""
+        path = str(tmp_path / "data.jsonl")
+        line_size = len(json.dumps(make_records(1)[0]).encode()) + 1
+        writer = JsonLinesWriter(path, max_bytes=line_size * 3, backup_count=2)
+        writer.write_records(make_records(10))
+        writer.close()
+        
+        # 가장 오래된 회전 파일은 backup_count 를 넘으면 삭제됨
+        assert rotated_files(path) == [path + ".2", path + ".1", path]
+        records = load_json_lines(path, include_rotated=True)
+        assert [r['seq'] for r in records] == [3, 4, 5, 6, 7, 8, 9]
+        for file_path in rotated_files(path):
+            assert os.path.getsize(file_path) <= line_size * 3
+
+
+class TestJsonLinesLoader:
+    """JSON Lines 로더 테스트 클래스"""
+    
+    def test_iter_is_lazy(self, tmp_path):
+        """지연 읽기 테스트"""
+        path = tmp_path / "data.jsonl"
+        path.write_text('{"seq": 0}\n{"seq": 1}\nnot json\n')
+        
+        records = iter_json_lines(str(path))
+        assert next(records) == {'seq': 0}
+        assert next(records) == {'seq': 1}
+        with pytest.raises(json.JSONDecodeError):
+            next(records)
+    
+    def test_skips_blank_lines(self, tmp_path):
+        """빈 줄 무시 테스트"""
+        path = tmp_path / "data.jsonl"
+        path.write_text('{"seq": 0}\n\n{"seq": 1}\n')
+        
+        assert len(load_json_lines(str(path))) == 2
+    
+    def test_limit(self, tmp_path):
+        """최대 레코드 수 테스트"""
+        path = str(tmp_path / "data.jsonl")
+        writer = JsonLinesWriter(path)
+        writer.write_records(make_records(5))
+        writer.close()
+        
+        assert len(load_json_lines(path, limit=2)) == 2
+
+
+def make_columns(count):
+    """테스트용 컬럼 생성"""
+    columns = {'timestamp': iso_to_ns("2026-01-19T10:00:00") + np.arange(count, dtype=np.int64) * 10**9}
+    for i, field in enumerate(SENSOR_FIELDS):
+        columns[field] = np.arange(count, dtype=np.float64) + i
+    return columns
+
+
+class TestColumnarFile:
+    """컬럼형 파일 테스트 클래스"""
+    
+    def test_round_trip(self, tmp_path):
+        """저장 후 memmap 으로 다시 열기 테스트"""
+        path = str(tmp_path / "data.fdcol")
+        columns = make_columns(100)
+        write_columnar(path, columns, "TEST-001")
+        
+        archive = open_columnar(path)
+        assert len(archive) == 100
+        assert archive.aircraft_ids == ["TEST-001"]
+        assert isinstance(archive.columns['altitude'], np.memmap)
+        for name, values in columns.items():
+            assert np.array_equal(archive.columns[name], values)
+    
+    def test_columns_are_aligned(self, tmp_path):
+        """컬럼 정렬 테스트"""
+        path = str(tmp_path / "data.fdcol")
+        write_columnar(path, make_columns(3), "TEST-001")
+        
+        archive = open_columnar(path)
+        for column in archive.columns.values():
+            assert column.offset % 64 == 0
+    
+    def test_dictionary_encoded_aircraft_ids(self, tmp_path):
+        """aircraft_id 사전 인코딩 테스트"""
+        path = str(tmp_path / "data.fdcol")
+        ids = ["B", "A", "B", "C"]
+        write_columnar(path, make_columns(4), ids)
+        
+        archive = open_columnar(path)
+        assert sorted(archive.aircraft_ids) == ["A", "B", "C"]
+        assert archive.columns['aircraft_id'].dtype == np.int32
+        assert [r['aircraft_id'] for r in archive.iter_records()] == ids
+    
+    def test_iter_record_batches(self, tmp_path):
+        """레코드 배치 생성 테스트"""
+        path = str(tmp_path / "data.fdcol")
+        write_columnar(path, make_columns(5), "TEST-001")
+        
+        batches = list(open_columnar(path).iter_record_batches(chunk_size=2))
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert batches[0][0]['timestamp'] == iso_to_ns("2026-01-19T10:00:00")
+        assert batches[2][0]['engine_temp'] == 4.0 + SENSOR_FIELDS.index('engine_temp')
+    
+    def test_empty(self, tmp_path):
+        """빈 파일 테스트"""
+        path = str(tmp_path / "data.fdcol")
+        write_columnar(path, make_columns(0), "TEST-001")
+        
+        archive = open_columnar(path)
+        assert len(archive) == 0
+        assert list(archive.iter_records()) == []
+    
+    def test_invalid_magic(self, tmp_path):
+        """잘못된 파일 형식 테스트"""
+        path = tmp_path / "data.fdcol"
+        path.write_bytes(b'[{"not": "columnar"}]')
+        
+        with pytest.raises(ValueError):
+            ColumnarFile(str(path))
+    
+    def test_convert_json_lines(self, tmp_path):
+        """JSON Lines 변환 테스트"""
+        source = str(tmp_path / "data.jsonl")
+        path = str(tmp_path / "data.fdcol")
+        records = [
+            {'timestamp': f"2026-01-19T10:00:0{i}", 'aircraft_id': f"AC-{i % 2}",
+             **{field: float(i) for field in SENSOR_FIELDS}}
+            for i in range(5)
+        ]
+        writer = JsonLinesWriter(source)
+        writer.write_records(records)
+        writer.close()
+        
+        assert convert_json_lines_to_columnar(source, path, chunk_size=2) == 5
+        
+        converted = list(open_columnar(path).iter_records())
+        assert [r['aircraft_id'] for r in converted] == [r['aircraft_id'] for r in records]
+        assert [r['speed'] for r in converted] == [r['speed'] for r in records]
+        assert converted[4]['timestamp'] == iso_to_ns("2026-01-19T10:00:04")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
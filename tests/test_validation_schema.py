@@ -0,0 +1,191 @@
+"""
+validation_schema 모듈 테스트
+"""
+
+import pickle
+import pytest
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.validation_schema import (
+    FLIGHT_DATA_SCHEMA, MISSING_FIELD, FieldSpec, ValidationSchema
+)
+
+
+def make_record(**overrides):
+    """테스트용 레코드 생성"""
+    record = {
+        "timestamp": 1768816800 * 10**9,
+        "aircraft_id": "TEST-001",
+        "altitude": 5000.0,
+        "speed": 650.0,
+        "heading": 180.0,
+        "latitude": 37.5,
+        "longitude": 127.0,
+        "fuel_level": 75.0,
+        "engine_temp": 450.0
+    }
+    record.update(overrides)
+    return record
+
+
+class TestFieldSpec:
+    """FieldSpec 테스트 클래스"""
+    
+    def test_unknown_type(self):
+        """알 수 없는 타입 테스트"""
+        with pytest.raises(ValueError):
+            FieldSpec('altitude', type='decimal')
+    
+    def test_range_requires_number(self):
+        """숫자 외 타입의 범위 지정 테스트"""
+        with pytest.raises(ValueError):
+            FieldSpec('aircraft_id', type='str', minimum=0)
+
+
+class TestValidationSchema:
+    """ValidationSchema 테스트 클래스"""
+    
+    def test_duplicate_field(self):
+        """중복 필드 테스트"""
+        with pytest.raises(ValueError):
+            ValidationSchema([FieldSpec('altitude'), FieldSpec('altitude')])
+    
+    def test_rules_follow_declaration_order(self):
+        """거부 사유 순서 테스트"""
+        assert FLIGHT_DATA_SCHEMA.rules[:3] == (MISSING_FIELD, 'timestamp', 'altitude')
+        assert 'aircraft_id' not in FLIGHT_DATA_SCHEMA.rules  # 존재 여부만 검사
+    
+    def test_check(self):
+        """레코드 단위 검증 테스트"""
+        schema = FLIGHT_DATA_SCHEMA
+        assert schema.check(make_record()) is None
+        assert schema.check(make_record(altitude=20000.0, speed=-1.0)) == 'altitude'
+        assert schema.check(make_record(timestamp="bad")) == 'timestamp'
+        assert schema.check(make_record(heading=None)) == 'heading'
+        
+        record = make_record()
+        del record['engine_temp']
+        assert schema.check(record) == MISSING_FIELD
+        assert schema.missing_field(record) == 'engine_temp'
+    
+    def test_optional_and_unbounded_fields(self):
+        """선택 필드와 범위 없는 필드 테스트"""
+        schema = ValidationSchema([
+            FieldSpec('n1', minimum=0, maximum=110),
+            FieldSpec('n2', minimum=0, maximum=110, required=False),
+            FieldSpec('flight', type='str', required=False),
+            FieldSpec('counter'),
+        ])
+        records = [
+            {'n1': 90.0, 'counter': 10**12},
+            {'n1': 90.0, 'n2': 120.0, 'counter': 1},
+            {'n1': 90.0, 'n2': 100.0, 'flight': 7, 'counter': 1},
+            {'n1': 90.0, 'n2': 100.0, 'flight': "KE001", 'counter': -5},
+        ]
+        
+        assert [schema.check(r) for r in records] == [None, 'n2', 'flight', None]
+        valid_records, counts = schema.check_records(records)
+        assert valid_records == [records[0], records[3]]
+        assert counts == {MISSING_FIELD: 0, 'n1': 0, 'n2': 1, 'flight': 1, 'counter': 0}
+    
+    def test_check_records_matches_check(self):
+        """컬럼 단위 검증과 레코드 단위 검증 결과 일치 테스트"""
+        rng = np.random.default_rng(1)
+        records = []
+        for i in range(1000):
+            record = make_record(
+                altitude=float(rng.uniform(-2000, 17000)),
+                fuel_level=float(rng.uniform(-10, 110)),
+                timestamp="2026-01-19T10:00:00" if i % 3 else 1768816800 * 10**9 + i
+            )
+            if i % 101 == 0:
+                del record['aircraft_id']
+            if i % 103 == 0:
+                record['timestamp'] = []
+            records.append(record)
+        
+        valid_records, counts = FLIGHT_DATA_SCHEMA.check_records(records)
+        
+        expected_counts = FLIGHT_DATA_SCHEMA.empty_counts()
+        for record in records:
+            rule = FLIGHT_DATA_SCHEMA.check(record)
+            if rule is not None:
+                expected_counts[rule] += 1
+        assert valid_records == [r for r in records if FLIGHT_DATA_SCHEMA.check(r) is None]
+        assert counts == expected_counts
+    
+    def test_non_finite_bounds(self):
+        """무한대, NaN 경계 테스트 (레코드 단위와 컬럼 단위 결과 일치)"""
+        schema = ValidationSchema([
+            FieldSpec('a', minimum=float('-inf'), maximum=float('inf')),
+            FieldSpec('b', maximum=float('inf')),
+            FieldSpec('c', minimum=float('inf'), required=False),
+            FieldSpec('d', maximum=float('nan'), required=False),
+        ])
+        records = [
+            {'a': 1.0, 'b': 1e308},
+            {'a': float('inf'), 'b': 1.0},
+            {'a': float('nan'), 'b': 1.0},
+            {'a': 1.0, 'b': 1.0, 'c': 1e308},
+            {'a': 1.0, 'b': 1.0, 'c': float('inf')},
+            {'a': 1.0, 'b': 1.0, 'd': 0.0},
+        ]
+        
+        assert [schema.check(r) for r in records] == [None, None, 'a', 'c', None, 'd']
+        valid_records, counts = schema.check_records(records)
+        assert valid_records == [records[0], records[1], records[4]]
+        assert counts == {MISSING_FIELD: 0, 'a': 1, 'b': 0, 'c': 1, 'd': 1}
+    
+    def test_check_columns_scales_with_fields(self):
+        """필드를 추가해도 선언만으로 검증되는지 테스트"""
+        fields = [FieldSpec(f'engine_{i}_temp', minimum=0, maximum=1000) for i in range(40)]
+        schema = ValidationSchema(fields)
+        columns = {spec.name: np.full(5, 500.0) for spec in fields}
+        columns['engine_39_temp'][2] = 1200.0
+        
+        valid, counts = schema.check_columns(columns)
+        assert valid.tolist() == [True, True, False, True, True]
+        assert counts['engine_39_temp'] == 1
+    
+    def test_empty_batch(self):
+        """빈 배치 테스트"""
+        valid_records, counts = FLIGHT_DATA_SCHEMA.check_records([])
+        assert valid_records == []
+        assert sum(counts.values()) == 0
+    
+    def test_timestamp_out_of_int64_range(self):
+        """int64 epoch ns 범위를 넘는 타임스탬프 거부 테스트 (레코드 단위와 컬럼 단위 결과 일치)"""
+        for timestamps in ([0, 2**63], [-1, 2**63], [0, -2**63 - 1], [0, "2300-01-01T00:00:00"]):
+            records = [make_record(timestamp=t) for t in timestamps]
+            
+            assert [FLIGHT_DATA_SCHEMA.check(r) for r in records] == [None, 'timestamp']
+            valid_records, counts = FLIGHT_DATA_SCHEMA.check_records(records)
+            assert valid_records == records[:1]
+            assert counts['timestamp'] == 1
+    
+    def test_pickle_and_gathered_check(self):
+        """피클한 스키마로 모은 컬럼 검증 테스트 (프로세스 풀 전달)"""
+        records = [
+            {"timestamp": 0, "aircraft_id": "A", "altitude": 100.0, "speed": 1.0, "heading": 1.0,
+             "latitude": 1.0, "longitude": 1.0, "fuel_level": 50.0, "engine_temp": 400.0},
+            {"timestamp": 0, "aircraft_id": "A", "altitude": 20000.0, "speed": 1.0, "heading": 1.0,
+             "latitude": 1.0, "longitude": 1.0, "fuel_level": 50.0, "engine_temp": 400.0},
+        ]
+        schema = pickle.loads(pickle.dumps(FLIGHT_DATA_SCHEMA))
+        
+        valid, counts = schema.check_gathered(*FLIGHT_DATA_SCHEMA.gather_records(records))
+        assert valid.tolist() == [True, False]
+        assert counts['altitude'] == 1
+        assert schema.check(records[1]) == 'altitude'
+        
+        records[0]['speed'] = 'fast'
+        assert FLIGHT_DATA_SCHEMA.gather_records(records) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])